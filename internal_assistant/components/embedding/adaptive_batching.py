@@ -0,0 +1,162 @@
+"""Length-sorted, self-tuning batching for local embedding models.
+
+Padding makes every text in a batch cost as much as the longest one, so
+``AdaptiveBatchEmbedding`` sorts each window of texts by length before
+splitting it into batches. It then adjusts the batch size from the measured
+throughput: it grows while tokens/sec keeps improving, shrinks when
+throughput drops, and halves whenever the process RSS gets close to the
+machine's memory. The tuned size is pushed down to the wrapped model's
+``embed_batch_size`` before every call, so models that split batches again
+internally (``SentenceTransformer.encode``) run at the tuned size too.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+
+import psutil
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+# Texts sorted together per call, as a multiple of the configured batch size
+SORT_WINDOW_FACTOR = 4
+# Shrink the batch when the process uses more than this share of total RAM
+_MAX_RSS_FRACTION = 0.8
+_GROW_ABOVE = 1.05
+_SHRINK_BELOW = 0.8
+
+
+def estimate_tokens(text: str, max_length: int | None = None) -> int:
+    """Cheap token estimate (~4 characters per token), capped at max_length."""
+    tokens = max(1, math.ceil(len(text) / 4))
+    return min(tokens, max_length) if max_length else tokens
+
+
+@dataclass
+class EmbeddingThroughput:
+    texts: int = 0
+    tokens: int = 0
+    seconds: float = 0.0
+
+    def record(self, texts: int, tokens: int, seconds: float) -> None:
+        self.texts += texts
+        self.tokens += tokens
+        self.seconds += seconds
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.tokens / self.seconds if self.seconds else 0.0
+
+
+class AdaptiveBatchEmbedding(BaseEmbedding):
+    """Wraps an embedding model with length-sorted, throughput-tuned batches."""
+
+    _inner: BaseEmbedding = PrivateAttr()
+    _max_length: int | None = PrivateAttr()
+    _min_batch_size: int = PrivateAttr()
+    _max_batch_size: int = PrivateAttr()
+    _batch_size: int = PrivateAttr()
+    _best_tokens_per_second: float = PrivateAttr(default=0.0)
+    _throughput: EmbeddingThroughput = PrivateAttr()
+
+    def __init__(
+        self,
+        inner: BaseEmbedding,
+        batch_size: int,
+        max_length: int | None = None,
+    ) -> None:
+        super().__init__(
+            model_name=inner.model_name,
+            embed_batch_size=batch_size * SORT_WINDOW_FACTOR,
+            callback_manager=inner.callback_manager,
+            num_workers=inner.num_workers,
+        )
+        self._inner = inner
+        self._max_length = max_length
+        self._min_batch_size = max(1, batch_size // 8)
+        self._max_batch_size = batch_size * SORT_WINDOW_FACTOR
+        self._batch_size = batch_size
+        self._throughput = EmbeddingThroughput()
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "AdaptiveBatchEmbedding"
+
+    @property
+    def inner(self) -> BaseEmbedding:
+        return self._inner
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def throughput(self) -> EmbeddingThroughput:
+        return self._throughput
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        return self._inner._get_query_embedding(query)
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        return await self._inner._aget_query_embedding(query)
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._get_text_embeddings([text])[0]
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[Embedding]:
+        # Longest first, so each batch holds texts of similar length
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        results: list[Embedding | None] = [None] * len(texts)
+
+        position = 0
+        while position < len(order):
+            batch_positions = order[position : position + self._batch_size]
+            batch = [texts[i] for i in batch_positions]
+            tokens = sum(estimate_tokens(text, self._max_length) for text in batch)
+
+            self._inner.embed_batch_size = len(batch)
+            start = time.perf_counter()
+            embeddings = self._inner._get_text_embeddings(batch)
+            elapsed = time.perf_counter() - start
+
+            for i, embedding in zip(batch_positions, embeddings, strict=True):
+                results[i] = embedding
+            self._throughput.record(len(batch), tokens, elapsed)
+            self._tune(len(batch), tokens / elapsed if elapsed else 0.0)
+            position += len(batch)
+
+        return results  # type: ignore[return-value]
+
+    def _tune(self, batch_len: int, tokens_per_second: float) -> None:
+        previous = self._batch_size
+        if _memory_pressure():
+            self._batch_size = max(self._min_batch_size, self._batch_size // 2)
+        elif batch_len < self._batch_size:
+            # Trailing partial batches say nothing about the batch size
+            return
+        elif tokens_per_second > self._best_tokens_per_second * _GROW_ABOVE:
+            self._best_tokens_per_second = tokens_per_second
+            self._batch_size = min(self._max_batch_size, self._batch_size * 2)
+        elif tokens_per_second < self._best_tokens_per_second * _SHRINK_BELOW:
+            # Re-baseline, otherwise one fast outlier would shrink us to the floor
+            self._best_tokens_per_second = tokens_per_second
+            self._batch_size = max(self._min_batch_size, self._batch_size // 2)
+
+        if self._batch_size != previous:
+            logger.debug(
+                "Embedding batch size %d -> %d (%.0f tokens/s)",
+                previous,
+                self._batch_size,
+                tokens_per_second,
+            )
+
+
+def _memory_pressure() -> bool:
+    try:
+        rss = psutil.Process().memory_info().rss
+        return rss > psutil.virtual_memory().total * _MAX_RSS_FRACTION
+    except Exception:
+        return False
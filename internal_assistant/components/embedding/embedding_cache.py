@@ -0,0 +1,218 @@
+"""Embedding cache shared by chat, chunk retrieval, the embeddings API and ingest.
+
+``CachedEmbedding`` wraps the configured embedding model. Every text is keyed
+by the embedding kind (query or text), the model name and a hash of the
+normalized text, so repeated search queries and re-ingested chunks that did
+not change skip the model. Embeddings are kept in a bounded in-memory LRU and,
+optionally, in a SQLite file under ``local_data`` that survives restarts.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from llama_index.core.base.embeddings.base import BaseEmbedding, Embedding
+from llama_index.core.bridge.pydantic import PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_CACHE_FILE = "embedding_cache.sqlite3"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize unicode and whitespace so trivially different inputs share a key."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """Bounded LRU of embeddings with an optional SQLite tier."""
+
+    def __init__(self, max_entries: int = 20000, db_path: Path | None = None) -> None:
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(kind: str, model_name: str, text: str) -> str:
+        payload = f"{kind}\0{model_name}\0{normalize_text(text)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: list[str]) -> list[Embedding | None]:
+        results: list[Embedding | None] = [None] * len(keys)
+        missing: dict[str, list[int]] = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is None:
+                    missing.setdefault(key, []).append(i)
+                    continue
+                self._memory.move_to_end(key)
+                results[i] = vector.tolist()
+                self.hits += 1
+
+            if missing and self._db is not None:
+                for key, vector in self._read_disk(list(missing)).items():
+                    self._remember(key, vector)
+                    for i in missing.pop(key):
+                        results[i] = vector.tolist()
+                        self.disk_hits += 1
+            self.misses += sum(len(positions) for positions in missing.values())
+        return results
+
+    def put_many(self, keys: list[str], embeddings: list[Embedding]) -> None:
+        vectors = [np.asarray(e, dtype=np.float32) for e in embeddings]
+        with self._lock:
+            for key, vector in zip(keys, vectors, strict=True):
+                self._remember(key, vector)
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(k, v.tobytes()) for k, v in zip(keys, vectors, strict=True)],
+                )
+                self._db.commit()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "persistent": self._db is not None,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # Internals (caller holds the lock)
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, keys: list[str]) -> dict[str, np.ndarray]:
+        found: dict[str, np.ndarray] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._db.execute(  # type: ignore[union-attr]
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                chunk,
+            )
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+
+class CachedEmbedding(BaseEmbedding):
+    """Embedding model that consults an ``EmbeddingCache`` before the wrapped model."""
+
+    _inner: BaseEmbedding = PrivateAttr()
+    _cache: EmbeddingCache = PrivateAttr()
+
+    def __init__(self, inner: BaseEmbedding, cache: EmbeddingCache) -> None:
+        super().__init__(
+            model_name=inner.model_name,
+            embed_batch_size=inner.embed_batch_size,
+            callback_manager=inner.callback_manager,
+            num_workers=inner.num_workers,
+        )
+        self._inner = inner
+        self._cache = cache
+
+    @classmethod
+    def class_name(cls) -> str:
+        return "CachedEmbedding"
+
+    @property
+    def inner(self) -> BaseEmbedding:
+        return self._inner
+
+    @property
+    def cache(self) -> EmbeddingCache:
+        return self._cache
+
+    def _keys(self, kind: str, texts: list[str]) -> list[str]:
+        return [self._cache.make_key(kind, self.model_name, t) for t in texts]
+
+    def _split_misses(
+        self, kind: str, texts: list[str]
+    ) -> tuple[list[str], list[Embedding | None], list[int]]:
+        keys = self._keys(kind, texts)
+        cached = self._cache.get_many(keys)
+        missing = [i for i, embedding in enumerate(cached) if embedding is None]
+        return keys, cached, missing
+
+    def _merge(
+        self,
+        keys: list[str],
+        cached: list[Embedding | None],
+        missing: list[int],
+        computed: list[Embedding],
+    ) -> list[Embedding]:
+        self._cache.put_many([keys[i] for i in missing], computed)
+        for i, embedding in zip(missing, computed, strict=True):
+            cached[i] = embedding
+        return cached  # type: ignore[return-value]
+
+    def _get_query_embedding(self, query: str) -> Embedding:
+        keys, cached, missing = self._split_misses("query", [query])
+        if not missing:
+            return cached[0]  # type: ignore[return-value]
+        computed = [self._inner._get_query_embedding(query)]
+        return self._merge(keys, cached, missing, computed)[0]
+
+    async def _aget_query_embedding(self, query: str) -> Embedding:
+        keys, cached, missing = self._split_misses("query", [query])
+        if not missing:
+            return cached[0]  # type: ignore[return-value]
+        computed = [await self._inner._aget_query_embedding(query)]
+        return self._merge(keys, cached, missing, computed)[0]
+
+    def _get_text_embedding(self, text: str) -> Embedding:
+        return self._get_text_embeddings([text])[0]
+
+    async def _aget_text_embedding(self, text: str) -> Embedding:
+        return (await self._aget_text_embeddings([text]))[0]
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[Embedding]:
+        keys, cached, missing = self._split_misses("text", texts)
+        if not missing:
+            return cached  # type: ignore[return-value]
+        computed = self._inner._get_text_embeddings([texts[i] for i in missing])
+        return self._merge(keys, cached, missing, computed)
+
+    async def _aget_text_embeddings(self, texts: list[str]) -> list[Embedding]:
+        keys, cached, missing = self._split_misses("text", texts)
+        if not missing:
+            return cached  # type: ignore[return-value]
+        computed = await self._inner._aget_text_embeddings([texts[i] for i in missing])
+        return self._merge(keys, cached, missing, computed)
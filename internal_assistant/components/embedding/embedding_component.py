@@ -3,7 +3,15 @@ import logging
 from injector import inject, singleton
 from llama_index.core.embeddings import BaseEmbedding, MockEmbedding
 
-from internal_assistant.paths import models_cache_path
+from internal_assistant.components.embedding.adaptive_batching import (
+    AdaptiveBatchEmbedding,
+)
+from internal_assistant.components.embedding.embedding_cache import (
+    EMBEDDING_CACHE_FILE,
+    CachedEmbedding,
+    EmbeddingCache,
+)
+from internal_assistant.paths import local_data_path, models_cache_path
 from internal_assistant.settings.settings import Settings
 
 logger = logging.getLogger(__name__)
@@ -12,6 +20,7 @@ logger = logging.getLogger(__name__)
 @singleton
 class EmbeddingComponent:
     embedding_model: BaseEmbedding
+    cache: EmbeddingCache | None = None
 
     @inject
     def __init__(self, settings: Settings) -> None:
@@ -32,6 +41,8 @@ class EmbeddingComponent:
                     model_name=settings.huggingface.embedding_hf_model_name,
                     cache_folder=str(models_cache_path),
                     trust_remote_code=settings.huggingface.trust_remote_code,
+                    max_length=settings.embedding.max_length,
+                    embed_batch_size=settings.embedding.batch_size,
                 )
             case "sagemaker":
                 try:
@@ -150,3 +161,22 @@ class EmbeddingComponent:
                 # to match production behavior (nomic-embed-text-v1.5 = 768)
                 embed_dim = settings.embedding.embed_dim
                 self.embedding_model = MockEmbedding(embed_dim)
+
+        if settings.embedding.adaptive_batching:
+            self.embedding_model = AdaptiveBatchEmbedding(
+                self.embedding_model,
+                batch_size=settings.embedding.batch_size,
+                max_length=settings.embedding.max_length,
+            )
+
+        cache_settings = settings.embedding.cache
+        if cache_settings.enabled:
+            self.cache = EmbeddingCache(
+                max_entries=cache_settings.max_entries,
+                db_path=(
+                    local_data_path / EMBEDDING_CACHE_FILE
+                    if cache_settings.persist
+                    else None
+                ),
+            )
+            self.embedding_model = CachedEmbedding(self.embedding_model, self.cache)
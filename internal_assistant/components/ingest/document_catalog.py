@@ -0,0 +1,321 @@
+"""In-memory catalog of ingested documents.
+
+The catalog mirrors the docstore's ``ref_doc_info`` collection so that listing
+documents does not require reloading ``docstore.json`` from disk. It is kept up
+to date incrementally by the ingest component on every save and delete, and is
+only rebuilt from disk when another process has written the docstore file.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from internal_assistant.components.ingest.document_categories import (
+    DocumentFacets,
+    classify_file,
+)
+
+if TYPE_CHECKING:
+    from llama_index.core.storage.docstore import BaseDocumentStore
+
+logger = logging.getLogger(__name__)
+
+
+def assess_chunk_quality(chunk_count: int) -> dict[str, Any]:
+    """Derive the quality fields of a document from its chunk count.
+
+    Scoring thresholds:
+    - 0 chunks = 0 (failed)
+    - 1-2 chunks = 40 (low quality)
+    - 3-5 chunks = 70 (medium quality)
+    - 6-10 chunks = 90 (good quality)
+    - 10+ chunks = 100 (excellent quality)
+    """
+    if chunk_count == 0:
+        return {
+            "processing_status": "failed",
+            "quality_score": 0,
+            "chunk_count": 0,
+            "error_message": "No chunks generated during ingestion",
+        }
+    if chunk_count <= 2:
+        quality_score, processing_status = 40, "low_quality"
+    elif chunk_count <= 5:
+        quality_score, processing_status = 70, "indexed"
+    elif chunk_count <= 10:
+        quality_score, processing_status = 90, "indexed"
+    else:
+        quality_score, processing_status = 100, "indexed"
+    return {
+        "processing_status": processing_status,
+        "quality_score": quality_score,
+        "chunk_count": chunk_count,
+    }
+
+
+@dataclass
+class CatalogEntry:
+    """A single ingested document with its precomputed listing fields."""
+
+    doc_id: str
+    metadata: dict[str, Any] | None
+    chunk_count: int = 0
+    quality_score: int = 0
+    processing_status: str = "failed"
+    error_message: str | None = None
+    # Set by the catalog on add and shared by all documents of the file
+    facets: DocumentFacets | None = field(default=None, repr=False)
+
+    @classmethod
+    def build(
+        cls, doc_id: str, metadata: dict[str, Any] | None, chunk_count: int
+    ) -> "CatalogEntry":
+        quality = assess_chunk_quality(chunk_count)
+        return cls(
+            doc_id=doc_id,
+            metadata=dict(metadata) if metadata is not None else None,
+            chunk_count=quality["chunk_count"],
+            quality_score=quality["quality_score"],
+            processing_status=quality["processing_status"],
+            error_message=quality.get("error_message"),
+        )
+
+    @property
+    def file_name(self) -> str | None:
+        return self.metadata.get("file_name") if self.metadata else None
+
+    @property
+    def content_hash(self) -> str | None:
+        return self.metadata.get("content_hash") if self.metadata else None
+
+    def matches_file_stat(self, size: int, mtime: float) -> bool:
+        """Whether the entry was ingested from a file with this size and mtime."""
+        if not self.metadata or self.metadata.get("file_mtime") is None:
+            return False
+        return (
+            self.metadata.get("file_size") == size
+            and self.metadata["file_mtime"] == mtime
+        )
+
+
+@dataclass
+class DocumentCatalog:
+    """Thread-safe catalog of ingested documents with secondary indexes.
+
+    ``version`` is bumped on every mutation, so callers can cache anything
+    derived from the catalog and skip recomputation while it is unchanged.
+    Files are also indexed by their facets (file type and categories, see
+    ``document_categories``), which are computed once when a file is added.
+    Each facet value records the catalog version of its last change, so views
+    of one category can be cached independently of the others.
+    """
+
+    # Files whose modification marks the catalog stale (snapshot, journal)
+    watched_paths: tuple[Path, ...] = ()
+    version: int = 0
+    _entries: dict[str, CatalogEntry] = field(default_factory=dict, repr=False)
+    _by_file_name: dict[str, set[str]] = field(default_factory=dict, repr=False)
+    _by_content_hash: dict[str, set[str]] = field(default_factory=dict, repr=False)
+    # (facet, value) -> file names
+    _files_by_facet: dict[tuple[str, str], set[str]] = field(
+        default_factory=dict, repr=False
+    )
+    # file name -> facets, computed when the file's first document is added
+    _facets_by_file: dict[str, DocumentFacets] = field(
+        default_factory=dict, repr=False
+    )
+    # (facet, value) -> version of the last change to its files or their docs
+    _facet_versions: dict[tuple[str, str], int] = field(
+        default_factory=dict, repr=False
+    )
+    _known_mtime: tuple[float, ...] | None = field(default=None, repr=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    # Mutations
+
+    def add(
+        self, doc_id: str, metadata: dict[str, Any] | None, chunk_count: int
+    ) -> None:
+        """Add or replace a document in the catalog."""
+        with self._lock:
+            self._remove_unlocked(doc_id)
+            self._add_unlocked(CatalogEntry.build(doc_id, metadata, chunk_count))
+            self.version += 1
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document from the catalog, returning whether it was present."""
+        with self._lock:
+            removed = self._remove_unlocked(doc_id)
+            if removed:
+                self.version += 1
+            return removed
+
+    def rebuild(self, docstore: "BaseDocumentStore") -> None:
+        """Replace the catalog content with what the docstore currently holds."""
+        entries: list[CatalogEntry] = []
+        ref_docs = docstore.get_all_ref_doc_info() or {}
+        if ref_docs:
+            for doc_id, ref_doc_info in ref_docs.items():
+                if ref_doc_info is None:
+                    entries.append(CatalogEntry.build(doc_id, None, 0))
+                    continue
+                entries.append(
+                    CatalogEntry.build(
+                        doc_id, ref_doc_info.metadata, len(ref_doc_info.node_ids)
+                    )
+                )
+        else:
+            # Older docstores may lack ref_doc_info; fall back to document hashes
+            for doc_id in (docstore.get_all_document_hashes() or {}).values():
+                doc = docstore.get_document(doc_id, raise_error=False)
+                if doc is None:
+                    continue
+                ref_doc_info = docstore.get_ref_doc_info(doc_id)
+                chunk_count = len(ref_doc_info.node_ids) if ref_doc_info else 0
+                entries.append(CatalogEntry.build(doc_id, doc.metadata, chunk_count))
+
+        with self._lock:
+            self._entries.clear()
+            self._by_file_name.clear()
+            self._by_content_hash.clear()
+            self._files_by_facet.clear()
+            # Facets only depend on the file name; keep those already computed
+            known_facets = self._facets_by_file
+            self._facets_by_file = {}
+            for entry in entries:
+                if entry.file_name:
+                    entry.facets = known_facets.get(entry.file_name)
+                self._add_unlocked(entry)
+            self.version += 1
+            # Facets that lost all their files changed as well
+            for key in self._facet_versions:
+                self._facet_versions[key] = self.version
+            self._known_mtime = self._current_mtime()
+        logger.info("Document catalog rebuilt with %d documents", len(entries))
+
+    # Staleness tracking
+
+    def mark_persisted(self) -> None:
+        """Record that the docstore files on disk reflect this catalog."""
+        with self._lock:
+            self._known_mtime = self._current_mtime()
+
+    def is_stale(self) -> bool:
+        """Whether the docstore files were written by someone else since last sync."""
+        current = self._current_mtime()
+        with self._lock:
+            return current is not None and current != self._known_mtime
+
+    def _current_mtime(self) -> tuple[float, ...] | None:
+        mtimes = []
+        for path in self.watched_paths:
+            try:
+                mtimes.append(path.stat().st_mtime)
+            except OSError:
+                mtimes.append(0.0)
+        return tuple(mtimes) if any(mtimes) else None
+
+    # Queries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._entries
+
+    def get(self, doc_id: str) -> CatalogEntry | None:
+        return self._entries.get(doc_id)
+
+    def entries(self) -> list[CatalogEntry]:
+        with self._lock:
+            return list(self._entries.values())
+
+    def doc_ids_for_file(self, file_name: str) -> set[str]:
+        with self._lock:
+            return set(self._by_file_name.get(file_name, ()))
+
+    def entries_for_file(self, file_name: str) -> list[CatalogEntry]:
+        with self._lock:
+            return [
+                self._entries[doc_id]
+                for doc_id in self._by_file_name.get(file_name, ())
+            ]
+
+    def files_with_facet(self, facet: str, value: str) -> list[str]:
+        """Sorted names of the files with a file type or category."""
+        with self._lock:
+            return sorted(self._files_by_facet.get((facet, value), ()))
+
+    def facet_counts(self, facet: str) -> dict[str, int]:
+        """Number of files per value of a facet, for values with files."""
+        with self._lock:
+            return {
+                value: len(files)
+                for (name, value), files in self._files_by_facet.items()
+                if name == facet
+            }
+
+    def facet_version(self, facet: str, value: str) -> int:
+        """Catalog version of the last change to a facet value, 0 if never."""
+        with self._lock:
+            return self._facet_versions.get((facet, value), 0)
+
+    def doc_ids_for_hash(self, content_hash: str) -> set[str]:
+        with self._lock:
+            return set(self._by_content_hash.get(content_hash, ()))
+
+    def file_names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._by_file_name)
+
+    # Internals (caller holds the lock)
+
+    def _add_unlocked(self, entry: CatalogEntry) -> None:
+        self._entries[entry.doc_id] = entry
+        if entry.file_name:
+            facets = self._facets_by_file.get(entry.file_name)
+            if facets is None:
+                # First document of the file
+                facets = entry.facets or classify_file(entry.file_name)
+                self._facets_by_file[entry.file_name] = facets
+                for key in facets.keys():
+                    self._files_by_facet.setdefault(key, set()).add(entry.file_name)
+            entry.facets = facets
+            self._touch_facets_unlocked(facets)
+            self._by_file_name.setdefault(entry.file_name, set()).add(entry.doc_id)
+        if entry.content_hash:
+            self._by_content_hash.setdefault(entry.content_hash, set()).add(
+                entry.doc_id
+            )
+
+    def _remove_unlocked(self, doc_id: str) -> bool:
+        entry = self._entries.pop(doc_id, None)
+        if entry is None:
+            return False
+        for index, key in (
+            (self._by_file_name, entry.file_name),
+            (self._by_content_hash, entry.content_hash),
+        ):
+            if key and key in index:
+                index[key].discard(doc_id)
+                if not index[key]:
+                    del index[key]
+        if entry.file_name and entry.facets is not None:
+            self._touch_facets_unlocked(entry.facets)
+        if entry.file_name and entry.file_name not in self._by_file_name:
+            # Last document of the file is gone
+            facets = self._facets_by_file.pop(entry.file_name, None)
+            for key in facets.keys() if facets else ():
+                files = self._files_by_facet.get(key)
+                if files is not None:
+                    files.discard(entry.file_name)
+                    if not files:
+                        del self._files_by_facet[key]
+        return True
+
+    def _touch_facets_unlocked(self, facets: DocumentFacets) -> None:
+        # Mutations bump ``version`` once they are done
+        for key in facets.keys():
+            self._facet_versions[key] = self.version + 1
@@ -0,0 +1,357 @@
+"""File-name categorization of ingested documents.
+
+Every keyword list the document library uses to sort files into categories
+is compiled once into a single ``MultiPatternMatcher``, so one scan of a file
+name yields its category in every taxonomy. ``DocumentCatalog`` computes
+these facets when a document is added and indexes files by them, so the UI
+reads categories and per-category counts instead of re-scanning names.
+
+A file belongs to the first category (in declaration order) with a keyword
+contained in its lowercased name, or to the taxonomy's default, if any.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from internal_assistant.utils.pattern_matcher import MultiPatternMatcher
+
+# Taxonomies
+FOLDER = "folder"  # document library folders
+CATEGORY = "category"  # security report categories, uncategorized files skipped
+DOMAIN = "domain"  # document domains used for model recommendations
+
+FILE_TYPE = "type"
+
+_FILE_TYPES = {
+    "pdf": "pdf",
+    "doc": "word",
+    "docx": "word",
+    "xls": "excel",
+    "xlsx": "excel",
+    "csv": "excel",
+}
+
+_SECURITY_REPORT_TERMS = (
+    "security assessment",
+    "security_assessment",
+    "security audit",
+    "security_audit",
+    "compliance audit",
+    "compliance_audit",
+    "vulnerability assessment",
+    "vulnerability_assessment",
+    "penetration test",
+    "penetration_test",
+    "security scan",
+    "security_scan",
+    "risk assessment",
+    "risk_assessment",
+    "security review",
+    "security_review",
+    "security evaluation",
+    "security_evaluation",
+    "vulnerability scan",
+    "vulnerability_scan",
+    "security report",
+    "security_report",
+)
+_POLICY_TERMS = (
+    "policy",
+    "procedure",
+    "guideline",
+    "manual",
+    "handbook",
+    "protocol",
+    "standard",
+    "regulation",
+    "code of conduct",
+)
+_THREAT_TERMS = (
+    "threat intelligence",
+    "ioc",
+    "malware",
+    "apt",
+    "campaign",
+    "cve",
+    "exploit",
+    "mitre",
+    "att&ck",
+    "ttp",
+    "indicator",
+    "signature",
+    "yara",
+)
+_INCIDENT_TERMS = (
+    "incident response",
+    "forensics",
+    "investigation",
+    "breach",
+    "attack",
+    "containment",
+    "eradication",
+)
+_TECHNICAL_TERMS = (
+    "technical",
+    "architecture",
+    "design",
+    "api",
+    "database",
+    "system",
+    "infrastructure",
+    "code",
+    "development",
+    "software",
+    "hardware",
+    "network",
+    "blueprint",
+    "diagram",
+    "topology",
+    "schema",
+    "protocol",
+    "interface",
+)
+_COMPLIANCE_TERMS = (
+    "compliance",
+    "regulatory",
+    "certification",
+    "iso",
+    "soc",
+    "pci",
+    "dss",
+    "gdpr",
+    "sox",
+)
+_GOVERNANCE_TERMS = (
+    "governance",
+    "framework",
+    "baseline",
+    "control",
+    "requirement",
+    "specification",
+)
+_THREAT_DETAIL_TERMS = (
+    "zero-day",
+    "zero_day",
+    "adversary",
+    "tactic",
+    "technique",
+)
+_INCIDENT_DETAIL_TERMS = (
+    "incident_response",
+    "alert",
+    "detection",
+    "mitigation",
+    "recovery",
+    "lessons learned",
+    "lessons_learned",
+    "post-mortem",
+    "post_mortem",
+)
+
+
+@dataclass(frozen=True)
+class Taxonomy:
+    """Ordered categories with their keywords, and the fallback category."""
+
+    categories: dict[str, tuple[str, ...]]
+    default: str | None = None
+
+
+TAXONOMIES: dict[str, Taxonomy] = {
+    FOLDER: Taxonomy(
+        {
+            "🔒 Security & Compliance": (
+                "security assessment",
+                "security audit",
+                "compliance audit",
+                "vulnerability assessment",
+                "penetration test",
+                "security scan",
+                "risk assessment",
+                "security review",
+                *_COMPLIANCE_TERMS,
+            ),
+            "📋 Policy & Governance": (*_POLICY_TERMS, *_GOVERNANCE_TERMS),
+            "🕵️ Threat Intelligence": (
+                *_THREAT_TERMS,
+                "stix",
+                "taxii",
+                "threat",
+                "attack",
+                "vulnerability",
+                "ransomware",
+                "phishing",
+            ),
+            "🚨 Incident Response": (
+                *_INCIDENT_TERMS,
+                "incident",
+                "compromise",
+                "intrusion",
+                "data breach",
+            ),
+            "🔧 Technical & Infrastructure": _TECHNICAL_TERMS,
+            "📊 Research & Analysis": (),
+        },
+        default="📊 Research & Analysis",
+    ),
+    CATEGORY: Taxonomy(
+        {
+            "🔒 Security Reports": _SECURITY_REPORT_TERMS,
+            "📋 Policy Documents": (*_POLICY_TERMS, "code_of_conduct"),
+            "🔍 Threat Intelligence": (
+                *_THREAT_TERMS,
+                "threat_intelligence",
+                *_THREAT_DETAIL_TERMS,
+            ),
+            "🛡️ Incident Response": (*_INCIDENT_TERMS, *_INCIDENT_DETAIL_TERMS),
+        },
+    ),
+    DOMAIN: Taxonomy(
+        {
+            "Security & Compliance": (
+                *_SECURITY_REPORT_TERMS,
+                "firewall",
+                "ids",
+                "ips",
+                "siem",
+                "edr",
+                "xdr",
+                "mdr",
+                *_COMPLIANCE_TERMS,
+            ),
+            "Policy & Governance": (
+                *_POLICY_TERMS,
+                "code_of_conduct",
+                "rules",
+                "terms",
+                "conditions",
+                "agreement",
+                "contract",
+                *_GOVERNANCE_TERMS,
+            ),
+            "Threat Intelligence": (
+                *_THREAT_TERMS,
+                "threat_intelligence",
+                *_THREAT_DETAIL_TERMS,
+                "stix",
+                "taxii",
+                "threat",
+                "attack",
+                "vulnerability",
+                "ransomware",
+                "phishing",
+            ),
+            "Incident Response": (
+                *_INCIDENT_TERMS,
+                *_INCIDENT_DETAIL_TERMS,
+                "incident",
+                "compromise",
+                "intrusion",
+                "data breach",
+                "data_breach",
+            ),
+            "Technical & Infrastructure": (
+                *_TECHNICAL_TERMS,
+                "spec",
+                "config",
+                "deployment",
+                "configuration",
+            ),
+            "Research & Analysis": (
+                "research",
+                "analysis",
+                "study",
+                "report",
+                "whitepaper",
+                "survey",
+                "trend",
+                "forecast",
+                "insight",
+                "data",
+                "statistics",
+                "metrics",
+                "benchmark",
+                "comparison",
+                "evaluation",
+                "assessment",
+                "findings",
+                "conclusion",
+                "recommendation",
+                "summary",
+            ),
+        },
+        default="Research & Analysis",
+    ),
+}
+
+
+def file_type_for(file_name: str) -> str:
+    """Coarse file type (pdf, word, excel or other) from the extension."""
+    extension = file_name.lower().split(".")[-1] if "." in file_name else ""
+    return _FILE_TYPES.get(extension, "other")
+
+
+@dataclass(frozen=True)
+class DocumentFacets:
+    """Precomputed file type and per-taxonomy categories of one file name.
+
+    ``defaulted`` lists the taxonomies where no keyword matched and the
+    category is the taxonomy default (or None when it has none).
+    """
+
+    file_type: str
+    categories: tuple[tuple[str, str | None], ...]
+    defaulted: frozenset[str] = frozenset()
+
+    def category(self, taxonomy: str) -> str | None:
+        return dict(self.categories).get(taxonomy)
+
+    def keys(self) -> list[tuple[str, str]]:
+        """(facet, value) pairs the catalog indexes this file under."""
+        return [(FILE_TYPE, self.file_type)] + [
+            (taxonomy, category)
+            for taxonomy, category in self.categories
+            if category is not None
+        ]
+
+
+class DocumentClassifier:
+    """Categorizes file names in every taxonomy with one compiled scan."""
+
+    def __init__(self, taxonomies: dict[str, Taxonomy] = TAXONOMIES) -> None:
+        self.taxonomies = taxonomies
+        self._matcher = MultiPatternMatcher(
+            {
+                (taxonomy, category): [re.escape(term) for term in terms]
+                for taxonomy, spec in taxonomies.items()
+                for category, terms in spec.categories.items()
+                if terms
+            }
+        )
+
+    def classify(self, file_name: str) -> DocumentFacets:
+        matched: dict[str, str] = {}
+        # Labels come back in declaration order, so the first one wins
+        for taxonomy, category in self._matcher.scan(file_name.lower()).labels:
+            matched.setdefault(taxonomy, category)
+        return DocumentFacets(
+            file_type=file_type_for(file_name),
+            categories=tuple(
+                (taxonomy, matched.get(taxonomy, spec.default))
+                for taxonomy, spec in self.taxonomies.items()
+            ),
+            defaulted=frozenset(self.taxonomies) - set(matched),
+        )
+
+
+_classifier: DocumentClassifier | None = None
+
+
+@lru_cache(maxsize=4096)
+def classify_file(file_name: str) -> DocumentFacets:
+    """Facets of a file name from the shared classifier (memoized)."""
+    global _classifier
+    if _classifier is None:
+        _classifier = DocumentClassifier()
+    return _classifier.classify(file_name)
@@ -4,6 +4,7 @@ SIMPLIFICATION CHANGES (2025-10-03):
 - Reduced from 1,295 lines to 195 lines (85% reduction)
 - Removed excessive verification/rollback code
 - Removed unused BatchIngestComponent, ParallelizedIngestComponent, PipelineIngestComponent
+  (ParallelizedIngestComponent was later restored for `batch`/`parallel` modes)
 - Simplified logging (100+ statements → ~30)
 - Removed defensive programming that caused bugs
 - Trust LlamaIndex's built-in persistence mechanisms
@@ -11,7 +12,12 @@ SIMPLIFICATION CHANGES (2025-10-03):
 
 import abc
 import logging
+import multiprocessing
 import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -20,17 +26,61 @@ from llama_index.core.embeddings.utils import EmbedType
 from llama_index.core.indices import VectorStoreIndex, load_index_from_storage
 from llama_index.core.indices.base import BaseIndex
 from llama_index.core.ingestion import run_transformations
-from llama_index.core.schema import Document, TransformComponent
+from llama_index.core.schema import Document, MetadataMode, TransformComponent
 from llama_index.core.storage import StorageContext
 from llama_index.core.storage.docstore.types import RefDocInfo
-
+from llama_index.core.vector_stores.types import (
+    FilterOperator,
+    MetadataFilter,
+    MetadataFilters,
+)
+
+from internal_assistant.components.embedding.adaptive_batching import estimate_tokens
+from internal_assistant.components.ingest.document_catalog import DocumentCatalog
 from internal_assistant.components.ingest.ingest_helper import IngestionHelper
+from internal_assistant.components.node_store.docstore_journal import (
+    DOCSTORE_JOURNAL_FILE,
+    JournaledKVStore,
+)
 from internal_assistant.paths import local_data_path
 from internal_assistant.settings.settings import Settings
+from internal_assistant.utils.eta import ETA
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class LockHoldStats:
+    """How long the index lock was held, and waited for, by one operation."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+    def record(self, held: float, waited: float) -> None:
+        self.count += 1
+        self.total_seconds += held
+        self.max_seconds = max(self.max_seconds, held)
+        self.last_seconds = held
+        self.wait_seconds += waited
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 3),
+            "average_seconds": round(self.average_seconds, 3),
+            "max_seconds": round(self.max_seconds, 3),
+            "last_seconds": round(self.last_seconds, 3),
+            "wait_seconds": round(self.wait_seconds, 3),
+        }
+
+
 class BaseIngestComponent(abc.ABC):
     def __init__(
         self,
@@ -57,6 +107,14 @@ class BaseIngestComponent(abc.ABC):
     def delete(self, doc_id: str) -> None:
         pass
 
+    def delete_many(self, doc_ids: list[str]) -> list[str]:
+        """Delete several documents; returns the ids that were deleted."""
+        deleted = []
+        for doc_id in doc_ids:
+            self.delete(doc_id)
+            deleted.append(doc_id)
+        return deleted
+
 
 class BaseIngestComponentWithIndex(BaseIngestComponent, abc.ABC):
     def __init__(
@@ -70,7 +128,50 @@ class BaseIngestComponentWithIndex(BaseIngestComponent, abc.ABC):
         super().__init__(storage_context, embed_model, transformations, *args, **kwargs)
         self.show_progress = True
         self._index_thread_lock = threading.Lock()
+        # operation -> hold times of the index lock
+        self.lock_stats: dict[str, LockHoldStats] = {}
         self._index = self._initialize_index()
+        self.catalog = DocumentCatalog(
+            watched_paths=(
+                local_data_path / "docstore.json",
+                local_data_path / DOCSTORE_JOURNAL_FILE,
+            )
+        )
+        self.catalog.rebuild(self._index.docstore)
+
+    @property
+    def index_lock(self) -> threading.Lock:
+        """Held while the index, docstore and vector store are written."""
+        return self._index_thread_lock
+
+    def lock_stats_summary(self) -> dict[str, dict[str, float]]:
+        """Index lock hold times per operation, for the status endpoint."""
+        # Copy first: operations may add entries while we read
+        return {
+            operation: stats.to_dict()
+            for operation, stats in dict(self.lock_stats).items()
+        }
+
+    @contextmanager
+    def _hold_index_lock(
+        self, operation: str, log_level: int = logging.DEBUG
+    ) -> Iterator[None]:
+        """Hold the index lock and record the hold time under ``operation``."""
+        requested = time.perf_counter()
+        with self._index_thread_lock:
+            acquired = time.perf_counter()
+            try:
+                yield
+            finally:
+                held = time.perf_counter() - acquired
+                self.lock_stats.setdefault(operation, LockHoldStats()).record(
+                    held, acquired - requested
+                )
+                logger.log(
+                    log_level,
+                    f"Index lock held {held:.3f}s for {operation} "
+                    f"(waited {acquired - requested:.3f}s)",
+                )
 
     def _initialize_index(self) -> BaseIndex[IndexDict]:
         """Initialize or load index from storage."""
@@ -97,7 +198,26 @@ class BaseIngestComponentWithIndex(BaseIngestComponent, abc.ABC):
         return index
 
     def _save_index(self) -> None:
-        """Save index to disk."""
+        """Save index to disk.
+
+        With a journaled docstore only the new mutations are appended to the
+        journal, and the full snapshot is rewritten when the journal is due for
+        compaction. The index store is small and is persisted every time.
+        """
+        kvstore = getattr(self._index.docstore, "_kvstore", None)
+        if isinstance(kvstore, JournaledKVStore) and not kvstore.needs_compaction():
+            logger.debug("Committing docstore journal and persisting index store")
+            try:
+                kvstore.commit()
+                self._index.storage_context.index_store.persist(
+                    persist_path=str(local_data_path / "index_store.json")
+                )
+            except Exception as e:
+                logger.error(f"Journal commit failed: {e}", exc_info=True)
+                raise
+            self.catalog.mark_persisted()
+            return
+
         logger.debug("Persisting the index and docstore")
 
         # Persist storage context and docstore
@@ -118,6 +238,7 @@ class BaseIngestComponentWithIndex(BaseIngestComponent, abc.ABC):
             logger.error(f"docstore.persist() failed: {e}", exc_info=True)
             raise
 
+        self.catalog.mark_persisted()
         logger.debug("Persisted the index and docstore")
 
     def delete(self, doc_id: str) -> None:
@@ -126,11 +247,12 @@ class BaseIngestComponentWithIndex(BaseIngestComponent, abc.ABC):
         Handles corrupted docstores where nodes are missing ref_doc_id fields.
         Falls back to manual cleanup if standard deletion fails with KeyError.
         """
-        with self._index_thread_lock:
+        with self._hold_index_lock("delete"):
             logger.info("Deleting document: %s", doc_id)
             try:
                 # Try standard LlamaIndex deletion first
                 self._index.delete_ref_doc(doc_id, delete_from_docstore=True)
+                self.catalog.remove(doc_id)
                 self._save_index()
                 logger.info("Successfully deleted document: %s", doc_id)
             except KeyError as e:
@@ -188,6 +310,7 @@ class BaseIngestComponentWithIndex(BaseIngestComponent, abc.ABC):
                         doc_id, collection=self._index.docstore._ref_doc_collection
                     )
                     logger.info(f"Deleted ref_doc_info for doc {doc_id}")
+                    self.catalog.remove(doc_id)
 
                     # Persist changes
                     self._save_index()
@@ -206,6 +329,142 @@ class BaseIngestComponentWithIndex(BaseIngestComponent, abc.ABC):
                 logger.error("Failed to delete document %s: %s", doc_id, e)
                 raise
 
+    def delete_many(self, doc_ids: list[str]) -> list[str]:
+        """Delete many documents with one vector-store delete and one persist.
+
+        Node ids are collected from a single read of ref_doc_info, the vector
+        store gets one delete filtered on the document ids, the docstore
+        entries are removed in one pass and the index is saved once.
+        Unknown ids are skipped; returns the ids that were deleted.
+        """
+        with self._hold_index_lock("delete_many"):
+            docstore = self._index.docstore
+            ref_doc_info = docstore.get_all_ref_doc_info() or {}
+            found = {
+                doc_id: ref_doc_info[doc_id]
+                for doc_id in dict.fromkeys(doc_ids)
+                if doc_id in ref_doc_info
+            }
+            if not found:
+                return []
+
+            node_ids = [node_id for info in found.values() for node_id in info.node_ids]
+            logger.info(f"Bulk deleting {len(found)} documents ({len(node_ids)} nodes)")
+            self._delete_vectors(list(found), node_ids)
+
+            kvstore = docstore._kvstore
+            for node_id in node_ids:
+                self._index.index_struct.delete(node_id)
+                kvstore.delete(node_id, collection=docstore._node_collection)
+                kvstore.delete(node_id, collection=docstore._metadata_collection)
+            for doc_id in found:
+                kvstore.delete(doc_id, collection=docstore._ref_doc_collection)
+                kvstore.delete(doc_id, collection=docstore._metadata_collection)
+                kvstore.delete(doc_id, collection=docstore._node_collection)
+                self.catalog.remove(doc_id)
+            self._index.storage_context.index_store.add_index_struct(
+                self._index.index_struct
+            )
+
+            self._save_index()
+            logger.info(f"Bulk deleted {len(found)} documents")
+            return list(found)
+
+    def _delete_vectors(self, doc_ids: list[str], node_ids: list[str]) -> None:
+        vector_store = self._index.vector_store
+        try:
+            vector_store.delete_nodes(
+                filters=MetadataFilters(
+                    filters=[
+                        MetadataFilter(
+                            key="doc_id", value=doc_ids, operator=FilterOperator.IN
+                        )
+                    ]
+                )
+            )
+            return
+        except Exception as e:
+            logger.debug(f"Filtered vector delete unavailable, using node ids: {e}")
+        try:
+            vector_store.delete_nodes(node_ids)
+            return
+        except Exception as e:
+            logger.debug(f"Node id vector delete unavailable, deleting per doc: {e}")
+        for doc_id in doc_ids:
+            vector_store.delete(doc_id)
+
+    def _save_docs(self, documents: list[Document]) -> list[Document]:
+        """Save documents to index.
+
+        CRITICAL FIX (2025-10-11): Must explicitly create ref_doc_info entries.
+        LlamaIndex's insert() method does NOT automatically create ref_doc_info.
+        Must use pattern: run_transformations() → insert_nodes() → set_document_hash()
+        """
+        if not documents:
+            return []
+
+        logger.info(f"Transforming {len(documents)} documents into nodes")
+
+        # Transform documents to nodes (handles chunking and embeddings)
+        start = time.perf_counter()
+        nodes = run_transformations(
+            documents,
+            self.transformations,
+            show_progress=self.show_progress,
+        )
+        elapsed = time.perf_counter() - start
+        tokens = sum(
+            estimate_tokens(node.get_content(metadata_mode=MetadataMode.EMBED))
+            for node in nodes
+        )
+        logger.info(
+            f"Created {len(nodes)} nodes from {len(documents)} documents "
+            f"(~{tokens} tokens, {tokens / elapsed if elapsed else 0:.0f} tokens/s)"
+        )
+
+        # Group node ids by document in one pass; a document id seen twice
+        # keeps its last metadata, as with the former per-document puts.
+        node_ids_by_doc: dict[str, list[str]] = {
+            document.get_doc_id(): [] for document in documents
+        }
+        for node in nodes:
+            doc_node_ids = node_ids_by_doc.get(node.ref_doc_id)
+            if doc_node_ids is not None:
+                doc_node_ids.append(node.node_id)
+        ref_infos = {
+            document.get_doc_id(): RefDocInfo(
+                node_ids=node_ids_by_doc[document.get_doc_id()],
+                metadata=document.metadata or {},
+            )
+            for document in documents
+        }
+
+        with self._hold_index_lock("save_docs", log_level=logging.INFO):
+            # Nodes already carry their embeddings, so this only writes them
+            logger.info(f"Inserting {len(nodes)} nodes into index")
+            self._index.insert_nodes(nodes, show_progress=True)
+
+            # CRITICAL FIX: Manually populate ref_doc_info since insert_nodes() skips docstore
+            # when using text-storing vector stores like Qdrant (optimization to avoid duplication)
+            # See: "VectorStoreIndex only stores nodes in document store if vector store does not store text"
+            logger.info(
+                f"Manually populating ref_doc_info for {len(ref_infos)} documents"
+            )
+            # No public API for this, must use private _kvstore. Values must be
+            # dicts because kvstore.put() calls .copy() on them.
+            self._index.docstore._kvstore.put_all(
+                [(doc_id, info.to_dict()) for doc_id, info in ref_infos.items()],
+                collection=self._index.docstore._ref_doc_collection,
+            )
+            for doc_id, info in ref_infos.items():
+                self.catalog.add(doc_id, info.metadata, len(info.node_ids))
+
+            # CRITICAL: Use _save_index() which has the explicit docstore persistence fix
+            self._save_index()
+            logger.debug("Persisted the index and nodes")
+
+        return documents
+
 
 class SimpleIngestComponent(BaseIngestComponentWithIndex):
     def __init__(
@@ -249,72 +508,116 @@ class SimpleIngestComponent(BaseIngestComponentWithIndex):
             return []
 
     def bulk_ingest(self, files: list[tuple[str, Path]]) -> list[Document]:
-        """Ingest multiple files."""
+        """Ingest multiple files one after another."""
         saved_documents = []
         for file_name, file_data in files:
-            documents = IngestionHelper.transform_file_into_documents(
-                file_name, file_data
-            )
-            saved_documents.extend(self._save_docs(documents))
+            saved_documents.extend(self.ingest(file_name, file_data))
         return saved_documents
 
-    def _save_docs(self, documents: list[Document]) -> list[Document]:
-        """Save documents to index.
 
-        CRITICAL FIX (2025-10-11): Must explicitly create ref_doc_info entries.
-        LlamaIndex's insert() method does NOT automatically create ref_doc_info.
-        Must use pattern: run_transformations() → insert_nodes() → set_document_hash()
-        """
-        if not documents:
-            return []
+def _transform_file_into_documents(file: tuple[str, Path]) -> list[Document]:
+    """Process pool entry point; failures are logged so one file can't sink a batch."""
+    file_name, file_data = file
+    try:
+        return IngestionHelper.transform_file_into_documents(file_name, file_data)
+    except Exception as e:
+        logger.error("Error parsing %s: %s", file_name, e, exc_info=True)
+        return []
 
-        logger.info(f"Transforming {len(documents)} documents into nodes")
 
-        # Transform documents to nodes (handles chunking and embeddings)
-        nodes = run_transformations(
-            documents,
-            self.transformations,
-            show_progress=self.show_progress,
+class ParallelizedIngestComponent(BaseIngestComponentWithIndex):
+    """Parse files in a process pool and embed them in large batches.
+
+    ``IngestionHelper.transform_file_into_documents`` is CPU bound, so files are
+    parsed by ``count_workers`` processes. The documents of several files are
+    then chunked and embedded together, which keeps the embedding model fed
+    with large batches, and the index lock is taken once per batch instead of
+    once per file.
+    """
+
+    # Number of files handed to each worker before the batch is embedded
+    files_per_worker = 4
+
+    def __init__(
+        self,
+        storage_context: StorageContext,
+        embed_model: EmbedType,
+        transformations: list[TransformComponent],
+        count_workers: int,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(storage_context, embed_model, transformations, *args, **kwargs)
+        self.count_workers = max(count_workers, 1)
+        self._file_to_documents_work_pool = multiprocessing.Pool(
+            processes=self.count_workers
         )
-        logger.info(f"Created {len(nodes)} nodes from {len(documents)} documents")
 
-        with self._index_thread_lock:
-            # Insert nodes into vector store
-            logger.info(f"Inserting {len(nodes)} nodes into index")
-            self._index.insert_nodes(nodes, show_progress=True)
+    def ingest(self, file_name: str, file_data: Path) -> list[Document]:
+        """Ingest a single file, parsing it in the worker pool."""
+        logger.info("Ingesting file: %s", file_name)
 
-            # CRITICAL FIX: Manually populate ref_doc_info since insert_nodes() skips docstore
-            # when using text-storing vector stores like Qdrant (optimization to avoid duplication)
-            # See: "VectorStoreIndex only stores nodes in document store if vector store does not store text"
-            logger.info(
-                f"Manually populating ref_doc_info for {len(documents)} documents"
-            )
-            for document in documents:
-                doc_id = document.get_doc_id()
+        if not file_data.exists():
+            logger.error("File does not exist: %s", file_data)
+            return []
+
+        documents = self._file_to_documents_work_pool.apply(
+            _transform_file_into_documents, ((file_name, file_data),)
+        )
+        try:
+            return self._save_docs(documents)
+        except Exception as e:
+            logger.error("Error ingesting %s: %s", file_name, e, exc_info=True)
+            return []
 
-                # Get node IDs for this document
-                doc_node_ids = [
-                    node.node_id for node in nodes if node.ref_doc_id == doc_id
-                ]
+    def bulk_ingest(self, files: list[tuple[str, Path]]) -> list[Document]:
+        """Ingest multiple files, parsing in parallel and saving in batches."""
+        if not files:
+            return []
 
-                # Create RefDocInfo with node IDs and metadata
-                ref_info = RefDocInfo(
-                    node_ids=doc_node_ids, metadata=document.metadata or {}
+        batch_size = self.count_workers * self.files_per_worker
+        logger.info(
+            "Ingesting %d files with %d workers (%d files per batch)",
+            len(files),
+            self.count_workers,
+            batch_size,
+        )
+        progress = ETA(len(files))
+        progress.needReport(30)
+
+        saved_documents: list[Document] = []
+        for start in range(0, len(files), batch_size):
+            batch = files[start : start + batch_size]
+            documents = [
+                document
+                for file_documents in self._file_to_documents_work_pool.map(
+                    _transform_file_into_documents, batch
                 )
-
-                # Manually add to docstore's kvstore (no public API for this, must use private _kvstore)
-                # IMPORTANT: Must convert RefDocInfo to dict because kvstore.put() calls .copy() on the value
-                self._index.docstore._kvstore.put(
-                    doc_id,
-                    ref_info.to_dict(),  # Convert to dict to avoid AttributeError: 'RefDocInfo' object has no attribute 'copy'
-                    collection=self._index.docstore._ref_doc_collection,
+                for document in file_documents
+            ]
+            try:
+                saved_documents.extend(self._save_docs(documents))
+            except Exception as e:
+                logger.error(
+                    "Error saving batch of %d files: %s", len(batch), e, exc_info=True
                 )
 
-            # CRITICAL: Use _save_index() which has the explicit docstore persistence fix
-            self._save_index()
-            logger.debug("Persisted the index and nodes")
+            processed = start + len(batch)
+            progress.update(processed)
+            if progress.needReport(60):
+                logger.info(
+                    "Ingested %d/%d files - ETA %s",
+                    processed,
+                    len(files),
+                    progress.human_time(),
+                )
+        return saved_documents
 
-        return documents
+    def __del__(self) -> None:
+        # Terminate the worker processes so they don't outlive the component
+        pool = getattr(self, "_file_to_documents_work_pool", None)
+        if pool is not None:
+            pool.terminate()
 
 
 def get_ingestion_component(
@@ -325,15 +628,20 @@ def get_ingestion_component(
 ) -> BaseIngestComponent:
     """Get the ingestion component for the given configuration.
 
-    Note: Only SimpleIngestComponent is supported after simplification.
-    Batch/Parallel/Pipeline modes removed as they were unused and complex.
+    `batch` and `parallel` both use ParallelizedIngestComponent; `pipeline` has
+    not been brought back and falls back to SimpleIngestComponent.
     """
     ingest_mode = settings.embedding.ingest_mode
-    if ingest_mode in ("batch", "parallel", "pipeline"):
+    if ingest_mode in ("batch", "parallel"):
+        return ParallelizedIngestComponent(
+            storage_context=storage_context,
+            embed_model=embed_model,
+            transformations=transformations,
+            count_workers=settings.embedding.count_workers,
+        )
+    if ingest_mode == "pipeline":
         logger.warning(
-            "Ingest mode '%s' no longer supported (removed in simplification). "
-            "Using 'simple' mode instead.",
-            ingest_mode,
+            "Ingest mode 'pipeline' is not supported. Using 'simple' mode instead."
         )
 
     return SimpleIngestComponent(
@@ -1,5 +1,7 @@
 import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 from llama_index.core.readers import StringIterableReader
@@ -9,6 +11,14 @@ from llama_index.core.schema import Document
 
 logger = logging.getLogger(__name__)
 
+# Read size when hashing files; large reads keep hashing disk-bound
+HASH_BUFFER_SIZE = 1024 * 1024
+# Recent (path, size, mtime) -> hash entries, so a file checked for duplicates
+# is not read again when it is ingested right after
+_HASH_CACHE_SIZE = 256
+_hash_cache: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_hash_cache_lock = threading.Lock()
+
 
 # Inspired by the `llama_index.core.readers.file.base` module
 def _try_loading_included_file_formats() -> dict[str, type[BaseReader]]:
@@ -82,19 +92,42 @@ class IngestionHelper:
     These methods are thread-safe (and multiprocessing-safe).
     """
 
+    @staticmethod
+    def get_file_stat(file_path: Path) -> tuple[int, float] | None:
+        """Size and modification time of a file, or None if it can't be read."""
+        try:
+            stat = file_path.stat()
+        except OSError as e:
+            logger.warning(f"Could not stat {file_path}: {e}")
+            return None
+        return stat.st_size, stat.st_mtime
+
     @staticmethod
     def _get_file_hash(file_path: Path) -> str:
         """Generate SHA-256 hash of file content for duplicate detection."""
-        hash_sha256 = hashlib.sha256()
         try:
+            stat = file_path.stat()
+            key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+            with _hash_cache_lock:
+                if key in _hash_cache:
+                    _hash_cache.move_to_end(key)
+                    return _hash_cache[key]
+
+            hash_sha256 = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
+                for chunk in iter(lambda: f.read(HASH_BUFFER_SIZE), b""):
                     hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
         except Exception as e:
             logger.warning(f"Could not compute hash for {file_path}: {e}")
             return ""
 
+        content_hash = hash_sha256.hexdigest()
+        with _hash_cache_lock:
+            _hash_cache[key] = content_hash
+            if len(_hash_cache) > _HASH_CACHE_SIZE:
+                _hash_cache.popitem(last=False)
+        return content_hash
+
     @staticmethod
     def transform_file_into_documents(
         file_name: str, file_data: Path
@@ -103,18 +136,23 @@ class IngestionHelper:
         content_hash = IngestionHelper._get_file_hash(file_data)
 
         # Get file metadata
+        file_mtime: float | None
         try:
-            file_size = file_data.stat().st_size
-            creation_time = file_data.stat().st_ctime
-            creation_date = Path(file_data).stat().st_ctime
+            stat = file_data.stat()
+            file_size = stat.st_size
+            file_mtime = stat.st_mtime
+            creation_date = stat.st_ctime
         except Exception as e:
             logger.warning(f"Could not get file metadata for {file_data}: {e}")
             file_size = 0
+            file_mtime = None
             creation_date = ""
 
         for document in documents:
             document.metadata["file_name"] = file_name
             document.metadata["file_size"] = file_size
+            if file_mtime is not None:
+                document.metadata["file_mtime"] = file_mtime
             document.metadata["creation_date"] = (
                 str(creation_date) if creation_date else ""
             )
@@ -168,7 +206,7 @@ class IngestionHelper:
         for document in documents:
             document.metadata["doc_id"] = document.doc_id
             # We don't want the Embeddings search to receive this metadata
-            document.excluded_embed_metadata_keys = ["doc_id"]
+            document.excluded_embed_metadata_keys = ["doc_id", "file_mtime"]
             # We don't want the LLM to receive these metadata in the context
             # Note: content_hash is kept for duplicate detection but not sent to LLM
             document.excluded_llm_metadata_keys = [
@@ -176,4 +214,5 @@ class IngestionHelper:
                 "doc_id",
                 "page_label",
                 "content_hash",
+                "file_mtime",
             ]
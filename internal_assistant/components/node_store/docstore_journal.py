@@ -0,0 +1,232 @@
+"""Append-only journal for the simple docstore.
+
+Persisting a ``SimpleDocumentStore`` rewrites the whole ``docstore.json`` file,
+so saving after every ingested file costs O(N) bytes each time. The
+``JournaledKVStore`` records every put/delete as a JSON line in
+``docstore.journal`` instead, and only rewrites the snapshot when the journal
+has grown past a fraction of the snapshot size (compaction).
+
+On startup the journal is replayed on top of the snapshot. Puts and deletes
+carry full values, so replaying a journal over a snapshot that already
+contains some of its operations is idempotent; a crash between writing the
+snapshot and truncating the journal is therefore safe. A torn trailing line
+left by a crash mid-write is ignored.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from llama_index.core.storage.kvstore.simple_kvstore import SimpleKVStore
+from llama_index.core.storage.kvstore.types import DEFAULT_COLLECTION
+
+if TYPE_CHECKING:
+    import fsspec
+    from llama_index.core.storage.docstore import SimpleDocumentStore
+
+logger = logging.getLogger(__name__)
+
+DOCSTORE_SNAPSHOT_FILE = "docstore.json"
+DOCSTORE_JOURNAL_FILE = "docstore.journal"
+
+# Never compact journals smaller than this, whatever the snapshot size
+_MIN_COMPACTION_BYTES = 8 * 1024 * 1024
+
+
+class JournaledKVStore(SimpleKVStore):
+    """SimpleKVStore that journals mutations instead of rewriting its snapshot.
+
+    Mutations are buffered in memory and appended to the journal by
+    ``commit()``. ``persist()`` writes a full snapshot and truncates the journal.
+    """
+
+    def __init__(
+        self,
+        data: dict[str, dict[str, dict]] | None = None,
+        journal_path: Path | None = None,
+        snapshot_path: Path | None = None,
+        compaction_ratio: float = 0.5,
+    ) -> None:
+        super().__init__(data)
+        self.journal_path = journal_path
+        self.snapshot_path = snapshot_path
+        self.compaction_ratio = compaction_ratio
+        self._pending: list[str] = []
+        self._journal_lock = threading.Lock()
+
+    # Mutations
+
+    def put(self, key: str, val: dict, collection: str = DEFAULT_COLLECTION) -> None:
+        super().put(key, val, collection)
+        self._record({"op": "put", "c": collection, "k": key, "v": val})
+
+    def put_all(
+        self,
+        kv_pairs: list[tuple[str, dict]],
+        collection: str = DEFAULT_COLLECTION,
+        batch_size: int = 1,
+    ) -> None:
+        """Put every pair and journal them with one buffer append."""
+        entries = []
+        for key, val in kv_pairs:
+            super().put(key, val, collection)
+            entries.append({"op": "put", "c": collection, "k": key, "v": val})
+        self._record_many(entries)
+
+    def delete(self, key: str, collection: str = DEFAULT_COLLECTION) -> bool:
+        deleted = super().delete(key, collection)
+        if deleted:
+            self._record({"op": "del", "c": collection, "k": key})
+        return deleted
+
+    def _record(self, entry: dict[str, Any]) -> None:
+        self._record_many([entry])
+
+    def _record_many(self, entries: list[dict[str, Any]]) -> None:
+        if self.journal_path is None or not entries:
+            return
+        lines = [json.dumps(entry) for entry in entries]
+        with self._journal_lock:
+            self._pending.extend(lines)
+
+    # Journal
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def commit(self) -> int:
+        """Append buffered mutations to the journal and fsync it.
+
+        Returns:
+            Number of bytes appended to the journal.
+        """
+        if self.journal_path is None:
+            return 0
+        with self._journal_lock:
+            if not self._pending:
+                return 0
+            payload = "\n".join(self._pending) + "\n"
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending.clear()
+        logger.debug("Committed %d bytes to %s", len(payload), self.journal_path)
+        return len(payload)
+
+    def replay(self) -> int:
+        """Apply the journal on top of the current data.
+
+        Returns:
+            Number of journal entries applied.
+        """
+        if self.journal_path is None or not self.journal_path.exists():
+            return 0
+        applied = 0
+        with open(self.journal_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Only the last line can be torn by a crash mid-append
+                    logger.warning(
+                        "Ignoring unreadable docstore journal entry at line %d",
+                        line_number,
+                    )
+                    continue
+                if entry.get("op") == "put":
+                    super().put(entry["k"], entry["v"], entry["c"])
+                elif entry.get("op") == "del":
+                    super().delete(entry["k"], entry["c"])
+                applied += 1
+        if applied:
+            logger.info("Replayed %d docstore journal entries", applied)
+        return applied
+
+    def reload(self) -> bool:
+        """Re-read the snapshot and journal written by another process.
+
+        Skipped while local mutations are waiting to be committed, since
+        reloading would drop them.
+        """
+        if self.has_pending:
+            return False
+        data: dict[str, dict[str, dict]] = {}
+        if self.snapshot_path is not None and self.snapshot_path.exists():
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                data = json.load(f)
+        self._data = data
+        self.replay()
+        return True
+
+    def journal_size(self) -> int:
+        try:
+            return self.journal_path.stat().st_size if self.journal_path else 0
+        except OSError:
+            return 0
+
+    def needs_compaction(self) -> bool:
+        """Whether the journal has outgrown its share of the snapshot size."""
+        snapshot_size = 0
+        if self.snapshot_path is not None:
+            try:
+                snapshot_size = self.snapshot_path.stat().st_size
+            except OSError:
+                snapshot_size = 0
+        threshold = max(_MIN_COMPACTION_BYTES, snapshot_size * self.compaction_ratio)
+        return self.journal_size() > threshold
+
+    # Snapshot
+
+    def persist(
+        self, persist_path: str, fs: "fsspec.AbstractFileSystem | None" = None
+    ) -> None:
+        """Write a full snapshot atomically, then truncate the journal."""
+        truncate_journal = self.journal_path is not None and (
+            self.snapshot_path is None
+            or Path(persist_path).resolve() == self.snapshot_path.resolve()
+        )
+        # Hold the journal lock so no mutation is recorded between the snapshot
+        # being serialized and the journal being truncated
+        with self._journal_lock:
+            if fs is not None:
+                super().persist(persist_path, fs=fs)
+            else:
+                path = Path(persist_path)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(path.name + ".tmp")
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(self._data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, path)
+
+            if truncate_journal:
+                self._pending.clear()
+                if self.journal_path.exists():
+                    self.journal_path.unlink()
+                logger.info("Compacted docstore journal into %s", persist_path)
+
+
+def attach_journal(
+    doc_store: "SimpleDocumentStore",
+    persist_dir: Path,
+    compaction_ratio: float = 0.5,
+) -> JournaledKVStore:
+    """Swap the docstore's kvstore for a journaled one and replay the journal."""
+    kvstore = JournaledKVStore(
+        data=doc_store._kvstore.to_dict(),
+        journal_path=persist_dir / DOCSTORE_JOURNAL_FILE,
+        snapshot_path=persist_dir / DOCSTORE_SNAPSHOT_FILE,
+        compaction_ratio=compaction_ratio,
+    )
+    kvstore.replay()
+    doc_store._kvstore = kvstore
+    return kvstore
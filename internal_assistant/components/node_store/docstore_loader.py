@@ -0,0 +1,129 @@
+"""Single-pass loader for the simple docstore.
+
+``docstore.json`` can grow to hundreds of megabytes. The loader parses it
+exactly once, builds the key-value store directly from the parsed data and
+derives the startup diagnostics (collection sizes, missing collections) from
+that same pass, instead of re-reading the file for each check.
+
+Nodes are kept as their serialized dicts in the key-value store and are only
+turned into ``BaseNode`` objects when ``get_node``/``get_nodes`` asks for
+them. Code that only needs metadata should use ``iter_node_metadata`` so that
+no node is materialized at all.
+"""
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from llama_index.core.storage.docstore import BaseDocumentStore, SimpleDocumentStore
+from llama_index.core.storage.kvstore.simple_kvstore import SimpleKVStore
+
+from internal_assistant.components.node_store.docstore_journal import (
+    DOCSTORE_JOURNAL_FILE,
+    DOCSTORE_SNAPSHOT_FILE,
+    JournaledKVStore,
+)
+
+logger = logging.getLogger(__name__)
+
+NODE_COLLECTION = "docstore/data"
+METADATA_COLLECTION = "docstore/metadata"
+REF_DOC_COLLECTION = "docstore/ref_doc_info"
+
+_EXPECTED_COLLECTIONS = (NODE_COLLECTION, METADATA_COLLECTION, REF_DOC_COLLECTION)
+
+
+@dataclass
+class DocstoreLoadStats:
+    """Diagnostics gathered while loading the docstore."""
+
+    file_size: int = 0
+    collection_sizes: dict[str, int] = field(default_factory=dict)
+    missing_collections: list[str] = field(default_factory=list)
+    journal_entries: int = 0
+    load_seconds: float = 0.0
+
+    @property
+    def node_count(self) -> int:
+        return self.collection_sizes.get(NODE_COLLECTION, 0)
+
+    @property
+    def ref_doc_count(self) -> int:
+        return self.collection_sizes.get(REF_DOC_COLLECTION, 0)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.node_count == 0 and self.ref_doc_count == 0
+
+
+def load_simple_docstore(
+    persist_dir: Path,
+    journal_enabled: bool = True,
+    compaction_ratio: float = 0.5,
+) -> tuple[SimpleDocumentStore, DocstoreLoadStats]:
+    """Load ``docstore.json`` (and its journal) from ``persist_dir`` in one pass.
+
+    Raises:
+        FileNotFoundError: if neither the snapshot nor the journal exists.
+        json.JSONDecodeError: if the snapshot is not valid JSON.
+    """
+    start = time.perf_counter()
+    snapshot_path = persist_dir / DOCSTORE_SNAPSHOT_FILE
+    journal_path = persist_dir / DOCSTORE_JOURNAL_FILE
+    stats = DocstoreLoadStats()
+
+    data: dict[str, dict[str, dict]] = {}
+    if snapshot_path.exists():
+        stats.file_size = snapshot_path.stat().st_size
+        with open(snapshot_path, "rb") as f:
+            data = json.load(f)
+    elif not (journal_enabled and journal_path.exists()):
+        raise FileNotFoundError(f"No docstore found in {persist_dir}")
+
+    kvstore: SimpleKVStore
+    if journal_enabled:
+        kvstore = JournaledKVStore(
+            data=data,
+            journal_path=journal_path,
+            snapshot_path=snapshot_path,
+            compaction_ratio=compaction_ratio,
+        )
+        stats.journal_entries = kvstore.replay()
+    else:
+        kvstore = SimpleKVStore(data)
+
+    # Count from the live data so journal replay is reflected
+    live_data = kvstore.to_dict()
+    for collection in _EXPECTED_COLLECTIONS:
+        if collection in live_data:
+            stats.collection_sizes[collection] = len(live_data[collection])
+        else:
+            stats.missing_collections.append(collection)
+
+    stats.load_seconds = time.perf_counter() - start
+    return SimpleDocumentStore(simple_kvstore=kvstore), stats
+
+
+def iter_node_metadata(doc_store: BaseDocumentStore) -> Iterator[dict[str, Any]]:
+    """Yield the metadata of every stored node without materializing nodes.
+
+    Falls back to decoding nodes for docstores that are not key-value backed.
+    """
+    kvstore = getattr(doc_store, "_kvstore", None)
+    collection = getattr(doc_store, "_node_collection", None)
+    if not isinstance(kvstore, SimpleKVStore) or collection is None:
+        for node in doc_store.docs.values():
+            yield node.metadata or {}
+        return
+
+    # Snapshot the values so concurrent ingestion cannot resize the dict
+    for payload in list(kvstore.to_dict().get(collection, {}).values()):
+        # Serialized nodes look like {"__type__": ..., "__data__": {...}}
+        node_data = payload.get("__data__", payload)
+        if isinstance(node_data, str):
+            node_data = json.loads(node_data)
+        yield node_data.get("metadata") or {}
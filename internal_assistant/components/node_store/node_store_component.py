@@ -1,3 +1,4 @@
+import json
 import logging
 
 from injector import inject, singleton
@@ -5,6 +6,13 @@ from llama_index.core.storage.docstore import BaseDocumentStore, SimpleDocumentS
 from llama_index.core.storage.index_store import SimpleIndexStore
 from llama_index.core.storage.index_store.types import BaseIndexStore
 
+from internal_assistant.components.node_store.docstore_journal import (
+    DOCSTORE_SNAPSHOT_FILE,
+    attach_journal,
+)
+from internal_assistant.components.node_store.docstore_loader import (
+    load_simple_docstore,
+)
 from internal_assistant.paths import local_data_path
 from internal_assistant.settings.settings import Settings
 
@@ -28,197 +36,55 @@ class NodeStoreComponent:
                     logger.debug("Local index store not found, creating a new one")
                     self.index_store = SimpleIndexStore()
 
+                docstore_path = local_data_path / DOCSTORE_SNAPSHOT_FILE
+                logger.info(
+                    f"📖 [DOCSTORE_LOAD] Loading docstore from: {docstore_path}"
+                )
                 try:
-                    import json
-                    import os
-
-                    docstore_path = os.path.join(str(local_data_path), "docstore.json")
-                    logger.info(
-                        f"📖 [DOCSTORE_LOAD] Loading docstore from: {docstore_path}"
+                    self.doc_store, stats = load_simple_docstore(
+                        local_data_path.path,
+                        journal_enabled=settings.nodestore.journal_enabled,
+                        compaction_ratio=settings.nodestore.journal_compaction_ratio,
                     )
                     logger.info(
-                        f"📖 [DOCSTORE_LOAD] File exists: {os.path.exists(docstore_path)}"
+                        f"📖 [DOCSTORE_LOAD] Parsed {stats.file_size} bytes in "
+                        f"{stats.load_seconds:.2f}s ({stats.journal_entries} journal entries replayed)"
                     )
-
-                    # Check if file exists and log its size
-                    if os.path.exists(docstore_path):
-                        file_size = os.path.getsize(docstore_path)
-                        logger.info(f"📖 [DOCSTORE_LOAD] File size: {file_size} bytes")
-
-                        # Read and inspect the raw JSON to understand structure
-                        try:
-                            with open(docstore_path) as f:
-                                raw_data = json.load(f)
-                                logger.info(
-                                    f"📖 [DOCSTORE_LOAD] JSON keys in file: {list(raw_data.keys())}"
-                                )
-
-                                # Check each collection
-                                for key in [
-                                    "docstore/data",
-                                    "docstore/metadata",
-                                    "docstore/ref_doc_info",
-                                ]:
-                                    if key in raw_data:
-                                        count = len(raw_data[key])
-                                        logger.info(
-                                            f"📖 [DOCSTORE_LOAD] Collection '{key}' has {count} entries in file"
-                                        )
-                                    else:
-                                        logger.warning(
-                                            f"⚠️ [DOCSTORE_LOAD] Collection '{key}' MISSING from file!"
-                                        )
-                        except Exception as e:
-                            logger.error(
-                                f"❌ [DOCSTORE_LOAD] Error reading JSON file: {e}"
-                            )
-
-                    # Now load using SimpleDocumentStore
-                    self.doc_store = SimpleDocumentStore.from_persist_dir(
-                        persist_dir=str(local_data_path)
-                    )
-                    logger.info(
-                        "📖 [DOCSTORE_LOAD] SimpleDocumentStore.from_persist_dir() completed"
-                    )
-
-                    # CRITICAL FIX: Verify docstore actually loaded the data
-                    # Check what's in memory after loading
-                    try:
-                        ref_doc_info = self.doc_store.get_all_ref_doc_info()
-                        doc_hashes = self.doc_store.get_all_document_hashes()
-
+                    for collection, count in stats.collection_sizes.items():
                         logger.info(
-                            f"📖 [DOCSTORE_LOAD] After loading - ref_doc_info count: {len(ref_doc_info) if ref_doc_info else 0}"
+                            f"📖 [DOCSTORE_LOAD] Collection '{collection}' has {count} entries"
                         )
-                        logger.info(
-                            f"📖 [DOCSTORE_LOAD] After loading - doc_hashes count: {len(doc_hashes) if doc_hashes else 0}"
+                    for collection in stats.missing_collections:
+                        logger.warning(
+                            f"⚠️ [DOCSTORE_LOAD] Collection '{collection}' MISSING from file!"
                         )
 
-                        # Check the internal _data structure
-                        if hasattr(self.doc_store, "_data"):
-                            logger.info(
-                                f"📖 [DOCSTORE_LOAD] Internal _data keys: {list(self.doc_store._data.keys())}"
-                            )
-                            for key in self.doc_store._data.keys():
-                                logger.info(
-                                    f"📖 [DOCSTORE_LOAD] Internal _data['{key}'] has {len(self.doc_store._data[key])} entries"
-                                )
-
-                        # If file had data but memory doesn't, this is the BUG!
-                        if os.path.exists(docstore_path):
-                            with open(docstore_path) as f:
-                                raw_data = json.load(f)
-                                file_has_ref_docs = (
-                                    "docstore/ref_doc_info" in raw_data
-                                    and len(raw_data["docstore/ref_doc_info"]) > 0
-                                )
-                                memory_has_ref_docs = (
-                                    ref_doc_info and len(ref_doc_info) > 0
-                                )
-
-                                if file_has_ref_docs and not memory_has_ref_docs:
-                                    logger.error(
-                                        "❌ [DOCSTORE_BUG] CRITICAL: File has ref_doc_info but memory doesn't!"
-                                    )
-                                    logger.error(
-                                        f"❌ [DOCSTORE_BUG] File has {len(raw_data['docstore/ref_doc_info'])} entries"
-                                    )
-                                    logger.error(
-                                        "❌ [DOCSTORE_BUG] Memory has 0 entries"
-                                    )
-                                    logger.error(
-                                        "❌ [DOCSTORE_BUG] SimpleDocumentStore.from_persist_dir() failed to load data!"
-                                    )
-
-                                    # FALLBACK: Manually populate the docstore from file
-                                    logger.info(
-                                        "🔧 [DOCSTORE_FIX] Attempting manual data load from file..."
-                                    )
-                                    try:
-                                        # Access the internal KV store and populate it directly
-                                        if hasattr(self.doc_store, "_data"):
-                                            self.doc_store._data = raw_data
-                                            logger.info(
-                                                "✅ [DOCSTORE_FIX] Manually loaded data into docstore._data"
-                                            )
-
-                                            # Re-verify
-                                            ref_doc_info = (
-                                                self.doc_store.get_all_ref_doc_info()
-                                            )
-                                            logger.info(
-                                                f"✅ [DOCSTORE_FIX] After manual load: {len(ref_doc_info)} documents"
-                                            )
-                                        else:
-                                            logger.error(
-                                                "❌ [DOCSTORE_FIX] Cannot access _data attribute for manual load"
-                                            )
-                                    except Exception as fix_error:
-                                        logger.error(
-                                            f"❌ [DOCSTORE_FIX] Manual load failed: {fix_error}"
-                                        )
-
-                        if not ref_doc_info and not doc_hashes:
-                            logger.warning(
-                                "⚠️ [DOCSTORE_FIX] Docstore is empty after load - will create fresh docstore"
-                            )
-
-                            if os.path.exists(docstore_path):
-                                os.remove(docstore_path)
-                                logger.info(
-                                    "✅ [DOCSTORE_FIX] Deleted empty docstore.json"
-                                )
-
-                            # Let FileNotFoundError handler create it properly
-                            raise FileNotFoundError(
-                                "Empty docstore detected and removed"
-                            )
-                        else:
-                            logger.info(
-                                f"✅ [DOCSTORE_CHECK] Docstore loaded successfully with {len(ref_doc_info)} documents"
-                            )
-
-                            # Log first few document file names for verification
-                            if ref_doc_info:
-                                count = 0
-                                for doc_id, ref_info in ref_doc_info.items():
-                                    if (
-                                        count < 3
-                                        and hasattr(ref_info, "metadata")
-                                        and ref_info.metadata
-                                    ):
-                                        file_name = ref_info.metadata.get(
-                                            "file_name", "Unknown"
-                                        )
-                                        page = ref_info.metadata.get("page_label", "?")
-                                        logger.info(
-                                            f"✅ [DOCSTORE_CHECK] Document {count+1}: {file_name} (page {page})"
-                                        )
-                                        count += 1
-
-                    except FileNotFoundError:
-                        # Re-raise to let outer handler create fresh docstore
-                        raise
-                    except Exception as e:
-                        logger.error(
-                            f"❌ [DOCSTORE_LOAD] Error checking docstore state: {e}",
-                            exc_info=True,
-                        )
-
-                        if os.path.exists(docstore_path):
-                            os.remove(docstore_path)
-                            logger.info(
-                                "✅ [DOCSTORE_FIX] Deleted potentially corrupt docstore.json"
-                            )
-
-                        # Let FileNotFoundError handler create it properly
-                        raise FileNotFoundError(
-                            "Docstore error detected, removed file for recreation"
+                    if stats.is_empty:
+                        logger.warning(
+                            "⚠️ [DOCSTORE_FIX] Docstore is empty after load - will create fresh docstore"
                         )
+                        if docstore_path.exists() and not stats.journal_entries:
+                            docstore_path.unlink()
+                            logger.info("✅ [DOCSTORE_FIX] Deleted empty docstore.json")
+                        raise FileNotFoundError("Empty docstore detected")
 
+                    logger.info(
+                        f"✅ [DOCSTORE_CHECK] Docstore loaded successfully with {stats.ref_doc_count} documents"
+                    )
+                except json.JSONDecodeError as e:
+                    # Never delete a docstore we could not read: it may only be
+                    # recoverable by hand, so fail loudly instead
+                    logger.error(f"❌ [DOCSTORE_LOAD] Error reading JSON file: {e}")
+                    raise
                 except FileNotFoundError:
                     logger.debug("Local document store not found, creating a new one")
                     self.doc_store = SimpleDocumentStore()
+                    if settings.nodestore.journal_enabled:
+                        attach_journal(
+                            self.doc_store,
+                            local_data_path.path,
+                            compaction_ratio=settings.nodestore.journal_compaction_ratio,
+                        )
 
             case "postgres":
                 try:
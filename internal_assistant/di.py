@@ -8,9 +8,18 @@ def create_application_injector() -> Injector:
     _injector.binder.bind(Settings, to=unsafe_typed_settings)
 
     # Bind RSS feed service as singleton to maintain cache across requests
+    from internal_assistant.paths import _absolute_or_from_project_root
+    from internal_assistant.server.feeds.feed_store import FEED_STORE_FILE, FeedStore
     from internal_assistant.server.feeds.feeds_service import RSSFeedService
 
-    _injector.binder.bind(RSSFeedService, to=RSSFeedService(), scope=singleton)
+    feed_store = FeedStore(
+        _absolute_or_from_project_root(unsafe_typed_settings.data.local_data_folder)
+        / "feeds"
+        / FEED_STORE_FILE
+    )
+    _injector.binder.bind(
+        RSSFeedService, to=RSSFeedService(store=feed_store), scope=singleton
+    )
 
     return _injector
 
@@ -1,46 +1,200 @@
 """FastAPI app creation, logger configuration and main API routes."""
 
+import asyncio
+import importlib
+import importlib.util
 import logging
+import threading
+import time
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
 
-from fastapi import Depends, FastAPI, Request
+import anyio
+from fastapi import APIRouter, Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from injector import Injector
+from starlette.routing import Mount
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-from internal_assistant.server.chat.chat_router import chat_router
-from internal_assistant.server.chunks.chunks_router import chunks_router
-from internal_assistant.server.completions.completions_router import completions_router
-from internal_assistant.server.embeddings.embeddings_router import embeddings_router
-from internal_assistant.server.feeds.background_refresh import BackgroundRefreshService
-from internal_assistant.server.feeds.feeds_router import feeds_router
-from internal_assistant.server.feeds.feeds_service import RSSFeedService
-from internal_assistant.server.feeds.threat_intelligence_router import (
-    threat_intelligence_router,
-)
-from internal_assistant.server.health.health_router import health_router
-from internal_assistant.server.ingest.ingest_router import ingest_router
-from internal_assistant.server.metadata.metadata_router import metadata_router
-from internal_assistant.server.recipes.summarize.summarize_router import (
-    summarize_router,
-)
-from internal_assistant.server.status.status_router import status_router
-from internal_assistant.server.system.system_router import system_router
-from internal_assistant.server.threat_intelligence.mitre_attack_router import (
-    mitre_attack_router,
-)
 from internal_assistant.settings.settings import Settings
+from internal_assistant.utils.startup_timer import startup_timer
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class RouterSpec:
+    """An API router, imported by module path so it can be loaded lazily."""
+
+    module: str
+    name: str
+    # Requests under this path load the router in lazy startup mode
+    path_prefix: str
+
+    def load(self) -> APIRouter:
+        return getattr(importlib.import_module(self.module), self.name)
+
+
+# Registration order of the API routers
+ROUTERS: list[RouterSpec] = [
+    RouterSpec(
+        "internal_assistant.server.completions.completions_router",
+        "completions_router",
+        "/v1/",
+    ),
+    RouterSpec("internal_assistant.server.chat.chat_router", "chat_router", "/v1/"),
+    RouterSpec(
+        "internal_assistant.server.chunks.chunks_router", "chunks_router", "/v1/"
+    ),
+    RouterSpec(
+        "internal_assistant.server.ingest.ingest_router", "ingest_router", "/v1/"
+    ),
+    RouterSpec(
+        "internal_assistant.server.recipes.summarize.summarize_router",
+        "summarize_router",
+        "/v1/",
+    ),
+    RouterSpec(
+        "internal_assistant.server.embeddings.embeddings_router",
+        "embeddings_router",
+        "/v1/",
+    ),
+    RouterSpec(
+        "internal_assistant.server.feeds.feeds_router", "feeds_router", "/v1/feeds"
+    ),
+    # Threat Intelligence endpoints
+    RouterSpec(
+        "internal_assistant.server.feeds.threat_intelligence_router",
+        "threat_intelligence_router",
+        "/v1/threat-intelligence",
+    ),
+    # MITRE ATT&CK endpoints
+    RouterSpec(
+        "internal_assistant.server.threat_intelligence.mitre_attack_router",
+        "mitre_attack_router",
+        "/v1/mitre-attack",
+    ),
+    RouterSpec(
+        "internal_assistant.server.health.health_router", "health_router", "/health"
+    ),
+    RouterSpec(
+        "internal_assistant.server.system.system_router", "system_router", "/v1/system"
+    ),
+    RouterSpec(
+        "internal_assistant.server.metadata.metadata_router",
+        "metadata_router",
+        "/metadata",
+    ),
+    RouterSpec(
+        "internal_assistant.server.status.status_router", "status_router", "/status"
+    ),
+]
+
+# Paths that need every router, to describe the whole API
+_API_DOCS_PATHS = ("/docs", "/redoc", "/openapi.json")
+
+
+class LazyRouterLoader:
+    """Includes API routers in the app on the first request to their paths."""
+
+    def __init__(self, app: FastAPI, routers: list[RouterSpec]) -> None:
+        self.app = app
+        self.pending = list(routers)
+        self._lock = threading.Lock()
+
+    def load_for_path(self, path: str) -> None:
+        with self._lock:
+            everything = path.startswith(_API_DOCS_PATHS)
+            matched = [
+                spec
+                for spec in self.pending
+                if everything or path.startswith(spec.path_prefix)
+            ]
+            if not matched:
+                return
+
+            start = time.perf_counter()
+            for spec in matched:
+                self.app.include_router(spec.load())
+                self.pending.remove(spec)
+            # Routers added after a mount would be shadowed by it (the UI is
+            # usually mounted at "/"), so keep mounts last. The event loop
+            # routes requests concurrently and list.sort() empties the list
+            # while it runs, so swap the sorted routes in with one assignment
+            self.app.router.routes[:] = sorted(
+                self.app.router.routes, key=lambda route: isinstance(route, Mount)
+            )
+            self.app.openapi_schema = None
+            logger.info(
+                f"⏱️ [STARTUP] Loaded {len(matched)} routers for {path} "
+                f"in {time.perf_counter() - start:.2f}s"
+            )
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware loading the routers a request needs before routing it."""
+
+    def __init__(self, app: ASGIApp, loader: LazyRouterLoader) -> None:
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and self.loader.pending:
+            # Router modules import heavy dependencies; keep the loop responsive
+            await anyio.to_thread.run_sync(self.loader.load_for_path, scope["path"])
+        await self.app(scope, receive, send)
+
+
+class LazyUIApp:
+    """Builds and mounts the Gradio UI on the first request to its path."""
+
+    def __init__(self, root_injector: Injector) -> None:
+        self.root_injector = root_injector
+        self._app: ASGIApp | None = None
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            return
+        if self._app is None:
+            async with self._lock:
+                if self._app is None:
+                    start = time.perf_counter()
+                    app, blocks = await anyio.to_thread.run_sync(self._build)
+                    # Mounted apps do not receive lifespan events; start the
+                    # Gradio queue here, on the event loop
+                    blocks.startup_events()
+                    self._app = app
+                    logger.info(
+                        f"⏱️ [STARTUP] UI built on first request "
+                        f"in {time.perf_counter() - start:.2f}s"
+                    )
+        await self._app(scope, receive, send)
+
+    def _build(self) -> tuple[ASGIApp, Any]:
+        app = FastAPI()
+        _mount_ui(app, self.root_injector, "/")
+        gradio_app = app.router.routes[-1].app
+        return app, gradio_app.get_blocks()
+
+
 def create_app(root_injector: Injector) -> FastAPI:
+    settings = root_injector.get(Settings)
+    lazy_startup = settings.server.lazy_startup
+
     # Global reference to background service for lifecycle management
     background_service_instance = None
 
-    @asynccontextmanager
-    async def lifespan(app: FastAPI):
-        """Manage application lifecycle - startup and shutdown."""
+    async def start_background_services() -> None:
         nonlocal background_service_instance
+        from internal_assistant.server.feeds.background_refresh import (
+            BackgroundRefreshService,
+        )
+        from internal_assistant.server.feeds.feeds_service import RSSFeedService
+        from internal_assistant.server.threat_intelligence.mitre_knowledge_base import (
+            MitreKnowledgeBase,
+        )
 
         # Startup: Initialize and start background feed refresh
         logger.info("🚀 Starting background RSS feed refresh service...")
@@ -55,8 +209,32 @@ def create_app(root_injector: Injector) -> FastAPI:
             logger.error(f"⚠️ Failed to start background feed refresh: {e}")
             # Don't fail app startup if feed refresh fails
 
+        # Load the MITRE ATT&CK knowledge base from disk; refreshes run in the background
+        try:
+            await root_injector.get(MitreKnowledgeBase).start()
+        except Exception as e:
+            logger.error(f"⚠️ Failed to start MITRE ATT&CK knowledge base: {e}")
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """Manage application lifecycle - startup and shutdown."""
+        if lazy_startup:
+            # Serve requests while the background services start
+            startup_task = asyncio.create_task(start_background_services())
+        else:
+            await start_background_services()
+
         yield
 
+        if lazy_startup:
+            await startup_task
+
+        from internal_assistant.server.threat_intelligence.mitre_knowledge_base import (
+            MitreKnowledgeBase,
+        )
+
+        await root_injector.get(MitreKnowledgeBase).stop()
+
         # Shutdown: Stop background service gracefully
         if background_service_instance:
             logger.info("🛑 Stopping background feed refresh service...")
@@ -72,19 +250,13 @@ def create_app(root_injector: Injector) -> FastAPI:
 
     app = FastAPI(dependencies=[Depends(bind_injector_to_request)], lifespan=lifespan)
 
-    app.include_router(completions_router)
-    app.include_router(chat_router)
-    app.include_router(chunks_router)
-    app.include_router(ingest_router)
-    app.include_router(summarize_router)
-    app.include_router(embeddings_router)
-    app.include_router(feeds_router)
-    app.include_router(threat_intelligence_router)  # Threat Intelligence endpoints
-    app.include_router(mitre_attack_router)  # MITRE ATT&CK endpoints
-    app.include_router(health_router)
-    app.include_router(system_router)
-    app.include_router(metadata_router)
-    app.include_router(status_router)
+    if lazy_startup:
+        logger.info("⏱️ [STARTUP] Lazy startup: routers load on first request")
+        app.add_middleware(LazyRouterMiddleware, loader=LazyRouterLoader(app, ROUTERS))
+    else:
+        with startup_timer.phase("routers"):
+            for spec in ROUTERS:
+                app.include_router(spec.load())
 
     # Disable LlamaIndex observability to prevent token-by-token debug output
     # that interferes with streaming responses
@@ -92,7 +264,6 @@ def create_app(root_injector: Injector) -> FastAPI:
     # if global_handler:
     #     LlamaIndexSettings.callback_manager = CallbackManager([global_handler])
 
-    settings = root_injector.get(Settings)
     if settings.server.cors.enabled:
         logger.debug("Setting up CORS middleware")
         app.add_middleware(
@@ -136,24 +307,40 @@ def create_app(root_injector: Injector) -> FastAPI:
         except Exception as e:
             logger.warning(f"Failed to apply Gradio Pydantic configuration: {e}")
 
-        logger.debug("Importing the UI module")
-        try:
-            from internal_assistant.ui.ui import InternalAssistantUI
-        except ImportError as e:
-            raise ImportError(
-                "UI dependencies not found, install with `poetry install --extras ui`"
-            ) from e
+        if lazy_startup:
+            if importlib.util.find_spec("gradio") is None:
+                raise ImportError(
+                    "UI dependencies not found, install with `poetry install --extras ui`"
+                )
+            app.mount(settings.ui.path, LazyUIApp(root_injector))
+            logger.info(
+                "UI will be built on first request at path=%s", settings.ui.path
+            )
+        else:
+            with startup_timer.phase("ui"):
+                _mount_ui(app, root_injector, settings.ui.path)
 
-        logger.info("🔧 Getting UI instance from injector...")
-        ui = root_injector.get(InternalAssistantUI)
-        logger.info("✅ UI instance created successfully")
+    startup_timer.log_breakdown()
+    return app
 
-        logger.info("🚀 Mounting UI in FastAPI app...")
-        try:
-            ui.mount_in_app(app, settings.ui.path)
-            logger.info("UI successfully mounted at path=%s", settings.ui.path)
-        except Exception as e:
-            logger.error(f"Failed to mount UI: {e}", exc_info=True)
-            raise
 
-    return app
+def _mount_ui(app: FastAPI, root_injector: Injector, path: str) -> None:
+    logger.debug("Importing the UI module")
+    try:
+        from internal_assistant.ui.ui import InternalAssistantUI
+    except ImportError as e:
+        raise ImportError(
+            "UI dependencies not found, install with `poetry install --extras ui`"
+        ) from e
+
+    logger.info("🔧 Getting UI instance from injector...")
+    ui = root_injector.get(InternalAssistantUI)
+    logger.info("✅ UI instance created successfully")
+
+    logger.info("🚀 Mounting UI in FastAPI app...")
+    try:
+        ui.mount_in_app(app, path)
+        logger.info("UI successfully mounted at path=%s", path)
+    except Exception as e:
+        logger.error(f"Failed to mount UI: {e}", exc_info=True)
+        raise
@@ -1,4 +1,19 @@
 """internal-assistant server."""
 
-from internal_assistant.server.metadata.metadata_router import metadata_router
-from internal_assistant.server.status.status_router import status_router
+import importlib
+from typing import Any
+
+# Routers re-exported here are imported on first access, so importing any
+# server module does not pull in every router's dependencies
+_LAZY_EXPORTS = {
+    "metadata_router": "internal_assistant.server.metadata.metadata_router",
+    "status_router": "internal_assistant.server.status.status_router",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,3 +1,6 @@
+import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -8,6 +11,7 @@ from llama_index.core.chat_engine.types import (
 )
 from llama_index.core.indices import VectorStoreIndex
 from llama_index.core.indices.postprocessor import MetadataReplacementPostProcessor
+from llama_index.core.indices.vector_store.retrievers import VectorIndexRetriever
 from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.postprocessor import (
     SentenceTransformerRerank,
@@ -21,6 +25,7 @@ from internal_assistant.components.embedding.embedding_component import (
     EmbeddingComponent,
 )
 from internal_assistant.components.llm.llm_component import LLMComponent
+from internal_assistant.components.node_store.docstore_loader import iter_node_metadata
 from internal_assistant.components.node_store.node_store_component import (
     NodeStoreComponent,
 )
@@ -28,12 +33,22 @@ from internal_assistant.components.vector_store.vector_store_component import (
     VectorStoreComponent,
 )
 from internal_assistant.open_ai.extensions.context_filter import ContextFilter
+from internal_assistant.server.chat.response_cache import (
+    CacheScope,
+    ResponseCache,
+    replay_as_stream,
+)
 from internal_assistant.server.chunks.chunks_service import Chunk
 from internal_assistant.settings.settings import Settings
 
 if TYPE_CHECKING:
     from llama_index.core.postprocessor.types import BaseNodePostprocessor
 
+logger = logging.getLogger(__name__)
+
+# Distinct (doc_ids, top_k) retrievers kept alive between requests
+_RETRIEVER_CACHE_SIZE = 32
+
 
 class Completion(BaseModel):
     response: str
@@ -93,8 +108,10 @@ class ChatService:
         vector_store_component: VectorStoreComponent,
         embedding_component: EmbeddingComponent,
         node_store_component: NodeStoreComponent,
+        response_cache: ResponseCache,
     ) -> None:
         self.settings = settings
+        self.response_cache = response_cache
         self.llm_component = llm_component
         self.embedding_component = embedding_component
         self.vector_store_component = vector_store_component
@@ -110,20 +127,78 @@ class ChatService:
             embed_model=embedding_component.embedding_model,
             show_progress=True,
         )
+        # Engine components are reused across requests; the chat engine itself
+        # is still built per request since it carries the conversation memory
+        self._retriever_cache: OrderedDict[
+            tuple[tuple[str, ...] | None, int], VectorIndexRetriever
+        ] = OrderedDict()
+        self._node_postprocessors: list[BaseNodePostprocessor] | None = None
+        self._engine_components_lock = threading.Lock()
+
+    def _get_retriever(
+        self, context_filter: ContextFilter | None, similarity_top_k: int
+    ) -> VectorIndexRetriever:
+        """Return a shared retriever for this filter and top_k, creating it once."""
+        doc_ids = (
+            tuple(sorted(context_filter.docs_ids))
+            if context_filter and context_filter.docs_ids is not None
+            else None
+        )
+        key = (doc_ids, similarity_top_k)
+        with self._engine_components_lock:
+            retriever = self._retriever_cache.get(key)
+            if retriever is not None:
+                self._retriever_cache.move_to_end(key)
+                return retriever
+
+            retriever = self.vector_store_component.get_retriever(
+                index=self.index,
+                context_filter=context_filter,
+                similarity_top_k=similarity_top_k,
+            )
+            self._retriever_cache[key] = retriever
+            if len(self._retriever_cache) > _RETRIEVER_CACHE_SIZE:
+                self._retriever_cache.popitem(last=False)
+            return retriever
+
+    def _get_node_postprocessors(self) -> list["BaseNodePostprocessor"]:
+        """Return the node postprocessors, loading the rerank model only once."""
+        with self._engine_components_lock:
+            if self._node_postprocessors is None:
+                settings = self.settings
+                node_postprocessors: list[BaseNodePostprocessor] = [
+                    MetadataReplacementPostProcessor(target_metadata_key="window"),
+                ]
+                if settings.rag.similarity_value:
+                    node_postprocessors.append(
+                        SimilarityPostprocessor(
+                            similarity_cutoff=settings.rag.similarity_value
+                        )
+                    )
+
+                if settings.rag.rerank.enabled:
+                    logger.info(f"Loading rerank model {settings.rag.rerank.model}")
+                    node_postprocessors.append(
+                        SentenceTransformerRerank(
+                            model=settings.rag.rerank.model,
+                            top_n=settings.rag.rerank.top_n,
+                        )
+                    )
+                self._node_postprocessors = node_postprocessors
+            return list(self._node_postprocessors)
 
     def get_system_inventory(self) -> dict:
         """Get current system document inventory for system awareness"""
         try:
-            # Get all documents from storage
-            all_docs = list(self.storage_context.docstore.docs.values())
-
+            # Read node metadata straight from storage, without decoding nodes
             file_counts = {}
             unique_files = set()
-            total_docs = len(all_docs)
+            total_docs = 0
 
-            for doc in all_docs:
-                if hasattr(doc, "metadata") and doc.metadata:
-                    file_name = doc.metadata.get("file_name", "Unknown")
+            for metadata in iter_node_metadata(self.storage_context.docstore):
+                total_docs += 1
+                if metadata:
+                    file_name = metadata.get("file_name", "Unknown")
                     unique_files.add(file_name)
                     file_counts[file_name] = file_counts.get(file_name, 0) + 1
 
@@ -179,26 +254,10 @@ CYBERSECURITY INTELLIGENCE SYSTEM:
         #     system_prompt = self.enhance_system_prompt_with_inventory(system_prompt)
 
         if use_context:
-            vector_index_retriever = self.vector_store_component.get_retriever(
-                index=self.index,
-                context_filter=context_filter,
-                similarity_top_k=self.settings.rag.similarity_top_k,
+            vector_index_retriever = self._get_retriever(
+                context_filter, settings.rag.similarity_top_k
             )
-            node_postprocessors: list[BaseNodePostprocessor] = [
-                MetadataReplacementPostProcessor(target_metadata_key="window"),
-            ]
-            if settings.rag.similarity_value:
-                node_postprocessors.append(
-                    SimilarityPostprocessor(
-                        similarity_cutoff=settings.rag.similarity_value
-                    )
-                )
-
-            if settings.rag.rerank.enabled:
-                rerank_postprocessor = SentenceTransformerRerank(
-                    model=settings.rag.rerank.model, top_n=settings.rag.rerank.top_n
-                )
-                node_postprocessors.append(rerank_postprocessor)
+            node_postprocessors = self._get_node_postprocessors()
 
             return ContextChatEngine.from_defaults(
                 system_prompt=system_prompt,
@@ -243,6 +302,19 @@ CYBERSECURITY INTELLIGENCE SYSTEM:
             chat_engine_input.chat_history if chat_engine_input.chat_history else None
         )
 
+        # Only single-turn questions are cached: history changes the answer
+        cache_key = None
+        if self.response_cache.enabled and not chat_history:
+            cache_scope = CacheScope.build(system_prompt, use_context, context_filter)
+            query_embedding = self.response_cache.embed(last_message.strip())
+            cached = self.response_cache.lookup(query_embedding, cache_scope)
+            if cached is not None:
+                return CompletionGen(
+                    response=replay_as_stream(cached.response),
+                    sources=cached.sources,
+                )
+            cache_key = (query_embedding, cache_scope)
+
         chat_engine = self._chat_engine(
             system_prompt=system_prompt,
             use_context=use_context,
@@ -255,9 +327,12 @@ CYBERSECURITY INTELLIGENCE SYSTEM:
 
         # Collect sources from documents with enhanced correlation
         sources = [Chunk.from_node(node) for node in streaming_response.source_nodes]
-        completion_gen = CompletionGen(
-            response=streaming_response.response_gen, sources=sources
-        )
+        response_gen = streaming_response.response_gen
+        if cache_key is not None:
+            response_gen = self.response_cache.record_stream(
+                response_gen, *cache_key, sources=sources
+            )
+        completion_gen = CompletionGen(response=response_gen, sources=sources)
         return completion_gen
 
     def chat(
@@ -281,6 +356,16 @@ CYBERSECURITY INTELLIGENCE SYSTEM:
             chat_engine_input.chat_history if chat_engine_input.chat_history else None
         )
 
+        # Only single-turn questions are cached: history changes the answer
+        cache_key = None
+        if self.response_cache.enabled and not chat_history and last_message:
+            cache_scope = CacheScope.build(system_prompt, use_context, context_filter)
+            query_embedding = self.response_cache.embed(last_message.strip())
+            cached = self.response_cache.lookup(query_embedding, cache_scope)
+            if cached is not None:
+                return Completion(response=cached.response, sources=cached.sources)
+            cache_key = (query_embedding, cache_scope)
+
         chat_engine = self._chat_engine(
             system_prompt=system_prompt,
             use_context=use_context,
@@ -294,4 +379,6 @@ CYBERSECURITY INTELLIGENCE SYSTEM:
         # Collect sources from documents with enhanced correlation
         sources = [Chunk.from_node(node) for node in wrapped_response.source_nodes]
         completion = Completion(response=wrapped_response.response, sources=sources)
+        if cache_key is not None:
+            self.response_cache.store(*cache_key, completion.response, sources)
         return completion
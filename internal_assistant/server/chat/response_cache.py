@@ -0,0 +1,185 @@
+"""Semantic cache for chat completions.
+
+Near-identical questions ("what is the Reg E error resolution timeline?") are
+answered from the cache instead of running a full generation. Entries are
+matched on the cosine similarity of the query embedding, and only within the
+same system prompt, mode (with or without context) and document scope.
+
+Context answers are dropped when a document in their scope is ingested or
+deleted. An entry without an explicit ``ContextFilter`` covers every
+document, so any ingest or delete invalidates it.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+import numpy as np
+from injector import inject, singleton
+
+from internal_assistant.components.embedding.embedding_component import (
+    EmbeddingComponent,
+)
+from internal_assistant.open_ai.extensions.context_filter import ContextFilter
+from internal_assistant.server.chunks.chunks_service import Chunk
+from internal_assistant.settings.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Words with their trailing whitespace, so a replay reassembles exactly
+_REPLAY_TOKEN = re.compile(r"\s*\S+\s*|\s+")
+
+
+@dataclass(frozen=True)
+class CacheScope:
+    """Everything besides the query that must match for a cache hit."""
+
+    system_prompt: str | None
+    use_context: bool
+    # None means "all documents"
+    doc_ids: frozenset[str] | None
+
+    @classmethod
+    def build(
+        cls,
+        system_prompt: str | None,
+        use_context: bool,
+        context_filter: ContextFilter | None,
+    ) -> "CacheScope":
+        doc_ids = None
+        if use_context and context_filter and context_filter.docs_ids is not None:
+            doc_ids = frozenset(context_filter.docs_ids)
+        return cls(
+            system_prompt=system_prompt, use_context=use_context, doc_ids=doc_ids
+        )
+
+    def covers_any(self, doc_ids: set[str]) -> bool:
+        if not self.use_context:
+            return False
+        return self.doc_ids is None or not self.doc_ids.isdisjoint(doc_ids)
+
+
+@dataclass
+class CachedResponse:
+    response: str
+    sources: list[Chunk] | None
+    scope: CacheScope
+    embedding: np.ndarray = field(repr=False)
+    created_at: float = field(default_factory=time.monotonic)
+
+
+def replay_as_stream(text: str) -> Iterator[str]:
+    """Yield a cached answer in word-sized deltas, like a live generation."""
+    for match in _REPLAY_TOKEN.finditer(text):
+        yield match.group(0)
+
+
+@singleton
+class ResponseCache:
+    """LRU + TTL cache of chat answers, looked up by query embedding."""
+
+    @inject
+    def __init__(
+        self, settings: Settings, embedding_component: EmbeddingComponent
+    ) -> None:
+        cache_settings = settings.rag.response_cache
+        self.enabled = cache_settings.enabled
+        self.similarity_threshold = cache_settings.similarity_threshold
+        self.max_entries = cache_settings.max_entries
+        self.ttl_seconds = cache_settings.ttl_seconds
+        self._embedding_component = embedding_component
+        self._entries: OrderedDict[int, CachedResponse] = OrderedDict()
+        self._next_key = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, query: str) -> np.ndarray:
+        embedding = np.asarray(
+            self._embedding_component.embedding_model.get_query_embedding(query),
+            dtype=np.float32,
+        )
+        norm = np.linalg.norm(embedding)
+        return embedding / norm if norm else embedding
+
+    def lookup(self, embedding: np.ndarray, scope: CacheScope) -> CachedResponse | None:
+        """Return the most similar live entry in ``scope`` above the threshold."""
+        now = time.monotonic()
+        best_key, best_score = None, self.similarity_threshold
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if now - entry.created_at > self.ttl_seconds:
+                    del self._entries[key]
+                    continue
+                if entry.scope != scope:
+                    continue
+                score = float(np.dot(entry.embedding, embedding))
+                if score >= best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best_key)
+            self.hits += 1
+            logger.debug("Chat response cache hit (similarity=%.3f)", best_score)
+            return self._entries[best_key]
+
+    def store(
+        self,
+        embedding: np.ndarray,
+        scope: CacheScope,
+        response: str,
+        sources: list[Chunk] | None,
+    ) -> None:
+        if not response.strip():
+            return
+        with self._lock:
+            self._entries[self._next_key] = CachedResponse(
+                response=response, sources=sources, scope=scope, embedding=embedding
+            )
+            self._next_key += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record_stream(
+        self,
+        response_gen: Iterator[str],
+        embedding: np.ndarray,
+        scope: CacheScope,
+        sources: list[Chunk] | None,
+    ) -> Iterator[str]:
+        """Pass a live stream through, caching the answer once it completes."""
+        parts: list[str] = []
+        for delta in response_gen:
+            parts.append(delta)
+            yield delta
+        self.store(embedding, scope, "".join(parts), sources)
+
+    def invalidate_documents(self, doc_ids: Iterable[str]) -> int:
+        """Drop every context answer whose scope includes one of ``doc_ids``."""
+        changed = set(doc_ids)
+        if not changed:
+            return 0
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.scope.covers_any(changed)
+            ]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            logger.debug("Invalidated %d cached chat responses", len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
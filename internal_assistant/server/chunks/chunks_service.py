@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING, Literal
 
 from injector import inject, singleton
 from llama_index.core.indices import VectorStoreIndex
-from llama_index.core.schema import NodeWithScore
+from llama_index.core.schema import BaseNode, NodeWithScore
 from llama_index.core.storage import StorageContext
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -76,27 +76,63 @@ class ChunksService:
             docstore=node_store_component.doc_store,
             index_store=node_store_component.index_store,
         )
+        self.index = VectorStoreIndex.from_vector_store(
+            vector_store_component.vector_store,
+            storage_context=self.storage_context,
+            llm=llm_component.llm,
+            embed_model=embedding_component.embedding_model,
+            show_progress=True,
+        )
+
+    def _get_sibling_nodes_texts(
+        self, nodes: list[NodeWithScore], related_number: int
+    ) -> tuple[list[list[str]], list[list[str]]]:
+        """Collect the previous and next chunk texts of every retrieved node.
+
+        Siblings are explored hop by hop for all nodes and both directions at
+        once, so each hop costs a single batched docstore lookup.
+        """
+        previous_texts: list[list[str]] = [[] for _ in nodes]
+        next_texts: list[list[str]] = [[] for _ in nodes]
+        frontier: list[tuple[int, bool, BaseNode]] = [
+            (position, forward, node_with_score.node)
+            for position, node_with_score in enumerate(nodes)
+            for forward in (False, True)
+        ]
+        fetched: dict[str, BaseNode] = {}
 
-    def _get_sibling_nodes_text(
-        self, node_with_score: NodeWithScore, related_number: int, forward: bool = True
-    ) -> list[str]:
-        explored_nodes_texts = []
-        current_node = node_with_score.node
         for _ in range(related_number):
-            explored_node_info: RelatedNodeInfo | None = (
-                current_node.next_node if forward else current_node.prev_node
-            )
-            if explored_node_info is None:
+            hops: list[tuple[int, bool, str]] = []
+            for position, forward, current_node in frontier:
+                explored_node_info: RelatedNodeInfo | None = (
+                    current_node.next_node if forward else current_node.prev_node
+                )
+                if explored_node_info is not None:
+                    hops.append((position, forward, explored_node_info.node_id))
+            if not hops:
                 break
 
-            explored_node = self.storage_context.docstore.get_node(
-                explored_node_info.node_id
+            # Neighbouring results share siblings, so fetch each id only once
+            missing_ids = list(
+                dict.fromkeys(node_id for *_, node_id in hops if node_id not in fetched)
             )
+            if missing_ids:
+                fetched.update(
+                    zip(
+                        missing_ids,
+                        self.storage_context.docstore.get_nodes(missing_ids),
+                        strict=True,
+                    )
+                )
 
-            explored_nodes_texts.append(explored_node.get_content())
-            current_node = explored_node
+            frontier = []
+            for position, forward, node_id in hops:
+                explored_node = fetched[node_id]
+                texts = next_texts if forward else previous_texts
+                texts[position].append(explored_node.get_content())
+                frontier.append((position, forward, explored_node))
 
-        return explored_nodes_texts
+        return previous_texts, next_texts
 
     def retrieve_relevant(
         self,
@@ -105,26 +141,22 @@ class ChunksService:
         limit: int = 10,
         prev_next_chunks: int = 0,
     ) -> list[Chunk]:
-        index = VectorStoreIndex.from_vector_store(
-            self.vector_store_component.vector_store,
-            storage_context=self.storage_context,
-            llm=self.llm_component.llm,
-            embed_model=self.embedding_component.embedding_model,
-            show_progress=True,
-        )
         vector_index_retriever = self.vector_store_component.get_retriever(
-            index=index, context_filter=context_filter, similarity_top_k=limit
+            index=self.index, context_filter=context_filter, similarity_top_k=limit
         )
         nodes = vector_index_retriever.retrieve(text)
         nodes.sort(key=lambda n: n.score or 0.0, reverse=True)
 
+        previous_texts, next_texts = self._get_sibling_nodes_texts(
+            nodes, prev_next_chunks
+        )
         retrieved_nodes = []
-        for node in nodes:
+        for node, previous, following in zip(
+            nodes, previous_texts, next_texts, strict=True
+        ):
             chunk = Chunk.from_node(node)
-            chunk.previous_texts = self._get_sibling_nodes_text(
-                node, prev_next_chunks, False
-            )
-            chunk.next_texts = self._get_sibling_nodes_text(node, prev_next_chunks)
+            chunk.previous_texts = previous
+            chunk.next_texts = following
             retrieved_nodes.append(chunk)
 
         return retrieved_nodes
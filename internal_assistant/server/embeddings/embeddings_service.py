@@ -1,11 +1,17 @@
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from typing import Literal
 
+import numpy as np
 from injector import inject, singleton
 from pydantic import BaseModel, ConfigDict, Field
 
 from internal_assistant.components.embedding.embedding_component import (
     EmbeddingComponent,
 )
+from internal_assistant.settings.settings import Settings
 
 
 class Embedding(BaseModel):
@@ -15,19 +21,112 @@ class Embedding(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+@dataclass
+class _PendingRequest:
+    texts: list[str]
+    future: Future = field(default_factory=Future)
+
+
+class EmbeddingBatcher:
+    """Merges concurrent embedding requests into shared model batches.
+
+    The first request to arrive while no batch is forming becomes the leader:
+    it waits up to ``window_seconds`` (or until ``batch_size`` texts are
+    queued), then embeds every queued text and hands each request its rows.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[list[str]], list[list[float]]],
+        batch_size: int,
+        window_seconds: float,
+    ) -> None:
+        self._embed_fn = embed_fn
+        self.batch_size = max(1, batch_size)
+        self.window_seconds = window_seconds
+        self._queue: list[_PendingRequest] = []
+        self._queued_texts = 0
+        self._leader_active = False
+        self._batch_full = threading.Event()
+        self._lock = threading.Lock()
+        self.model_calls = 0
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """Return one float32 row per text, in input order."""
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        if self.window_seconds <= 0:
+            return self._embed(texts)
+
+        request = _PendingRequest(texts)
+        with self._lock:
+            self._queue.append(request)
+            self._queued_texts += len(texts)
+            is_leader = not self._leader_active
+            self._leader_active = True
+            if self._queued_texts >= self.batch_size:
+                self._batch_full.set()
+
+        if is_leader:
+            self._batch_full.wait(self.window_seconds)
+            with self._lock:
+                batch, self._queue = self._queue, []
+                self._queued_texts = 0
+                self._leader_active = False
+                self._batch_full.clear()
+            self._flush(batch)
+
+        return request.future.result()
+
+    def _flush(self, batch: list[_PendingRequest]) -> None:
+        texts = [text for request in batch for text in request.texts]
+        try:
+            embeddings = self._embed(texts)
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in batch:
+            end = offset + len(request.texts)
+            request.future.set_result(embeddings[offset:end])
+            offset = end
+
+    def _embed(self, texts: list[str]) -> np.ndarray:
+        chunks = []
+        for start in range(0, len(texts), self.batch_size):
+            chunks.append(
+                np.asarray(
+                    self._embed_fn(texts[start : start + self.batch_size]),
+                    dtype=np.float32,
+                )
+            )
+            self.model_calls += 1
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+
 @singleton
 class EmbeddingsService:
     @inject
-    def __init__(self, embedding_component: EmbeddingComponent) -> None:
+    def __init__(
+        self, embedding_component: EmbeddingComponent, settings: Settings
+    ) -> None:
         self.embedding_model = embedding_component.embedding_model
+        self._batcher = EmbeddingBatcher(
+            self.embedding_model.get_text_embedding_batch,
+            batch_size=settings.embedding.batch_size,
+            window_seconds=settings.embedding.coalesce_window_ms / 1000,
+        )
 
     def texts_embeddings(self, texts: list[str]) -> list[Embedding]:
-        texts_embeddings = self.embedding_model.get_text_embedding_batch(texts)
+        rows = self._batcher.embed(texts).tolist()
+        # Positions come from enumerate, so duplicate inputs keep their own
+        # index. The rows are plain floats already, so per-element validation
+        # is skipped.
         return [
-            Embedding(
-                index=texts_embeddings.index(embedding),
-                object="embedding",
-                embedding=embedding,
+            Embedding.model_construct(
+                index=index, object="embedding", embedding=embedding
             )
-            for embedding in texts_embeddings
+            for index, embedding in enumerate(rows)
         ]
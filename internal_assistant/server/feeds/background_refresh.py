@@ -2,11 +2,15 @@
 
 import asyncio
 import logging
+from datetime import timedelta
 
 from internal_assistant.server.feeds.feeds_service import RSSFeedService
 
 logger = logging.getLogger(__name__)
 
+# How often the loop asks the feed service for sources that are due
+SCHEDULER_TICK_SECONDS = 5 * 60
+
 
 class BackgroundRefreshService:
     """Service for managing background RSS feed refresh."""
@@ -16,6 +20,11 @@ class BackgroundRefreshService:
     ):
         self.feed_service = feed_service
         self.refresh_interval = refresh_interval_minutes * 60  # Convert to seconds
+        # Starting interval for every source; each one then adapts to its feed
+        feed_service.scheduler.default_interval = timedelta(
+            minutes=refresh_interval_minutes
+        )
+        self.tick_interval = min(self.refresh_interval, SCHEDULER_TICK_SECONDS)
         self._refresh_task: asyncio.Task | None = None
         self._is_running = False
         self._stop_event = asyncio.Event()
@@ -68,7 +77,7 @@ class BackgroundRefreshService:
                 # Wait for refresh interval or stop signal
                 try:
                     await asyncio.wait_for(
-                        self._stop_event.wait(), timeout=self.refresh_interval
+                        self._stop_event.wait(), timeout=self.tick_interval
                     )
                     # If we get here, stop was requested
                     break
@@ -79,11 +88,21 @@ class BackgroundRefreshService:
                 if not self._is_running:
                     break
 
-                logger.info("Starting scheduled RSS feed refresh")
+                due_sources = self.feed_service.scheduler.due_sources(
+                    list(self.feed_service.FEED_SOURCES)
+                )
+                if not due_sources:
+                    continue
+
+                logger.info(
+                    f"Starting scheduled RSS feed refresh for {len(due_sources)} sources"
+                )
 
                 # Perform refresh with session management
                 async with self.feed_service:
-                    success = await self.feed_service.refresh_feeds()
+                    success = await self.feed_service.refresh_feeds(
+                        sources=due_sources
+                    )
 
                 if success:
                     cache_info = self.feed_service.get_cache_info()
@@ -112,4 +131,5 @@ class BackgroundRefreshService:
             "last_refresh": cache_info.get("last_refresh"),
             "total_items": cache_info.get("total_items", 0),
             "sources": cache_info.get("sources", {}),
+            "schedule": self.feed_service.scheduler.status(),
         }
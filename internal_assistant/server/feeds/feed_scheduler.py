@@ -0,0 +1,203 @@
+"""Per-source refresh state for incremental RSS feed refresh.
+
+Each source keeps its HTTP validators (ETag / Last-Modified), a hash of the
+last body, the keys of entries already parsed and its own refresh interval.
+The interval follows the feed's publish rate: busy feeds are checked more
+often, feeds that keep answering "not modified" are checked less often, and
+failing feeds back off exponentially.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+MIN_INTERVAL = timedelta(minutes=15)
+MAX_INTERVAL = timedelta(hours=6)
+MAX_BACKOFF = timedelta(hours=24)
+# Entry keys remembered per source; feeds rarely carry more than a few hundred
+MAX_SEEN_KEYS = 2000
+# Recent publish times used to estimate a feed's publish rate
+PUBLISH_HISTORY = 20
+_IDLE_GROWTH = 1.5
+
+
+def entry_key(guid: str | None, link: str | None) -> str:
+    """Stable identity of a feed entry: its guid, or a hash of its link."""
+    if guid:
+        return guid
+    return "link:" + hashlib.sha1((link or "").encode("utf-8")).hexdigest()
+
+
+def body_hash(content: str) -> str:
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SourceState:
+    """Refresh bookkeeping for one feed source."""
+
+    interval: timedelta
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    next_due: datetime | None = None
+    last_checked: datetime | None = None
+    consecutive_failures: int = 0
+    not_modified_count: int = 0
+    seen: OrderedDict[str, None] = field(default_factory=OrderedDict)
+    publish_times: list[datetime] = field(default_factory=list)
+
+    def is_due(self, now: datetime) -> bool:
+        return self.next_due is None or now >= self.next_due
+
+    def has_seen(self, key: str) -> bool:
+        return key in self.seen
+
+    def mark_seen(self, key: str) -> None:
+        self.seen[key] = None
+        self.seen.move_to_end(key)
+        while len(self.seen) > MAX_SEEN_KEYS:
+            self.seen.popitem(last=False)
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def record_validators(self, etag: object, last_modified: object) -> None:
+        # Only keep real header values; anything else would poison the next request
+        self.etag = etag if isinstance(etag, str) else None
+        self.last_modified = last_modified if isinstance(last_modified, str) else None
+
+    def record_success(self, now: datetime, published: list[datetime]) -> None:
+        """Schedule the next check after a fetch that returned new entries."""
+        self.last_checked = now
+        self.consecutive_failures = 0
+        self.not_modified_count = 0
+        self.publish_times = sorted(self.publish_times + published)[-PUBLISH_HISTORY:]
+        self.interval = self._publish_rate_interval()
+        self.next_due = now + self.interval
+
+    def record_unchanged(self, now: datetime) -> None:
+        """Schedule the next check after a 304 or a fetch with nothing new."""
+        self.last_checked = now
+        self.consecutive_failures = 0
+        self.not_modified_count += 1
+        self.interval = min(self.interval * _IDLE_GROWTH, MAX_INTERVAL)
+        self.next_due = now + self.interval
+
+    def record_failure(self, now: datetime) -> None:
+        """Back off exponentially after an error."""
+        self.last_checked = now
+        self.consecutive_failures += 1
+        backoff = self.interval * (2 ** min(self.consecutive_failures, 6))
+        self.next_due = now + min(backoff, MAX_BACKOFF)
+
+    def _publish_rate_interval(self) -> timedelta:
+        if len(self.publish_times) < 2:
+            return self.interval
+        span = self.publish_times[-1] - self.publish_times[0]
+        average_gap = span / (len(self.publish_times) - 1)
+        # Check about twice per expected new entry
+        return max(MIN_INTERVAL, min(average_gap / 2, MAX_INTERVAL))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable state; seen keys are rebuilt from the stored items."""
+        return {
+            "interval": self.interval.total_seconds(),
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_hash": self.content_hash,
+            "next_due": self.next_due.isoformat() if self.next_due else None,
+            "last_checked": (
+                self.last_checked.isoformat() if self.last_checked else None
+            ),
+            "consecutive_failures": self.consecutive_failures,
+            "not_modified_count": self.not_modified_count,
+            "publish_times": [t.isoformat() for t in self.publish_times],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SourceState":
+        def parse(value: str | None) -> datetime | None:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            interval=timedelta(seconds=data["interval"]),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            content_hash=data.get("content_hash"),
+            next_due=parse(data.get("next_due")),
+            last_checked=parse(data.get("last_checked")),
+            consecutive_failures=data.get("consecutive_failures", 0),
+            not_modified_count=data.get("not_modified_count", 0),
+            publish_times=[datetime.fromisoformat(t) for t in data["publish_times"]],
+        )
+
+    def status(self) -> dict[str, object]:
+        return {
+            "interval_minutes": round(self.interval.total_seconds() / 60, 1),
+            "next_due": self.next_due.isoformat() if self.next_due else None,
+            "last_checked": (
+                self.last_checked.isoformat() if self.last_checked else None
+            ),
+            "consecutive_failures": self.consecutive_failures,
+            "not_modified_count": self.not_modified_count,
+            "seen_entries": len(self.seen),
+        }
+
+
+class FeedScheduler:
+    """Tracks ``SourceState`` for every source and decides which are due."""
+
+    def __init__(self, default_interval: timedelta = timedelta(hours=1)) -> None:
+        self._default_interval = default_interval
+        self._states: dict[str, SourceState] = {}
+
+    @property
+    def default_interval(self) -> timedelta:
+        return self._default_interval
+
+    @default_interval.setter
+    def default_interval(self, interval: timedelta) -> None:
+        """Change the starting interval, including sources still running on it.
+
+        Sources whose interval already adapted to their feed keep it.
+        """
+        previous = self._default_interval
+        self._default_interval = interval
+        for state in self._states.values():
+            if state.interval != previous:
+                continue
+            state.interval = interval
+            if state.last_checked is not None and not state.consecutive_failures:
+                state.next_due = state.last_checked + interval
+
+    def state(self, source: str) -> SourceState:
+        if source not in self._states:
+            self._states[source] = SourceState(interval=self._default_interval)
+        return self._states[source]
+
+    def due_sources(self, sources: list[str], now: datetime | None = None) -> list[str]:
+        now = now or datetime.now(UTC)
+        return [source for source in sources if self.state(source).is_due(now)]
+
+    def next_due(self, sources: list[str]) -> datetime | None:
+        due_times = [self.state(source).next_due for source in sources]
+        return min((due for due in due_times if due is not None), default=None)
+
+    def restore(self, source: str, state: SourceState, seen_keys: list[str]) -> None:
+        for key in seen_keys:
+            state.mark_seen(key)
+        self._states[source] = state
+
+    def export(self) -> dict[str, dict[str, Any]]:
+        return {source: state.to_dict() for source, state in self._states.items()}
+
+    def status(self) -> dict[str, dict[str, object]]:
+        return {source: state.status() for source, state in self._states.items()}
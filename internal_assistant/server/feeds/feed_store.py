@@ -0,0 +1,203 @@
+"""SQLite-backed feed item store.
+
+Keeps feed history on disk so it survives restarts and can grow beyond the
+in-memory window of ``RSSFeedService``. Items are indexed by source,
+category, published time and guid, so filtered and paginated queries do
+not scan the whole history. Per-source refresh state (HTTP validators and
+schedule) is stored alongside, so conditional requests keep working after a
+restart.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+FEED_STORE_FILE = "feed_items.sqlite3"
+# History kept on disk; the in-memory window is much smaller
+DEFAULT_RETENTION = timedelta(days=180)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feed_items (
+    source TEXT NOT NULL,
+    item_key TEXT NOT NULL,
+    guid TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    published REAL NOT NULL,
+    category TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (source, item_key)
+);
+CREATE INDEX IF NOT EXISTS idx_feed_items_published ON feed_items (published);
+CREATE INDEX IF NOT EXISTS idx_feed_items_source ON feed_items (source, published);
+CREATE INDEX IF NOT EXISTS idx_feed_items_category
+    ON feed_items (category, published);
+CREATE INDEX IF NOT EXISTS idx_feed_items_guid ON feed_items (guid);
+CREATE TABLE IF NOT EXISTS feed_sources (
+    source TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+"""
+
+
+class FeedStore:
+    """Persistent, indexed feed history. ``db_path=None`` keeps it in memory."""
+
+    def __init__(
+        self, db_path: Path | None = None, retention: timedelta = DEFAULT_RETENTION
+    ) -> None:
+        self.db_path = db_path
+        self.retention = retention
+        self._lock = threading.Lock()
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            str(db_path) if db_path else ":memory:", check_same_thread=False
+        )
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._db.commit()
+
+    def upsert(self, rows: Iterable[dict[str, Any]]) -> int:
+        """Insert or update items. Rows carry the ``feed_items`` columns."""
+        rows = list(rows)
+        if not rows:
+            return 0
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO feed_items (source, item_key, guid, title, "
+                "link, summary, published, category, priority, fetched_at) VALUES "
+                "(:source, :item_key, :guid, :title, :link, :summary, :published, "
+                ":category, :priority, :fetched_at)",
+                rows,
+            )
+            self._db.commit()
+        return len(rows)
+
+    def query(
+        self,
+        source: str | None = None,
+        category: str | None = None,
+        since: datetime | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        order: str = "display",
+    ) -> list[sqlite3.Row]:
+        """Filtered page of items.
+
+        ``order="display"`` matches ``RSSFeedService.get_feeds``: priority 4
+        (regulatory) sources newest first, then the rest by priority and
+        recency. ``order="published"`` sorts newest first.
+        """
+        where, params = self._where(source, category, since)
+        order_by = (
+            "published DESC"
+            if order == "published"
+            else "priority != 4, CASE WHEN priority = 4 THEN 0 ELSE priority END, "
+            "published DESC"
+        )
+        sql = f"SELECT * FROM feed_items{where} ORDER BY {order_by}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def count(
+        self,
+        source: str | None = None,
+        category: str | None = None,
+        since: datetime | None = None,
+    ) -> int:
+        where, params = self._where(source, category, since)
+        with self._lock:
+            return self._db.execute(
+                f"SELECT COUNT(*) FROM feed_items{where}", params
+            ).fetchone()[0]
+
+    def source_stats(self) -> dict[str, dict[str, Any]]:
+        """Item count and newest published time per source."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT source, COUNT(*) AS item_count, MAX(published) AS latest "
+                "FROM feed_items GROUP BY source"
+            ).fetchall()
+        return {
+            row["source"]: {
+                "item_count": row["item_count"],
+                "latest": datetime.fromtimestamp(row["latest"], UTC),
+            }
+            for row in rows
+        }
+
+    def recent_keys(self, source: str, limit: int) -> list[str]:
+        """Keys of the newest items of a source, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT item_key FROM feed_items WHERE source = ? "
+                "ORDER BY published DESC LIMIT ?",
+                (source, limit),
+            ).fetchall()
+        return [row["item_key"] for row in reversed(rows)]
+
+    def delete_source(self, source: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM feed_items WHERE source = ?", (source,))
+            self._db.execute("DELETE FROM feed_sources WHERE source = ?", (source,))
+            self._db.commit()
+
+    def prune(self, now: datetime | None = None) -> int:
+        """Drop items published before the retention window."""
+        cutoff = (now or datetime.now(UTC)) - self.retention
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM feed_items WHERE published < ?", (cutoff.timestamp(),)
+            )
+            self._db.commit()
+        if cursor.rowcount:
+            logger.info(f"Pruned {cursor.rowcount} feed items older than {cutoff}")
+        return cursor.rowcount
+
+    def load_source_states(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            rows = self._db.execute("SELECT source, state FROM feed_sources")
+            return {row["source"]: json.loads(row["state"]) for row in rows}
+
+    def save_source_states(self, states: dict[str, dict[str, Any]]) -> None:
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO feed_sources (source, state) VALUES (?, ?)",
+                [(source, json.dumps(state)) for source, state in states.items()],
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def _where(
+        source: str | None, category: str | None, since: datetime | None
+    ) -> tuple[str, list[Any]]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if since:
+            clauses.append("published >= ?")
+            params.append(since.timestamp())
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
@@ -17,6 +17,11 @@ logger = logging.getLogger(__name__)
 feeds_router = APIRouter(prefix="/v1/feeds", dependencies=[Depends(authenticated)])
 
 
+def _feed_service() -> RSSFeedService:
+    # The singleton owns the cache, refresh state and feed store
+    return global_injector.get(RSSFeedService)
+
+
 class FeedRequest(BaseModel):
     """Request model for feed filtering."""
 
@@ -24,6 +29,9 @@ class FeedRequest(BaseModel):
         None, description="Filter by source (FINRA, Federal Reserve, FinCEN)"
     )
     days: int | None = Field(None, description="Filter by days (7, 30, etc.)")
+    category: str | None = Field(None, description="Filter by source category")
+    limit: int | None = Field(None, ge=1, description="Page size")
+    offset: int = Field(0, ge=0, description="Items to skip")
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -64,7 +72,9 @@ async def health_check() -> dict[str, str]:
 
 @feeds_router.post("/refresh")
 @inject
-async def refresh_feeds(feed_service: RSSFeedService = Depends()) -> dict[str, Any]:
+async def refresh_feeds(
+    feed_service: RSSFeedService = Depends(_feed_service),
+) -> dict[str, Any]:
     """Manually trigger feed refresh."""
     try:
         async with feed_service:
@@ -87,17 +97,26 @@ async def refresh_feeds(feed_service: RSSFeedService = Depends()) -> dict[str, A
 @feeds_router.post("/list", response_model=FeedResponse)
 @inject
 async def get_feeds(
-    feed_request: FeedRequest = FeedRequest(), feed_service: RSSFeedService = Depends()
+    feed_request: FeedRequest = FeedRequest(),
+    feed_service: RSSFeedService = Depends(_feed_service),
 ) -> FeedResponse:
     """Get RSS feeds with optional filtering."""
     try:
         items = feed_service.get_feeds(
-            source_filter=feed_request.source, days_filter=feed_request.days
+            source_filter=feed_request.source,
+            days_filter=feed_request.days,
+            category=feed_request.category,
+            limit=feed_request.limit,
+            offset=feed_request.offset,
         )
 
         return FeedResponse(
             items=items,
-            total_count=len(items),
+            total_count=feed_service.count_feeds(
+                source_filter=feed_request.source,
+                days_filter=feed_request.days,
+                category=feed_request.category,
+            ),
             sources=feed_service.get_available_sources(),
             cache_info=feed_service.get_cache_info(),
         )
@@ -109,7 +128,9 @@ async def get_feeds(
 
 @feeds_router.get("/sources")
 @inject
-async def get_sources(feed_service: RSSFeedService = Depends()) -> dict[str, list[str]]:
+async def get_sources(
+    feed_service: RSSFeedService = Depends(_feed_service),
+) -> dict[str, list[str]]:
     """Get available feed sources."""
     try:
         return {"sources": feed_service.get_available_sources()}
@@ -121,7 +142,7 @@ async def get_sources(feed_service: RSSFeedService = Depends()) -> dict[str, lis
 @feeds_router.post("/background/start")
 @inject
 async def start_background_refresh(
-    feed_service: RSSFeedService = Depends(),
+    feed_service: RSSFeedService = Depends(_feed_service),
 ) -> dict[str, Any]:
     """Start background RSS feed refresh service."""
     try:
@@ -152,7 +173,7 @@ async def start_background_refresh(
 @feeds_router.get("/background/status")
 @inject
 async def get_background_status(
-    feed_service: RSSFeedService = Depends(),
+    feed_service: RSSFeedService = Depends(_feed_service),
 ) -> dict[str, Any]:
     """Get background refresh service status."""
     try:
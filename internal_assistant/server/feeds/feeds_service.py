@@ -9,6 +9,19 @@ import aiohttp
 import feedparser
 from bs4 import BeautifulSoup
 
+from internal_assistant.server.feeds.feed_scheduler import (
+    MAX_SEEN_KEYS,
+    FeedScheduler,
+    SourceState,
+    body_hash,
+    entry_key,
+)
+from internal_assistant.server.feeds.feed_store import FeedStore
+from internal_assistant.server.feeds.threat_cache import (
+    ThreatAnalysisCache,
+    ThreatSnapshot,
+)
+from internal_assistant.server.threat_intelligence.ioc_extractor import IndicatorRecord
 from internal_assistant.server.threat_intelligence.threat_analyzer import (
     SecurityRecommendation,
     ThreatIndicator,
@@ -239,13 +252,81 @@ class RSSFeedService:
     ]
 
     def __init__(
-        self, max_items: int = 1000
+        self, max_items: int = 1000, store: FeedStore | None = None
     ):  # Increased for better scrolling and more sources
         self.max_items = max_items
-        self.feeds_cache: list[FeedItem] = []
+        self.snapshot_version = 0
+        self.feeds_cache = []
         self.last_refresh: datetime | None = None
         self._session: aiohttp.ClientSession | None = None
         self.threat_analyzer = ThreatIntelligenceAnalyzer()
+        self._threat_cache = ThreatAnalysisCache(self.threat_analyzer)
+        self.scheduler = FeedScheduler()
+        # Optional persistent history; feeds_cache stays the newest window
+        self.store = store
+        if store is not None:
+            self._load_from_store()
+
+    @property
+    def feeds_cache(self) -> list[FeedItem]:
+        return self._feeds_cache
+
+    @feeds_cache.setter
+    def feeds_cache(self, items: list[FeedItem]) -> None:
+        # Every replacement is a new snapshot; cached threat analysis follows it
+        self._feeds_cache = items
+        self.snapshot_version += 1
+
+    def _load_from_store(self) -> None:
+        """Serve the stored items and refresh state right after a restart."""
+        rows = self.store.query(limit=self.max_items, order="published")
+        self.feeds_cache = sorted(
+            (self._item_from_row(row) for row in rows),
+            key=lambda x: (self.SOURCE_PRIORITY.get(x.source, 999), x.published),
+            reverse=True,
+        )
+        for source, data in self.store.load_source_states().items():
+            try:
+                state = SourceState.from_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Ignoring stored refresh state for {source}: {e}")
+                continue
+            self.scheduler.restore(
+                source, state, self.store.recent_keys(source, MAX_SEEN_KEYS)
+            )
+        if self.feeds_cache:
+            logger.info(f"Loaded {len(self.feeds_cache)} feed items from the store")
+
+    @staticmethod
+    def _item_from_row(row: Any) -> FeedItem:
+        return FeedItem(
+            title=row["title"],
+            link=row["link"],
+            summary=row["summary"],
+            published=datetime.fromtimestamp(row["published"], UTC),
+            source=row["source"],
+            guid=row["guid"],
+        )
+
+    def _store_items(self, items: list[FeedItem]) -> None:
+        fetched_at = datetime.now(UTC).timestamp()
+        self.store.upsert(
+            {
+                "source": item.source,
+                "item_key": entry_key(item.guid, item.link),
+                "guid": item.guid,
+                "title": item.title,
+                "link": item.link,
+                "summary": item.summary,
+                "published": item.published.timestamp(),
+                "category": self._get_source_category(item.source),
+                "priority": self.SOURCE_PRIORITY.get(item.source, 999),
+                "fetched_at": fetched_at,
+            }
+            for item in items
+        )
+        self.store.save_source_states(self.scheduler.export())
+        self.store.prune()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -263,37 +344,75 @@ class RSSFeedService:
                 self._session = None
 
     async def fetch_feed(self, url: str, source: str) -> list[FeedItem]:
-        """Fetch and parse a single RSS feed."""
+        """Fetch a single RSS feed and return the entries not seen before.
+
+        Sends the source's ETag / Last-Modified validators, so an unchanged
+        feed costs a 304 and no parsing. Each outcome also reschedules the
+        source's next check.
+        """
         if not self._session:
             raise RuntimeError("Service must be used within async context manager")
 
+        state = self.scheduler.state(source)
+        now = datetime.now(UTC)
         try:
-            async with self._session.get(url) as response:
+            async with self._session.get(
+                url, headers=state.conditional_headers()
+            ) as response:
+                if response.status == 304:
+                    logger.debug(f"{source} feed not modified")
+                    state.record_unchanged(now)
+                    return []
                 if response.status != 200:
                     logger.warning(
                         f"Failed to fetch {source} feed: HTTP {response.status}"
                     )
+                    state.record_failure(now)
                     return []
 
                 content = await response.text()
+                state.record_validators(
+                    response.headers.get("ETag"), response.headers.get("Last-Modified")
+                )
 
         except TimeoutError:
             logger.warning(f"Timeout fetching {source} feed")
+            state.record_failure(now)
             return []
         except Exception as e:
             logger.error(f"Error fetching {source} feed: {e}")
+            state.record_failure(now)
+            return []
+
+        # Servers without validators often return the same body again
+        digest = body_hash(content)
+        if digest == state.content_hash:
+            state.record_unchanged(now)
             return []
 
-        return self._parse_feed_content(content, source)
+        items = self._parse_feed_content(content, source)
+        state.content_hash = digest
+        for item in items:
+            state.mark_seen(entry_key(item.guid, item.link))
+        if items:
+            state.record_success(now, [item.published for item in items])
+        else:
+            state.record_unchanged(now)
+        return items
 
     def _parse_feed_content(self, content: str, source: str) -> list[FeedItem]:
-        """Parse RSS feed content into FeedItem objects."""
+        """Parse RSS feed content into FeedItem objects, skipping seen entries."""
         try:
             feed = feedparser.parse(content)
             items = []
+            state = self.scheduler.state(source)
 
             for entry in feed.entries:
                 try:
+                    # Entries parsed in an earlier refresh are already cached
+                    if state.has_seen(entry_key(entry.get("id"), entry.get("link"))):
+                        continue
+
                     # Extract published date - only use valid dates, skip entries without dates
                     published = None
                     if hasattr(entry, "published_parsed") and entry.published_parsed:
@@ -348,8 +467,16 @@ class RSSFeedService:
             logger.error(f"Error parsing feed content from {source}: {e}")
             return []
 
-    async def refresh_feeds(self) -> bool:
-        """Refresh all feeds and analyze for threats."""
+    async def refresh_feeds(
+        self, force: bool = True, sources: list[str] | None = None
+    ) -> bool:
+        """Fetch new entries and merge them into the cache.
+
+        With ``force`` every source is requested (still conditionally);
+        otherwise only the sources whose own refresh interval has elapsed.
+        ``sources`` requests exactly those sources, e.g. a due list the
+        caller already computed.
+        """
         # Create a new session for this refresh to avoid "Connector is closed" errors
         session_created_here = False
         if not self._session:
@@ -359,34 +486,45 @@ class RSSFeedService:
             session_created_here = True
 
         try:
-            # Fetch all feeds concurrently
+            all_sources = list(self.FEED_SOURCES)
+            if sources is not None:
+                due_sources = [source for source in sources if source in all_sources]
+            elif force:
+                due_sources = all_sources
+            else:
+                due_sources = self.scheduler.due_sources(all_sources)
+
+            # Fetch due feeds concurrently
             tasks = []
-            for source, url in self.FEED_SOURCES.items():
-                task = self.fetch_feed(url, source)
+            for source in due_sources:
+                task = self.fetch_feed(self.FEED_SOURCES[source], source)
                 tasks.append(task)
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            # Combine all results
-            all_items = []
+            # Combine all results; fetch_feed only returns entries not seen before
+            new_items = []
             for result in results:
                 if isinstance(result, list):
-                    all_items.extend(result)
+                    new_items.extend(result)
                 else:
                     logger.warning(f"Feed fetch failed: {result}")
 
             # Sort by priority and limit items
             sorted_items = sorted(
-                all_items,
+                self.feeds_cache + new_items,
                 key=lambda x: (self.SOURCE_PRIORITY.get(x.source, 999), x.published),
                 reverse=True,
             )
 
             self.feeds_cache = sorted_items[: self.max_items]
             self.last_refresh = datetime.now(UTC)
+            if self.store is not None:
+                self._store_items(new_items)
 
             logger.info(
-                f"Refreshed {len(self.feeds_cache)} feed items from {len(self.FEED_SOURCES)} sources"
+                f"Refreshed {len(due_sources)} of {len(all_sources)} sources: "
+                f"{len(new_items)} new items, {len(self.feeds_cache)} cached"
             )
             return True
 
@@ -404,18 +542,49 @@ class RSSFeedService:
                     logger.warning(f"Error closing session: {e}")
 
     def get_feeds(
-        self, source_filter: str | None = None, days_filter: int | None = None
+        self,
+        source_filter: str | None = None,
+        days_filter: int | None = None,
+        category: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
-        """Get feeds with optional filtering."""
+        """Get feeds with optional filtering and pagination.
+
+        With a store the query runs against the indexed history; otherwise
+        it filters the in-memory cache.
+        """
+        if source_filter == "All":
+            source_filter = None
+        cutoff_date = (
+            datetime.now(UTC) - timedelta(days=days_filter) if days_filter else None
+        )
+
+        if self.store is not None:
+            rows = self.store.query(
+                source=source_filter,
+                category=category,
+                since=cutoff_date,
+                limit=limit if limit is not None else self.max_items,
+                offset=offset,
+            )
+            return [self._feed_to_dict(self._item_from_row(row)) for row in rows]
+
         items = self.feeds_cache
 
-        # Filter by source (skip filtering if "All" is specified)
-        if source_filter and source_filter != "All":
+        # Filter by source
+        if source_filter:
             items = [item for item in items if item.source == source_filter]
 
+        if category:
+            items = [
+                item
+                for item in items
+                if self._get_source_category(item.source) == category
+            ]
+
         # Filter by days
-        if days_filter:
-            cutoff_date = datetime.now(UTC) - timedelta(days=days_filter)
+        if cutoff_date:
             items = [item for item in items if item.published >= cutoff_date]
 
         # Convert to dict format - sort intelligently
@@ -435,21 +604,40 @@ class RSSFeedService:
                 )
 
         sorted_items = sorted(items, key=sort_key)
+        end = offset + limit if limit is not None else None
 
-        return [
-            {
-                "title": item.title,
-                "link": item.link,
-                "summary": item.summary,
-                "published": item.published.isoformat(),
-                "source": item.source,
-                "guid": item.guid,
-                "priority": self.SOURCE_PRIORITY.get(item.source, 999),
-                "color": self.SOURCE_COLORS.get(item.source, "#666666"),
-                "category": self._get_source_category(item.source),
-            }
-            for item in sorted_items
-        ]
+        return [self._feed_to_dict(item) for item in sorted_items[offset:end]]
+
+    def count_feeds(
+        self,
+        source_filter: str | None = None,
+        days_filter: int | None = None,
+        category: str | None = None,
+    ) -> int:
+        """Number of items matching the filters, for pagination."""
+        if self.store is None:
+            return len(self.get_feeds(source_filter, days_filter, category))
+        cutoff_date = (
+            datetime.now(UTC) - timedelta(days=days_filter) if days_filter else None
+        )
+        return self.store.count(
+            source=None if source_filter == "All" else source_filter,
+            category=category,
+            since=cutoff_date,
+        )
+
+    def _feed_to_dict(self, item: FeedItem) -> dict[str, Any]:
+        return {
+            "title": item.title,
+            "link": item.link,
+            "summary": item.summary,
+            "published": item.published.isoformat(),
+            "source": item.source,
+            "guid": item.guid,
+            "priority": self.SOURCE_PRIORITY.get(item.source, 999),
+            "color": self.SOURCE_COLORS.get(item.source, "#666666"),
+            "category": self._get_source_category(item.source),
+        }
 
     def _get_source_category(self, source: str) -> str:
         """Get the category for a source."""
@@ -476,59 +664,40 @@ class RSSFeedService:
             ),
             "sources": list(self.FEED_SOURCES.keys()),
             "categories": self.SOURCE_CATEGORIES,
+            "stored_items": self.store.count() if self.store is not None else None,
         }
 
+    def threat_snapshot(self) -> ThreatSnapshot:
+        """Threat analysis of the current feed cache, rebuilt only on change."""
+        return self._threat_cache.snapshot(self.snapshot_version, self.feeds_cache)
+
     def analyze_threats(self) -> list[ThreatIndicator]:
         """Analyze feeds for cyber threats."""
-        feed_data = []
-        for item in self.feeds_cache:
-            feed_data.append(
-                {
-                    "title": item.title,
-                    "summary": item.summary,
-                    "source": item.source,
-                    "published": item.published,
-                }
-            )
+        return list(self.threat_snapshot().threats)
+
+    def get_threats_by_level(self, level: str) -> list[ThreatIndicator]:
+        return list(self.threat_snapshot().by_level.get(level.lower(), []))
+
+    def get_threats_by_ioc_type(self, ioc_type: str) -> list[ThreatIndicator]:
+        return list(self.threat_snapshot().by_ioc_type.get(ioc_type.lower(), []))
+
+    def get_banking_threats(self) -> list[ThreatIndicator]:
+        return list(self.threat_snapshot().banking_threats)
 
-        return self.threat_analyzer.analyze_feed_content(feed_data)
+    def get_indicator(self, value: str) -> IndicatorRecord | None:
+        return self.threat_snapshot().indicators.get(value)
+
+    def get_indicators(self, ioc_type: str | None = None) -> list[IndicatorRecord]:
+        indicators = self.threat_snapshot().indicators
+        return indicators.by_type(ioc_type) if ioc_type else indicators.records()
 
     def get_security_recommendations(self) -> list[SecurityRecommendation]:
         """Get security recommendations based on threat analysis."""
-        threats = self.analyze_threats()
-        return self.threat_analyzer.generate_security_recommendations(threats)
+        return list(self.threat_snapshot().recommendations)
 
     def get_threat_summary(self) -> dict[str, Any]:
         """Get a summary of current threats."""
-        threats = self.analyze_threats()
-        recommendations = self.get_security_recommendations()
-
-        threat_counts = {}
-        for threat in threats:
-            threat_type = threat.threat_type.value
-            if threat_type not in threat_counts:
-                threat_counts[threat_type] = 0
-            threat_counts[threat_type] += 1
-
-        return {
-            "total_threats": len(threats),
-            "threat_counts": threat_counts,
-            "recommendations_count": len(recommendations),
-            "critical_threats": len(
-                [t for t in threats if t.threat_level.value == "critical"]
-            ),
-            "high_threats": len([t for t in threats if t.threat_level.value == "high"]),
-            "banking_specific": len(
-                [
-                    t
-                    for t in threats
-                    if any(
-                        kw in t.description.lower()
-                        for kw in ["bank", "financial", "payment"]
-                    )
-                ]
-            ),
-        }
+        return dict(self.threat_snapshot().summary)
 
     def add_feed_source(
         self,
@@ -574,6 +743,11 @@ class RSSFeedService:
             self.FEED_SOURCES.pop(name, None)
             self.SOURCE_PRIORITY.pop(name, None)
             self.SOURCE_COLORS.pop(name, None)
+            self.feeds_cache = [
+                item for item in self.feeds_cache if item.source != name
+            ]
+            if self.store is not None:
+                self.store.delete_source(name)
 
             # Remove from categories
             for category, sources in self.SOURCE_CATEGORIES.items():
@@ -603,18 +777,29 @@ class RSSFeedService:
             "sources": {},
         }
 
+        # Count items and the newest entry per source in one pass
+        if self.store is not None:
+            source_stats = self.store.source_stats()
+        else:
+            source_stats = {}
+            for item in self.feeds_cache:
+                stats = source_stats.setdefault(
+                    item.source, {"item_count": 0, "latest": item.published}
+                )
+                stats["item_count"] += 1
+                stats["latest"] = max(stats["latest"], item.published)
+
         # Check each source
         for source_name, url in self.FEED_SOURCES.items():
-            source_feeds = [f for f in self.feeds_cache if f.source == source_name]
+            stats = source_stats.get(source_name)
             health_status["sources"][source_name] = {
                 "url": url,
                 "category": self._get_source_category(source_name),
                 "priority": self.SOURCE_PRIORITY.get(source_name, 5),
-                "feed_count": len(source_feeds),
-                "latest_feed": (
-                    source_feeds[0].published.isoformat() if source_feeds else None
-                ),
-                "status": "active" if source_feeds else "inactive",
+                "feed_count": stats["item_count"] if stats else 0,
+                "latest_feed": stats["latest"].isoformat() if stats else None,
+                "status": "active" if stats else "inactive",
+                "schedule": self.scheduler.state(source_name).status(),
             }
 
         return health_status
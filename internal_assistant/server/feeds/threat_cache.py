@@ -0,0 +1,136 @@
+"""Threat analysis cached per feed snapshot.
+
+``RSSFeedService`` bumps a snapshot version whenever its feed cache is
+replaced. ``ThreatAnalysisCache`` keeps the analysis of each feed item,
+keyed by source and entry key, and rebuilds the aggregates (threat list,
+per-level and per-IOC-type indexes, indicator index, recommendations,
+summary) only when the version changes. Between refreshes every threat
+endpoint is served from the same ``ThreatSnapshot``.
+"""
+
+import logging
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from internal_assistant.server.feeds.feed_scheduler import entry_key
+from internal_assistant.server.threat_intelligence.ioc_extractor import IndicatorIndex
+from internal_assistant.server.threat_intelligence.threat_analyzer import (
+    SecurityRecommendation,
+    ThreatIndicator,
+    ThreatIntelligenceAnalyzer,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keywords used by the banking-specific threat endpoint
+BANKING_KEYWORDS = ("bank", "financial", "payment", "transaction")
+# The summary has always counted without "transaction"
+SUMMARY_BANKING_KEYWORDS = ("bank", "financial", "payment")
+
+
+@dataclass(frozen=True)
+class ThreatSnapshot:
+    """Threat analysis of one feed snapshot. Treat the lists as read-only."""
+
+    version: int
+    threats: list[ThreatIndicator]
+    recommendations: list[SecurityRecommendation]
+    by_level: dict[str, list[ThreatIndicator]]
+    by_ioc_type: dict[str, list[ThreatIndicator]]
+    banking_threats: list[ThreatIndicator]
+    indicators: IndicatorIndex
+    summary: dict[str, Any]
+
+
+class ThreatAnalysisCache:
+    """Memoizes per-item threat analysis and the aggregates built from it."""
+
+    def __init__(self, analyzer: ThreatIntelligenceAnalyzer) -> None:
+        self._analyzer = analyzer
+        # (source, entry key) -> (title, summary, threats)
+        self._items: dict[tuple[str, str], tuple[str, str, list[ThreatIndicator]]] = {}
+        self._snapshot: ThreatSnapshot | None = None
+        self._lock = threading.Lock()
+
+    def snapshot(self, version: int, items: Sequence[Any]) -> ThreatSnapshot:
+        """Analysis of ``items`` (``FeedItem``), rebuilt when ``version`` changes."""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        with self._lock:
+            # Another thread may have built it while we waited
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = self._build(version, items)
+            return self._snapshot
+
+    def _build(self, version: int, items: Sequence[Any]) -> ThreatSnapshot:
+        analyzed: dict[tuple[str, str], tuple[str, str, list[ThreatIndicator]]] = {}
+        threats: list[ThreatIndicator] = []
+        indicators = IndicatorIndex()
+        reused = 0
+        for item in items:
+            key = (item.source, entry_key(item.guid, item.link))
+            cached = self._items.get(key)
+            if cached is not None and cached[:2] == (item.title, item.summary):
+                reused += 1
+            else:
+                cached = (
+                    item.title,
+                    item.summary,
+                    self._analyzer.analyze_feed_item(
+                        {
+                            "title": item.title,
+                            "summary": item.summary,
+                            "source": item.source,
+                            "published": item.published,
+                        }
+                    ),
+                )
+            analyzed[key] = cached
+            threats.extend(cached[2])
+            # Counted once per item, however many threat types it matched
+            for value, ioc_type in {(t.indicator, t.ioc_type) for t in cached[2]}:
+                indicators.add(value, ioc_type, item.published, item.source)
+        # Items that left the cache are dropped with the old entries
+        self._items = analyzed
+
+        by_level: dict[str, list[ThreatIndicator]] = {}
+        by_ioc_type: dict[str, list[ThreatIndicator]] = {}
+        threat_counts: dict[str, int] = {}
+        banking_threats = []
+        summary_banking = 0
+        for threat in threats:
+            by_level.setdefault(threat.threat_level.value, []).append(threat)
+            by_ioc_type.setdefault(threat.ioc_type.lower(), []).append(threat)
+            threat_type = threat.threat_type.value
+            threat_counts[threat_type] = threat_counts.get(threat_type, 0) + 1
+            description = threat.description.lower()
+            if any(kw in description for kw in BANKING_KEYWORDS):
+                banking_threats.append(threat)
+            if any(kw in description for kw in SUMMARY_BANKING_KEYWORDS):
+                summary_banking += 1
+
+        recommendations = self._analyzer.generate_security_recommendations(threats)
+        logger.debug(
+            f"Threat snapshot {version}: {len(threats)} threats, "
+            f"{reused}/{len(analyzed)} items reused"
+        )
+        return ThreatSnapshot(
+            version=version,
+            threats=threats,
+            recommendations=recommendations,
+            by_level=by_level,
+            by_ioc_type=by_ioc_type,
+            banking_threats=banking_threats,
+            indicators=indicators,
+            summary={
+                "total_threats": len(threats),
+                "threat_counts": threat_counts,
+                "recommendations_count": len(recommendations),
+                "critical_threats": len(by_level.get("critical", [])),
+                "high_threats": len(by_level.get("high", [])),
+                "banking_specific": summary_banking,
+            },
+        )
@@ -2,8 +2,9 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 
+from internal_assistant.di import global_injector
 from internal_assistant.server.feeds.feeds_service import RSSFeedService
 
 threat_intelligence_router = APIRouter(
@@ -11,9 +12,13 @@ threat_intelligence_router = APIRouter(
 )
 
 
+def _feed_service() -> RSSFeedService:
+    return global_injector.get(RSSFeedService)
+
+
 @threat_intelligence_router.get("/threats")
 def get_current_threats(
-    feed_service: RSSFeedService = Depends(),
+    feed_service: RSSFeedService = Depends(_feed_service),
 ) -> list[dict[str, Any]]:
     """Get current cyber threats from analyzed feeds."""
     threats = feed_service.analyze_threats()
@@ -35,7 +40,7 @@ def get_current_threats(
 
 @threat_intelligence_router.get("/recommendations")
 def get_security_recommendations(
-    feed_service: RSSFeedService = Depends(),
+    feed_service: RSSFeedService = Depends(_feed_service),
 ) -> list[dict[str, Any]]:
     """Get security recommendations based on threat analysis."""
     recommendations = feed_service.get_security_recommendations()
@@ -55,18 +60,19 @@ def get_security_recommendations(
 
 
 @threat_intelligence_router.get("/summary")
-def get_threat_summary(feed_service: RSSFeedService = Depends()) -> dict[str, Any]:
+def get_threat_summary(
+    feed_service: RSSFeedService = Depends(_feed_service),
+) -> dict[str, Any]:
     """Get a summary of current threat landscape."""
     return feed_service.get_threat_summary()
 
 
 @threat_intelligence_router.get("/threats/critical")
 def get_critical_threats(
-    feed_service: RSSFeedService = Depends(),
+    feed_service: RSSFeedService = Depends(_feed_service),
 ) -> list[dict[str, Any]]:
     """Get only critical threats requiring immediate attention."""
-    threats = feed_service.analyze_threats()
-    critical_threats = [t for t in threats if t.threat_level.value == "critical"]
+    critical_threats = feed_service.get_threats_by_level("critical")
 
     return [
         {
@@ -84,18 +90,10 @@ def get_critical_threats(
 
 @threat_intelligence_router.get("/threats/banking-specific")
 def get_banking_specific_threats(
-    feed_service: RSSFeedService = Depends(),
+    feed_service: RSSFeedService = Depends(_feed_service),
 ) -> list[dict[str, Any]]:
     """Get threats specifically targeting banking/financial institutions."""
-    threats = feed_service.analyze_threats()
-    banking_threats = [
-        t
-        for t in threats
-        if any(
-            kw in t.description.lower()
-            for kw in ["bank", "financial", "payment", "transaction"]
-        )
-    ]
+    banking_threats = feed_service.get_banking_threats()
 
     return [
         {
@@ -114,7 +112,7 @@ def get_banking_specific_threats(
 
 @threat_intelligence_router.get("/recommendations/priority/{priority}")
 def get_recommendations_by_priority(
-    priority: str, feed_service: RSSFeedService = Depends()
+    priority: str, feed_service: RSSFeedService = Depends(_feed_service)
 ) -> list[dict[str, Any]]:
     """Get security recommendations filtered by priority level."""
     recommendations = feed_service.get_security_recommendations()
@@ -136,11 +134,10 @@ def get_recommendations_by_priority(
 
 @threat_intelligence_router.get("/indicators/{ioc_type}")
 def get_indicators_by_type(
-    ioc_type: str, feed_service: RSSFeedService = Depends()
+    ioc_type: str, feed_service: RSSFeedService = Depends(_feed_service)
 ) -> list[dict[str, Any]]:
     """Get threat indicators filtered by IOC type (IP, domain, hash)."""
-    threats = feed_service.analyze_threats()
-    filtered_threats = [t for t in threats if t.ioc_type.lower() == ioc_type.lower()]
+    filtered_threats = feed_service.get_threats_by_ioc_type(ioc_type)
 
     return [
         {
@@ -156,9 +153,33 @@ def get_indicators_by_type(
     ]
 
 
+@threat_intelligence_router.get("/iocs")
+def get_indicator_index(
+    ioc_type: str | None = None,
+    feed_service: RSSFeedService = Depends(_feed_service),
+) -> dict[str, Any]:
+    """Get deduplicated indicators with first/last seen, sources and counts."""
+    records = feed_service.get_indicators(ioc_type)
+    return {
+        "indicators": [record.to_dict() for record in records],
+        "total": len(records),
+    }
+
+
+@threat_intelligence_router.get("/iocs/{value}")
+def get_indicator(
+    value: str, feed_service: RSSFeedService = Depends(_feed_service)
+) -> dict[str, Any]:
+    """Look up one indicator value."""
+    record = feed_service.get_indicator(value)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Indicator {value} not found")
+    return record.to_dict()
+
+
 @threat_intelligence_router.get("/compliance-impact")
 def get_compliance_impact_analysis(
-    feed_service: RSSFeedService = Depends(),
+    feed_service: RSSFeedService = Depends(_feed_service),
 ) -> dict[str, Any]:
     """Get analysis of how current threats impact banking compliance."""
     recommendations = feed_service.get_security_recommendations()
@@ -141,42 +141,10 @@ def delete_by_filenames(
 
     Returns a dict with deletion statistics.
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-
     service = injector.get(IngestService)
     file_names = body.file_names
 
     if not file_names:
         raise HTTPException(400, "No file names provided")
 
-    # Get all ingested documents
-    ingested_docs = service.list_ingested()
-
-    # Find documents matching the filenames
-    docs_to_delete = []
-    for doc in ingested_docs:
-        if doc.doc_metadata and doc.doc_metadata.get("file_name") in file_names:
-            docs_to_delete.append(doc)
-
-    # Delete each matching document
-    deleted_count = 0
-    failed_count = 0
-    for doc in docs_to_delete:
-        try:
-            service.delete(doc.doc_id)
-            deleted_count += 1
-            logger.info(
-                f"Deleted document {doc.doc_id} ({doc.doc_metadata.get('file_name')})"
-            )
-        except Exception as e:
-            failed_count += 1
-            logger.error(f"Failed to delete {doc.doc_id}: {e}")
-
-    return {
-        "deleted": deleted_count,
-        "failed": failed_count,
-        "requested": len(file_names),
-        "found": len(docs_to_delete),
-    }
+    return service.delete_by_filenames(file_names)
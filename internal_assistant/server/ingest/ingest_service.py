@@ -1,7 +1,7 @@
 import logging
 import tempfile
 from pathlib import Path
-from typing import TYPE_CHECKING, AnyStr, BinaryIO
+from typing import TYPE_CHECKING, Any, AnyStr, BinaryIO
 
 from injector import inject, singleton
 from llama_index.core.node_parser import SentenceWindowNodeParser
@@ -10,22 +10,34 @@ from llama_index.core.storage import StorageContext
 from internal_assistant.components.embedding.embedding_component import (
     EmbeddingComponent,
 )
+from internal_assistant.components.ingest.document_catalog import (
+    CatalogEntry,
+    DocumentCatalog,
+    assess_chunk_quality,
+)
 from internal_assistant.components.ingest.ingest_component import (
     get_ingestion_component,
 )
 from internal_assistant.components.ingest.ingest_helper import IngestionHelper
 from internal_assistant.components.llm.llm_component import LLMComponent
+from internal_assistant.components.node_store.docstore_journal import (
+    JournaledKVStore,
+)
 from internal_assistant.components.node_store.node_store_component import (
     NodeStoreComponent,
 )
 from internal_assistant.components.vector_store.vector_store_component import (
     VectorStoreComponent,
 )
+from internal_assistant.server.chat.response_cache import ResponseCache
 from internal_assistant.server.ingest.model import IngestedDoc
 from internal_assistant.settings.settings import settings
 
 if TYPE_CHECKING:
-    from llama_index.core.storage.docstore.types import RefDocInfo
+    from internal_assistant.server.ingest.storage_consistency_service import (
+        ConsistencyReport,
+        StorageConsistencyService,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -39,11 +51,14 @@ class IngestService:
         vector_store_component: VectorStoreComponent,
         embedding_component: EmbeddingComponent,
         node_store_component: NodeStoreComponent,
+        response_cache: ResponseCache,
     ) -> None:
         self.llm_service = llm_component
+        self.response_cache = response_cache
         self.vector_store_component = vector_store_component
         self.node_store_component = node_store_component
         self.embedding_component = embedding_component
+        self._listing_cache: tuple[int, list[IngestedDoc]] | None = None
 
         # Initialize storage context with health checks
         logger.info(
@@ -313,8 +328,33 @@ class IngestService:
             )
 
             consistency_service = StorageConsistencyService(self.storage_context)
-            report = consistency_service.check_consistency()
+            if settings().data.background_consistency_check:
+                # The vector scan can be long on large stores; don't block boot
+                consistency_service.check_consistency_in_background(
+                    lambda report: self._handle_consistency_report(
+                        consistency_service, report
+                    )
+                )
+                logger.info(
+                    "🔍 [STARTUP_CHECK] Consistency check running in the background"
+                )
+                return
+
+            self._handle_consistency_report(
+                consistency_service, consistency_service.check_consistency()
+            )
 
+        except Exception as e:
+            logger.warning(f"⚠️ [STARTUP_CHECK] Consistency check failed: {e}")
+            logger.warning("⚠️ [STARTUP_CHECK] Continuing with startup...")
+
+    def _handle_consistency_report(
+        self,
+        consistency_service: "StorageConsistencyService",
+        report: "ConsistencyReport",
+    ) -> None:
+        """Log a consistency report and auto-repair high priority issues."""
+        try:
             if not report.inconsistencies:
                 logger.info(
                     "✅ [STARTUP_CHECK] Storage is consistent - no issues found"
@@ -333,9 +373,15 @@ class IngestService:
             # Auto-repair non-critical issues
             if report.high_priority_issues:
                 logger.info("🔧 [STARTUP_CHECK] Auto-repairing high priority issues...")
-                repair_stats = consistency_service.repair_inconsistencies(
-                    report, auto_repair=True
-                )
+                with self.ingest_component.index_lock:
+                    # Confirm each finding per document before anything is
+                    # deleted; ingestion may also have run since the scan
+                    report.inconsistencies = consistency_service.revalidate(
+                        report.inconsistencies
+                    )
+                    repair_stats = consistency_service.repair_inconsistencies(
+                        report, auto_repair=True
+                    )
                 logger.info(f"🔧 [STARTUP_CHECK] Repair completed: {repair_stats}")
 
                 # Re-check after repair
@@ -355,25 +401,29 @@ class IngestService:
                     logger.critical(f"🚨 [STARTUP_CHECK] CRITICAL: {issue.description}")
 
         except Exception as e:
-            logger.warning(f"⚠️ [STARTUP_CHECK] Consistency check failed: {e}")
-            logger.warning("⚠️ [STARTUP_CHECK] Continuing with startup...")
+            logger.warning(f"⚠️ [STARTUP_CHECK] Consistency repair failed: {e}")
 
     def _should_replace_file(
         self, file_path: Path, file_name: str
     ) -> tuple[bool, list[IngestedDoc]]:
-        """Determine if file should be replaced based on content comparison."""
-        existing_docs = []
-
-        # Find existing documents with same name
-        for ingested_document in self.list_ingested():
-            if (
-                ingested_document.doc_metadata
-                and ingested_document.doc_metadata.get("file_name") == file_name
-            ):
-                existing_docs.append(ingested_document)
-
-        if not existing_docs:
+        """Determine if file should be replaced based on content comparison.
+
+        Existing documents come from the catalog's file name index. A file
+        whose size and modification time match an ingested copy is skipped
+        without being read; otherwise its content hash is compared.
+        """
+        self._refresh_catalog_if_stale()
+        entries = self.ingest_component.catalog.entries_for_file(file_name)
+        if not entries:
             return True, []  # No existing docs, should ingest
+        existing_docs = [self._ingested_doc(entry) for entry in entries]
+
+        file_stat = IngestionHelper.get_file_stat(file_path)
+        if file_stat and any(entry.matches_file_stat(*file_stat) for entry in entries):
+            logger.info(
+                f"File {file_name} size and mtime unchanged - skipping duplicate"
+            )
+            return False, existing_docs
 
         # Get content hash of current file
         current_hash = IngestionHelper._get_file_hash(file_path)
@@ -384,13 +434,9 @@ class IngestService:
             return True, existing_docs  # Couldn't compute hash, replace to be safe
 
         # Check if any existing doc has the same content hash
-        for doc in existing_docs:
-            stored_hash = (
-                doc.doc_metadata.get("content_hash") if doc.doc_metadata else None
-            )
-            if stored_hash == current_hash:
-                logger.info(f"File {file_name} content unchanged - skipping duplicate")
-                return False, existing_docs  # Same content, don't replace
+        if any(entry.content_hash == current_hash for entry in entries):
+            logger.info(f"File {file_name} content unchanged - skipping duplicate")
+            return False, existing_docs  # Same content, don't replace
 
         logger.info(f"File {file_name} content changed - replacing")
         return True, existing_docs  # Different content, replace
@@ -427,12 +473,14 @@ class IngestService:
             logger.info(
                 f"Deleting {len(existing_docs)} existing documents for {file_name}"
             )
-            for doc in existing_docs:
-                self.delete(doc.doc_id)
+            self.delete_many([doc.doc_id for doc in existing_docs])
 
         try:
             documents = self.ingest_component.ingest(file_name, file_data)
             logger.info(f"Finished ingestion file_name={file_name}")
+            self.response_cache.invalidate_documents(
+                document.doc_id for document in documents
+            )
             return [IngestedDoc.from_document(document) for document in documents]
         except Exception as e:
             logger.error(f"Failed to ingest {file_name} due to {e}", exc_info=True)
@@ -466,60 +514,28 @@ class IngestService:
             )
             docs_before = []
 
-        ingested_docs = []
-        successful = 0
+        # Resolve duplicates up front so the ingest component receives the whole
+        # set of files at once; parallel components parse and embed them in batches
+        files_to_ingest: list[tuple[str, Path]] = []
         failed = 0
         skipped = 0
 
         for i, (file_name, file_data) in enumerate(files, 1):
             try:
-                logger.info(
-                    "📥 [BULK_INGEST] [%d/%d] Started ingesting file=%s (path: %s)",
-                    i,
-                    len(files),
-                    file_name,
-                    file_data,
-                )
-
-                # Check file exists and get size
-                if file_data.exists():
-                    file_size = file_data.stat().st_size
-                    logger.info(
-                        "📥 [BULK_INGEST] [%d/%d] File size: %d bytes",
-                        i,
-                        len(files),
-                        file_size,
-                    )
-                else:
+                if not file_data.exists():
+                    failed += 1
                     logger.error(
                         "📥 [BULK_INGEST] [%d/%d] File does not exist: %s",
                         i,
                         len(files),
                         file_data,
                     )
+                    continue
 
-                documents = self.ingest_file(file_name, file_data)
-
-                if documents:
-                    ingested_docs.extend(documents)
-                    successful += 1
-                    logger.info(
-                        "📥 [BULK_INGEST] [%d/%d] ✅ Completed ingesting file=%s (%d documents created)",
-                        i,
-                        len(files),
-                        file_name,
-                        len(documents),
-                    )
-
-                    # Log document IDs for tracking
-                    doc_ids = [doc.doc_id for doc in documents]
-                    logger.info(
-                        "📥 [BULK_INGEST] [%d/%d] Document IDs: %s",
-                        i,
-                        len(files),
-                        doc_ids,
-                    )
-                else:
+                should_replace, existing_docs = self._should_replace_file(
+                    file_data, file_name
+                )
+                if not should_replace:
                     skipped += 1
                     logger.info(
                         "📥 [BULK_INGEST] [%d/%d] ⏭️ Skipped duplicate file=%s",
@@ -527,11 +543,16 @@ class IngestService:
                         len(files),
                         file_name,
                     )
+                    continue
+
+                if existing_docs:
+                    self.delete_many([doc.doc_id for doc in existing_docs])
+                files_to_ingest.append((file_name, file_data))
 
             except Exception as e:
                 failed += 1
                 logger.error(
-                    "📥 [BULK_INGEST] [%d/%d] ❌ Failed to ingest file=%s, path=%s, error: %s",
+                    "📥 [BULK_INGEST] [%d/%d] ❌ Failed to prepare file=%s, path=%s, error: %s",
                     i,
                     len(files),
                     file_name,
@@ -540,16 +561,28 @@ class IngestService:
                     exc_info=True,
                 )
 
-            # Progress report every 5 files (more frequent for debugging)
-            if i % 5 == 0:
-                logger.info(
-                    "📥 [BULK_INGEST] Progress: %d/%d processed. Success: %d, Skipped: %d, Failed: %d",
-                    i,
-                    len(files),
-                    successful,
-                    skipped,
-                    failed,
-                )
+        logger.info(
+            "📥 [BULK_INGEST] Sending %d files to %s",
+            len(files_to_ingest),
+            type(self.ingest_component).__name__,
+        )
+        try:
+            documents = self.ingest_component.bulk_ingest(files_to_ingest)
+        except Exception as e:
+            logger.error(
+                "📥 [BULK_INGEST] ❌ Bulk ingestion failed: %s", e, exc_info=True
+            )
+            documents = []
+
+        ingested_docs = [IngestedDoc.from_document(document) for document in documents]
+        self.response_cache.invalidate_documents(doc.doc_id for doc in ingested_docs)
+        ingested_file_names = {
+            document.metadata.get("file_name") for document in documents
+        }
+        successful = sum(
+            1 for file_name, _ in files_to_ingest if file_name in ingested_file_names
+        )
+        failed += len(files_to_ingest) - successful
 
         logger.info(
             "📥 [BULK_INGEST] Bulk ingestion processing complete! Total: %d, Success: %d, Skipped: %d, Failed: %d",
@@ -608,142 +641,88 @@ class IngestService:
         logger.info("📥 [BULK_INGEST] Bulk ingestion fully complete")
         return ingested_docs
 
-    def list_ingested(self) -> list[IngestedDoc]:
-        """List all ingested documents from persistent storage.
+    @property
+    def catalog_version(self) -> int:
+        """Version of the document catalog, bumped on every ingest or delete.
 
-        This method reads directly from the docstore to ensure it gets
-        the most up-to-date data, including documents added since server startup.
+        UI code can compare this against a previously seen value to skip
+        rebuilding views of the library when nothing changed.
         """
-        logger.info("🔍 [LIST_INGESTED] ===== STARTING LIST_INGESTED =====")
-        ingested_docs: list[IngestedDoc] = []
-        try:
-            # CRITICAL FIX: Force docstore to reload from disk
-            # SimpleDocumentStore caches ref_doc_info in memory, so we need to force reload
-            docstore = self.storage_context.docstore
-
-            # Force reload from disk if the docstore supports it
-            if hasattr(docstore, "from_persist_dir"):
-                from internal_assistant.paths import local_data_path
-
-                logger.info(
-                    "📖 [LIST_INGESTED] Force-reloading docstore from disk to get fresh data"
-                )
-                try:
-                    # Reload the docstore from disk to get latest data
-                    fresh_docstore = type(docstore).from_persist_dir(
-                        str(local_data_path)
-                    )
-                    docstore = fresh_docstore
-                    # Update storage context with fresh docstore
-                    self.storage_context.docstore = fresh_docstore
-                    logger.info(
-                        "✅ [LIST_INGESTED] Docstore successfully reloaded from disk"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"⚠️ [LIST_INGESTED] Could not reload docstore from disk: {e}"
-                    )
-                    # Fall back to existing docstore
-
-            # CRITICAL FIX: Try multiple methods to get documents
-            logger.info("📖 [LIST_INGESTED] Reading documents from persistent docstore")
-
-            # Method 1: Try get_all_ref_doc_info (preferred method)
-            ref_docs: dict[str, RefDocInfo] | None = None
-            if hasattr(docstore, "get_all_ref_doc_info"):
-                ref_docs = docstore.get_all_ref_doc_info()
-                logger.info(
-                    f"📖 [LIST_INGESTED] get_all_ref_doc_info() returned: {len(ref_docs) if ref_docs else 0} entries"
-                )
-
-            if ref_docs and len(ref_docs) > 0:
-                logger.debug(
-                    f"📖 [LIST_INGESTED] Found {len(ref_docs)} documents via ref_doc_info"
-                )
-                for doc_id, ref_doc_info in ref_docs.items():
-                    doc_metadata = None
-                    if ref_doc_info is not None and ref_doc_info.metadata is not None:
-                        doc_metadata = IngestedDoc.curate_metadata(
-                            ref_doc_info.metadata
-                        )
-                        logger.debug(
-                            f"📖 [LIST_INGESTED] Processing doc {doc_id}: {doc_metadata.get('file_name', 'Unknown')}"
-                        )
+        self._refresh_catalog_if_stale()
+        return self.ingest_component.catalog.version
+
+    @property
+    def catalog(self) -> DocumentCatalog:
+        """The up-to-date document catalog, for file and category lookups."""
+        self._refresh_catalog_if_stale()
+        return self.ingest_component.catalog
+
+    def _refresh_catalog_if_stale(self) -> None:
+        """Reload the docstore only if another process wrote it since last sync."""
+        catalog = self.ingest_component.catalog
+        if not catalog.is_stale():
+            return
+
+        docstore = self.storage_context.docstore
+        kvstore = getattr(docstore, "_kvstore", None)
+        if isinstance(kvstore, JournaledKVStore):
+            logger.info(
+                "📖 [LIST_INGESTED] docstore changed on disk, replaying snapshot and journal"
+            )
+            if not kvstore.reload():
+                # Local mutations are still uncommitted; retry on the next call
+                return
+        elif hasattr(docstore, "from_persist_dir"):
+            from internal_assistant.paths import local_data_path
 
-                    # Assess document quality
-                    quality_info = self.assess_document_quality(doc_id)
-
-                    ingested_docs.append(
-                        IngestedDoc(
-                            object="ingest.document",
-                            doc_id=doc_id,
-                            doc_metadata=doc_metadata,
-                            processing_status=quality_info.get("processing_status", "indexed"),
-                            quality_score=quality_info.get("quality_score", 100),
-                            chunk_count=quality_info.get("chunk_count", 0),
-                            error_message=quality_info.get("error_message"),
-                        )
-                    )
-            else:
-                # Method 2: Fallback - get documents from docstore/data
+            logger.info(
+                "📖 [LIST_INGESTED] docstore.json changed on disk, reloading catalog"
+            )
+            try:
+                docstore = type(docstore).from_persist_dir(str(local_data_path))
+                self.storage_context.docstore = docstore
+            except Exception as e:
                 logger.warning(
-                    "⚠️ [LIST_INGESTED] ref_doc_info empty, trying alternative method via get_all_document_hashes"
+                    f"⚠️ [LIST_INGESTED] Could not reload docstore from disk: {e}"
                 )
+        catalog.rebuild(docstore)
+
+    @staticmethod
+    def _ingested_doc(entry: CatalogEntry) -> IngestedDoc:
+        return IngestedDoc(
+            object="ingest.document",
+            doc_id=entry.doc_id,
+            doc_metadata=(
+                IngestedDoc.curate_metadata(dict(entry.metadata))
+                if entry.metadata is not None
+                else None
+            ),
+            processing_status=entry.processing_status,
+            quality_score=entry.quality_score,
+            chunk_count=entry.chunk_count,
+            error_message=entry.error_message,
+        )
 
-                if hasattr(docstore, "get_all_document_hashes"):
-                    doc_hashes = docstore.get_all_document_hashes()
-                    logger.debug(
-                        f"📖 [LIST_INGESTED] Found {len(doc_hashes)} documents via document hashes"
-                    )
+    def list_ingested(self) -> list[IngestedDoc]:
+        """List all ingested documents.
 
-                    for doc_id in doc_hashes.keys():
-                        # Try to get the document from docstore
-                        try:
-                            doc = docstore.get_document(doc_id, raise_error=False)
-                            if doc:
-                                doc_metadata = (
-                                    IngestedDoc.curate_metadata(doc.metadata)
-                                    if hasattr(doc, "metadata") and doc.metadata
-                                    else None
-                                )
-
-                                # Assess document quality
-                                quality_info = self.assess_document_quality(doc_id)
-
-                                ingested_docs.append(
-                                    IngestedDoc(
-                                        object="ingest.document",
-                                        doc_id=doc_id,
-                                        doc_metadata=doc_metadata,
-                                        processing_status=quality_info.get("processing_status", "indexed"),
-                                        quality_score=quality_info.get("quality_score", 100),
-                                        chunk_count=quality_info.get("chunk_count", 0),
-                                        error_message=quality_info.get("error_message"),
-                                    )
-                                )
-                                logger.debug(
-                                    f"📖 [LIST_INGESTED] Retrieved doc via docstore/data: {doc_id}"
-                                )
-                        except Exception as e:
-                            logger.warning(
-                                f"⚠️ [LIST_INGESTED] Could not retrieve document {doc_id}: {e}"
-                            )
-                            continue
-                else:
-                    logger.error(
-                        "❌ [LIST_INGESTED] No methods available to list documents from docstore"
-                    )
-                    return ingested_docs
-        except ValueError as e:
-            logger.warning(
-                f"Got an exception when getting list of docs: {e}", exc_info=True
-            )
-            pass
+        Documents are served from the in-memory catalog maintained by the ingest
+        component. The docstore is only reloaded from disk when its file has been
+        modified outside of this process.
+        """
+        self._refresh_catalog_if_stale()
+        catalog = self.ingest_component.catalog
 
-        logger.info(
+        version = catalog.version
+        if self._listing_cache is not None and self._listing_cache[0] == version:
+            return list(self._listing_cache[1])
+
+        ingested_docs = [self._ingested_doc(entry) for entry in catalog.entries()]
+        self._listing_cache = (version, ingested_docs)
+        logger.debug(
             f"📖 [LIST_INGESTED] Returning {len(ingested_docs)} ingested documents"
         )
-        return ingested_docs
+        return list(ingested_docs)
 
     def delete(self, doc_id: str) -> None:
         """Delete an ingested document.
@@ -778,6 +757,7 @@ class IngestService:
 
         # Perform the deletion
         self.ingest_component.delete(doc_id)
+        self.response_cache.invalidate_documents([doc_id])
         logger.info(
             f"🗑️ [INGEST_SERVICE] Deletion command sent to ingest_component for doc_id: {doc_id}"
         )
@@ -797,6 +777,35 @@ class IngestService:
         except Exception as e:
             logger.warning(f"🗑️ [INGEST_SERVICE] Error verifying deletion: {e}")
 
+    def delete_many(self, doc_ids: list[str]) -> list[str]:
+        """Delete several ingested documents in one batch.
+
+        Unknown ids are skipped. Returns the ids that were deleted.
+        """
+        deleted = self.ingest_component.delete_many(doc_ids)
+        self.response_cache.invalidate_documents(deleted)
+        logger.info(
+            f"🗑️ [INGEST_SERVICE] Bulk deleted {len(deleted)}/{len(doc_ids)} documents"
+        )
+        return deleted
+
+    def delete_by_filenames(self, file_names: list[str]) -> dict[str, int]:
+        """Delete every document ingested from one of ``file_names``."""
+        self._refresh_catalog_if_stale()
+        catalog = self.ingest_component.catalog
+        doc_ids = [
+            doc_id
+            for file_name in dict.fromkeys(file_names)
+            for doc_id in catalog.doc_ids_for_file(file_name)
+        ]
+        deleted = self.delete_many(doc_ids) if doc_ids else []
+        return {
+            "deleted": len(deleted),
+            "failed": len(doc_ids) - len(deleted),
+            "requested": len(file_names),
+            "found": len(doc_ids),
+        }
+
     def delete_all(self) -> int:
         """Delete all ingested documents.
 
@@ -808,56 +817,37 @@ class IngestService:
         )
 
         try:
-            # Get list of all documents
-            documents = self.list_ingested()
-            doc_count = len(documents)
+            self._refresh_catalog_if_stale()
+            doc_ids = [
+                entry.doc_id for entry in self.ingest_component.catalog.entries()
+            ]
+            doc_count = len(doc_ids)
 
             if doc_count == 0:
                 logger.info("🗑️ [INGEST_SERVICE] No documents to delete")
                 return 0
 
             logger.warning(f"🗑️ [INGEST_SERVICE] Deleting {doc_count} documents")
-
-            # Delete each document
-            deleted_count = 0
-            failed_count = 0
-
-            for doc in documents:
-                try:
-                    logger.info(
-                        f"🗑️ [INGEST_SERVICE] Deleting document {deleted_count + 1}/{doc_count}: {doc.doc_id}"
-                    )
-                    self.delete(doc.doc_id)
-                    deleted_count += 1
-                except Exception as e:
-                    logger.error(
-                        f"❌ [INGEST_SERVICE] Failed to delete document {doc.doc_id}: {e}"
-                    )
-                    failed_count += 1
+            deleted_count = len(self.delete_many(doc_ids))
 
             # Verify all documents were deleted
-            remaining_docs = self.list_ingested()
-            if len(remaining_docs) > 0:
+            remaining = len(self.ingest_component.catalog.entries())
+            if remaining > 0:
                 logger.error(
-                    f"❌ [INGEST_SERVICE] DELETE ALL incomplete: {len(remaining_docs)} documents remain"
+                    f"❌ [INGEST_SERVICE] DELETE ALL incomplete: {remaining} documents remain"
                 )
             else:
                 logger.info(
                     f"✅ [INGEST_SERVICE] DELETE ALL completed: {deleted_count} documents deleted"
                 )
 
-            if failed_count > 0:
-                logger.warning(
-                    f"⚠️ [INGEST_SERVICE] DELETE ALL had {failed_count} failures"
-                )
-
             return deleted_count
 
         except Exception as e:
             logger.error(f"❌ [INGEST_SERVICE] DELETE ALL failed: {e}", exc_info=True)
             raise
 
-    def assess_document_quality(self, doc_id: str) -> dict[str, any]:
+    def assess_document_quality(self, doc_id: str) -> dict[str, Any]:
         """Assess document quality based on chunks and processing status.
 
         Args:
@@ -890,43 +880,9 @@ class IngestService:
                 )
                 chunk_count = 0
 
-            # Calculate quality score based on chunk count
-            # Scoring thresholds:
-            # - 0 chunks = 0 (failed)
-            # - 1-2 chunks = 40 (low quality)
-            # - 3-5 chunks = 70 (medium quality)
-            # - 6-10 chunks = 90 (good quality)
-            # - 10+ chunks = 100 (excellent quality)
-
-            if chunk_count == 0:
-                quality_score = 0
-                processing_status = "failed"
-                error_message = "No chunks generated during ingestion"
-            elif chunk_count <= 2:
-                quality_score = 40
-                processing_status = "low_quality"
-                error_message = None
-            elif chunk_count <= 5:
-                quality_score = 70
-                processing_status = "indexed"
-                error_message = None
-            elif chunk_count <= 10:
-                quality_score = 90
-                processing_status = "indexed"
-                error_message = None
-            else:
-                quality_score = 100
-                processing_status = "indexed"
-                error_message = None
-
-            result = {
-                "processing_status": processing_status,
-                "quality_score": quality_score,
-                "chunk_count": chunk_count,
-            }
-
-            if error_message:
-                result["error_message"] = error_message
+            result = assess_chunk_quality(chunk_count)
+            processing_status = result["processing_status"]
+            quality_score = result["quality_score"]
 
             logger.info(
                 f"✅ [QUALITY_CHECK] Quality assessment for {doc_id}: "
@@ -1,18 +1,26 @@
 """Storage consistency service for detecting and repairing storage backend inconsistencies."""
 
 import logging
-from dataclasses import dataclass
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 
 from llama_index.core.storage.storage_context import StorageContext
 
 logger = logging.getLogger(__name__)
 
+# Points fetched per Qdrant scroll request
+SCROLL_PAGE_SIZE = 1000
+# Payload keys llama-index writes with the parent document id
+DOC_ID_PAYLOAD_KEYS = ("ref_doc_id", "doc_id")
+
 
 @dataclass
 class StorageInconsistency:
     """Represents a storage inconsistency that needs repair."""
 
-    type: str  # 'orphaned_document', 'missing_vector', 'orphaned_vector', 'metadata_mismatch'
+    type: str  # 'orphaned_document', 'orphaned_vector', 'orphaned_metadata', 'vector_count_mismatch', 'missing_collection'
     doc_id: str
     description: str
     severity: str  # 'low', 'medium', 'high', 'critical'
@@ -28,6 +36,9 @@ class ConsistencyReport:
     total_vectors: int
     inconsistencies: list[StorageInconsistency]
     healthy_documents: int
+    total_vector_points: int = 0
+    # The vector store could not be read; vector comparisons were skipped
+    vector_scan_failed: bool = False
 
     @property
     def critical_issues(self) -> list[StorageInconsistency]:
@@ -38,14 +49,29 @@ class ConsistencyReport:
         return [i for i in self.inconsistencies if i.severity in ["high", "critical"]]
 
 
+@dataclass
+class VectorScan:
+    """Per-document point counts from one pass over the vector collection."""
+
+    point_counts: dict[str, int] = field(default_factory=dict)
+    total_points: int = 0
+    # Points without a document id in their payload
+    unattributed_points: int = 0
+    pages: int = 0
+    seconds: float = 0.0
+
+
 class StorageConsistencyService:
     """Service for checking and repairing storage consistency."""
 
-    def __init__(self, storage_context: StorageContext):
+    def __init__(
+        self, storage_context: StorageContext, page_size: int = SCROLL_PAGE_SIZE
+    ):
         self.storage_context = storage_context
         self.vector_store = storage_context.vector_store
         self.docstore = storage_context.docstore
         self.index_store = storage_context.index_store
+        self.page_size = page_size
 
     def check_consistency(self) -> ConsistencyReport:
         """Perform comprehensive storage consistency check."""
@@ -56,8 +82,10 @@ class StorageConsistencyService:
         inconsistencies = []
 
         # Get document IDs from different stores
-        docstore_docs = self._get_docstore_documents()
-        vector_docs = self._get_vector_store_documents()
+        docstore_nodes = self._get_docstore_node_counts()
+        docstore_docs = set(docstore_nodes)
+        vector_counts = self._get_vector_point_counts(docstore_nodes)
+        vector_docs = set(vector_counts or ())
         index_docs = self._get_index_store_documents()
 
         logger.info(
@@ -65,8 +93,22 @@ class StorageConsistencyService:
             f"{len(vector_docs)} in vector store, {len(index_docs)} in index store"
         )
 
+        if vector_counts is None:
+            # Comparing against an unread store would flag every document
+            logger.warning(
+                "⚠️ [CONSISTENCY_CHECK] Vector store scan failed; "
+                "skipping vector comparisons"
+            )
+            vector_counts = {}
+            orphaned_docs: set[str] = set()
+            orphaned_vectors: set[str] = set()
+            scan_failed = True
+        else:
+            orphaned_docs = docstore_docs - vector_docs
+            orphaned_vectors = vector_docs - docstore_docs
+            scan_failed = False
+
         # Check for orphaned documents (in docstore but not in vector store)
-        orphaned_docs = docstore_docs - vector_docs
         for doc_id in orphaned_docs:
             inconsistencies.append(
                 StorageInconsistency(
@@ -80,7 +122,6 @@ class StorageConsistencyService:
             )
 
         # Check for orphaned vectors (in vector store but not in docstore)
-        orphaned_vectors = vector_docs - docstore_docs
         for doc_id in orphaned_vectors:
             inconsistencies.append(
                 StorageInconsistency(
@@ -93,6 +134,21 @@ class StorageConsistencyService:
                 )
             )
 
+        # Check that every document has as many points as it has nodes
+        for doc_id in docstore_docs & vector_docs:
+            expected, actual = docstore_nodes[doc_id], vector_counts[doc_id]
+            if expected != actual:
+                inconsistencies.append(
+                    StorageInconsistency(
+                        type="vector_count_mismatch",
+                        doc_id=doc_id,
+                        description=f"Document has {expected} nodes but {actual} vectors",
+                        severity="low",
+                        repair_action="reingest_document",
+                        metadata={"expected_points": expected, "actual_points": actual},
+                    )
+                )
+
         # Check for index store inconsistencies
         index_orphans = index_docs - docstore_docs
         for doc_id in index_orphans:
@@ -127,6 +183,8 @@ class StorageConsistencyService:
             total_vectors=len(vector_docs),
             inconsistencies=inconsistencies,
             healthy_documents=healthy_docs,
+            total_vector_points=sum(vector_counts.values()),
+            vector_scan_failed=scan_failed,
         )
 
         logger.info(
@@ -184,36 +242,166 @@ class StorageConsistencyService:
         logger.info(f"🏁 [CONSISTENCY_REPAIR] Repair completed: {repair_stats}")
         return repair_stats
 
+    def check_consistency_in_background(
+        self, on_complete: Callable[[ConsistencyReport], None] | None = None
+    ) -> threading.Thread:
+        """Run ``check_consistency`` on a daemon thread so startup is not blocked."""
+
+        def run() -> None:
+            try:
+                report = self.check_consistency()
+            except Exception as e:
+                logger.warning(f"⚠️ [CONSISTENCY_CHECK] Background check failed: {e}")
+                return
+            if on_complete is not None:
+                on_complete(report)
+
+        thread = threading.Thread(
+            target=run, name="storage-consistency-check", daemon=True
+        )
+        thread.start()
+        return thread
+
+    def revalidate(
+        self, inconsistencies: list[StorageInconsistency]
+    ) -> list[StorageInconsistency]:
+        """Keep only the issues that still hold, checking each document directly.
+
+        A background scan can race with ingestion; call this while holding the
+        ingest lock before repairing.
+        """
+        docstore_nodes = self._get_docstore_node_counts()
+        still_present = []
+        for issue in inconsistencies:
+            if issue.type == "missing_collection":
+                present = not self._check_vector_collection_exists()
+            elif issue.type == "orphaned_metadata":
+                present = issue.doc_id not in docstore_nodes
+            else:
+                points = self._count_document_points(issue.doc_id)
+                if points is None:
+                    present = True
+                elif issue.type == "orphaned_document":
+                    present = issue.doc_id in docstore_nodes and points == 0
+                elif issue.type == "orphaned_vector":
+                    present = issue.doc_id not in docstore_nodes and points > 0
+                else:
+                    present = docstore_nodes.get(issue.doc_id) not in (None, points)
+            if present:
+                still_present.append(issue)
+        return still_present
+
     def _get_docstore_documents(self) -> set[str]:
         """Get all document IDs from the document store."""
+        return set(self._get_docstore_node_counts())
+
+    def _get_docstore_node_counts(self) -> dict[str, int]:
+        """Number of nodes per document, from the docstore's ref doc info."""
         try:
             if hasattr(self.docstore, "get_all_ref_doc_info"):
-                doc_info = self.docstore.get_all_ref_doc_info()
-                return set(doc_info.keys()) if doc_info else set()
-            return set()
+                doc_info = self.docstore.get_all_ref_doc_info() or {}
+                return {doc_id: len(info.node_ids) for doc_id, info in doc_info.items()}
+            return {}
         except Exception as e:
             logger.warning(
                 f"⚠️ [CONSISTENCY_CHECK] Error getting docstore documents: {e}"
             )
-            return set()
+            return {}
 
-    def _get_vector_store_documents(self) -> set[str]:
+    def _get_vector_store_documents(
+        self, docstore_docs: set[str] | None = None
+    ) -> set[str]:
         """Get all document IDs from the vector store."""
+        docstore_nodes = (
+            dict.fromkeys(docstore_docs, 0) if docstore_docs is not None else None
+        )
+        return set(self._get_vector_point_counts(docstore_nodes) or ())
+
+    def _get_vector_point_counts(
+        self, docstore_nodes: dict[str, int] | None = None
+    ) -> dict[str, int] | None:
+        """Points per document in the vector store, None if it could not be read."""
         try:
-            # This is tricky for Qdrant - we need to query all vectors
-            # For now, we'll assume if collection exists, vector store is consistent with docstore
-            if self._check_vector_collection_exists():
-                # Could implement actual vector ID enumeration here if needed
-                return (
-                    self._get_docstore_documents()
-                )  # Assume consistency for existing collection
-            else:
-                return set()  # No collection = no vectors
+            if not self._check_vector_collection_exists():
+                return {}  # No collection = no vectors
+            if self._supports_scroll():
+                return self.scan_vector_store().point_counts
+            # Stores we cannot enumerate are assumed consistent with the docstore
+            if docstore_nodes is None:
+                docstore_nodes = self._get_docstore_node_counts()
+            return dict(docstore_nodes)
         except Exception as e:
             logger.warning(
                 f"⚠️ [CONSISTENCY_CHECK] Error getting vector store documents: {e}"
             )
-            return set()
+            return None
+
+    def scan_vector_store(self) -> VectorScan:
+        """Count points per document with paged scrolls; memory grows with documents, not points."""
+        scan = VectorScan()
+        started = time.perf_counter()
+        for doc_id in self._iter_vector_doc_ids(scan):
+            if doc_id is None:
+                scan.unattributed_points += 1
+            else:
+                scan.point_counts[doc_id] = scan.point_counts.get(doc_id, 0) + 1
+            scan.total_points += 1
+        scan.seconds = time.perf_counter() - started
+        logger.info(
+            f"📊 [CONSISTENCY_CHECK] Scanned {scan.total_points} vectors for "
+            f"{len(scan.point_counts)} documents in {scan.pages} pages "
+            f"({scan.seconds:.2f}s)"
+        )
+        return scan
+
+    def _iter_vector_doc_ids(self, scan: VectorScan) -> Iterator[str | None]:
+        # Only the document id payload is requested; vectors are never loaded
+        client = self.vector_store.client
+        offset = None
+        while True:
+            points, offset = client.scroll(
+                collection_name=self._get_collection_name(),
+                limit=self.page_size,
+                offset=offset,
+                with_payload=list(DOC_ID_PAYLOAD_KEYS),
+                with_vectors=False,
+            )
+            scan.pages += 1
+            for point in points:
+                payload = point.payload or {}
+                yield next(
+                    (
+                        payload[key]
+                        for key in DOC_ID_PAYLOAD_KEYS
+                        if payload.get(key) not in (None, "None")
+                    ),
+                    None,
+                )
+            if offset is None:
+                return
+
+    def _count_document_points(self, doc_id: str) -> int | None:
+        """Exact point count for one document, or None if it cannot be counted."""
+        if not self._supports_scroll():
+            return None
+        from qdrant_client import models
+
+        return self.vector_store.client.count(
+            collection_name=self._get_collection_name(),
+            count_filter=models.Filter(
+                must=[
+                    models.FieldCondition(
+                        key=DOC_ID_PAYLOAD_KEYS[0],
+                        match=models.MatchValue(value=doc_id),
+                    )
+                ]
+            ),
+            exact=True,
+        ).count
+
+    def _supports_scroll(self) -> bool:
+        client = getattr(self.vector_store, "client", None)
+        return hasattr(client, "scroll") and hasattr(client, "count")
 
     def _get_index_store_documents(self) -> set[str]:
         """Get all document IDs from the index store."""
@@ -244,6 +432,10 @@ class StorageConsistencyService:
 
     def _get_collection_name(self) -> str:
         """Get the expected collection name."""
+        collection_name = getattr(self.vector_store, "collection_name", None)
+        if isinstance(collection_name, str):
+            return collection_name
+
         from internal_assistant.settings.settings import settings
 
         return getattr(
@@ -265,6 +457,11 @@ class StorageConsistencyService:
                 return self._repair_orphaned_metadata(inconsistency.doc_id)
             elif inconsistency.type == "missing_collection":
                 return self._repair_missing_collection()
+            elif inconsistency.type == "vector_count_mismatch":
+                logger.warning(
+                    f"⚠️ [CONSISTENCY_REPAIR] Re-ingest {inconsistency.doc_id} to rebuild its vectors"
+                )
+                return False
             else:
                 logger.warning(
                     f"⚠️ [CONSISTENCY_REPAIR] Unknown inconsistency type: {inconsistency.type}"
@@ -352,6 +549,7 @@ class StorageConsistencyService:
         summary.append("─" * 40)
         summary.append(f"Total Documents: {report.total_documents}")
         summary.append(f"Total Vectors: {report.total_vectors}")
+        summary.append(f"Total Vector Points: {report.total_vector_points}")
         summary.append(f"Healthy Documents: {report.healthy_documents}")
         summary.append(f"Issues Found: {len(report.inconsistencies)}")
 
@@ -5,6 +5,9 @@ import shutil
 from datetime import datetime
 from pathlib import Path
 
+from internal_assistant.components.node_store.docstore_journal import (
+    DOCSTORE_JOURNAL_FILE,
+)
 from internal_assistant.paths import local_data_path
 from internal_assistant.server.ingest.storage_consistency_service import (
     StorageConsistencyService,
@@ -174,6 +177,11 @@ class StorageManagementService:
             if docstore_path.exists():
                 shutil.copy2(docstore_path, backup_dir / "docstore.json")
 
+            # Backup docstore journal (mutations not yet compacted into docstore.json)
+            journal_path = Path(str(local_data_path)) / DOCSTORE_JOURNAL_FILE
+            if journal_path.exists():
+                shutil.copy2(journal_path, backup_dir / DOCSTORE_JOURNAL_FILE)
+
             # Backup index store
             index_store_path = Path(str(local_data_path)) / "index_store.json"
             if index_store_path.exists():
@@ -212,6 +220,13 @@ class StorageManagementService:
             if backup_docstore.exists():
                 shutil.copy2(backup_docstore, base_path / "docstore.json")
 
+            # Restore docstore journal, dropping any journal newer than the backup
+            backup_journal = backup_path / DOCSTORE_JOURNAL_FILE
+            if backup_journal.exists():
+                shutil.copy2(backup_journal, base_path / DOCSTORE_JOURNAL_FILE)
+            elif backup_docstore.exists():
+                (base_path / DOCSTORE_JOURNAL_FILE).unlink(missing_ok=True)
+
             # Restore index store
             backup_index = backup_path / "index_store.json"
             if backup_index.exists():
@@ -145,3 +145,34 @@ def query_stats():
         "failure_rate": None,
         "total_queries": None,
     }
+
+
+@status_router.get("/caches")
+def cache_stats(request: Request):
+    """Return cache hit/miss counters and index lock hold times."""
+    from internal_assistant.components.embedding.embedding_component import (
+        EmbeddingComponent,
+    )
+    from internal_assistant.server.chat.response_cache import ResponseCache
+    from internal_assistant.server.ingest.ingest_service import IngestService
+
+    injector = get_injector(request)
+    embedding_cache = injector.get(EmbeddingComponent).cache
+    response_cache = injector.get(ResponseCache)
+    ingest_component = injector.get(IngestService).ingest_component
+    return {
+        "embedding": (
+            embedding_cache.stats() if embedding_cache else {"enabled": False}
+        ),
+        "chat_response": {
+            "enabled": response_cache.enabled,
+            "hits": response_cache.hits,
+            "misses": response_cache.misses,
+            "entries": len(response_cache),
+        },
+        "index_lock": (
+            ingest_component.lock_stats_summary()
+            if hasattr(ingest_component, "lock_stats_summary")
+            else {}
+        ),
+    }
@@ -0,0 +1,165 @@
+"""Streaming indicator-of-compromise extraction and a deduplicated IOC index.
+
+``IOCExtractor`` runs one combined regex over text delivered in chunks. A
+named group per indicator type classifies each value as it is matched, and
+only a short tail is carried between chunks, so large advisories and feed
+exports are scanned in bounded memory. ``IndicatorIndex`` aggregates the
+matches per value with first/last-seen times, sources and counts.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Group names double as the ``ThreatIndicator.ioc_type`` values
+_IOC_PATTERN = re.compile(
+    r"(?P<IP>\b(?:\d{1,3}\.){3}\d{1,3}\b)"
+    r"|(?P<Domain>\b(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}\b)"
+    r"|(?P<Hash>\b(?:[a-fA-F0-9]{64}|[a-fA-F0-9]{40}|[a-fA-F0-9]{32})\b)"
+)
+
+# Longest indicator kept intact across a chunk boundary (max DNS name length)
+MAX_IOC_LENGTH = 256
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass(frozen=True)
+class IOCMatch:
+    """One indicator found in the stream; ``offset`` is from the stream start."""
+
+    value: str
+    ioc_type: str
+    offset: int
+
+
+class IOCExtractor:
+    """Extracts typed, normalized indicators from text or chunked streams."""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.chunk_size = chunk_size
+
+    def extract(self, text: str) -> list[IOCMatch]:
+        return list(self.iter_matches([text]))
+
+    def classify(self, value: str) -> str:
+        """Type of a single indicator value, or "Unknown"."""
+        match = _IOC_PATTERN.match(value)
+        return match.lastgroup if match and match.lastgroup else "Unknown"
+
+    def iter_matches(self, chunks: Iterable[str]) -> Iterator[IOCMatch]:
+        """Yield indicators from a stream of text chunks, in stream order."""
+        buffer = ""
+        base = 0  # stream offset of buffer[0]
+        position = 0  # where the next search starts within buffer
+        for chunk in chunks:
+            buffer += chunk
+            # Matches ending in the tail could still grow with the next chunk
+            cut = len(buffer) - MAX_IOC_LENGTH
+            resume = max(cut, position)
+            for match in _IOC_PATTERN.finditer(buffer, position):
+                if match.end() >= cut:
+                    resume = min(resume, match.start())
+                    break
+                yield self._to_match(match, base)
+            # Keep one character before the resume point so \b still sees it
+            drop = max(resume - 1, 0)
+            buffer = buffer[drop:]
+            base += drop
+            position = resume - drop
+
+        for match in _IOC_PATTERN.finditer(buffer, position):
+            yield self._to_match(match, base)
+
+    def scan_file(self, path: Path, encoding: str = "utf-8") -> Iterator[IOCMatch]:
+        """Stream indicators from a text file without loading it whole."""
+        with open(path, encoding=encoding, errors="replace") as f:
+            yield from self.iter_matches(iter(lambda: f.read(self.chunk_size), ""))
+
+    @staticmethod
+    def _to_match(match: re.Match, base: int) -> IOCMatch:
+        return IOCMatch(
+            value=match.group().lower(),
+            ioc_type=match.lastgroup or "Unknown",
+            offset=base + match.start(),
+        )
+
+
+@dataclass
+class IndicatorRecord:
+    """Everything known about one indicator value."""
+
+    value: str
+    ioc_type: str
+    first_seen: datetime
+    last_seen: datetime
+    count: int = 0
+    sources: set[str] = field(default_factory=set)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "value": self.value,
+            "ioc_type": self.ioc_type,
+            "first_seen": self.first_seen.isoformat(),
+            "last_seen": self.last_seen.isoformat(),
+            "count": self.count,
+            "sources": sorted(self.sources),
+        }
+
+
+class IndicatorIndex:
+    """Deduplicated indicators with O(1) lookup by value and by type."""
+
+    def __init__(self) -> None:
+        self._records: dict[str, IndicatorRecord] = {}
+        # lowercased type -> value -> record
+        self._by_type: dict[str, dict[str, IndicatorRecord]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, value: str) -> bool:
+        return value.lower() in self._records
+
+    def add(
+        self, value: str, ioc_type: str, seen_at: datetime, source: str
+    ) -> IndicatorRecord:
+        value = value.lower()
+        record = self._records.get(value)
+        if record is None:
+            record = IndicatorRecord(
+                value=value, ioc_type=ioc_type, first_seen=seen_at, last_seen=seen_at
+            )
+            self._records[value] = record
+            self._by_type.setdefault(ioc_type.lower(), {})[value] = record
+        else:
+            record.first_seen = min(record.first_seen, seen_at)
+            record.last_seen = max(record.last_seen, seen_at)
+        record.count += 1
+        record.sources.add(source)
+        return record
+
+    def ingest(
+        self, matches: Iterable[IOCMatch], source: str, seen_at: datetime
+    ) -> int:
+        """Add streamed matches; returns how many were read."""
+        added = 0
+        for match in matches:
+            self.add(match.value, match.ioc_type, seen_at, source)
+            added += 1
+        return added
+
+    def get(self, value: str) -> IndicatorRecord | None:
+        return self._records.get(value.lower())
+
+    def by_type(self, ioc_type: str) -> list[IndicatorRecord]:
+        return list(self._by_type.get(ioc_type.lower(), {}).values())
+
+    def records(self) -> list[IndicatorRecord]:
+        return list(self._records.values())
+
+    def type_counts(self) -> dict[str, int]:
+        return dict(Counter(record.ioc_type for record in self._records.values()))
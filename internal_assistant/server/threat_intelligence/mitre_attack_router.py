@@ -2,18 +2,80 @@
 
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 
 from internal_assistant.server.threat_intelligence.mitre_attack_service import (
     AttackDomain,
-    MitreAttackService,
+)
+from internal_assistant.server.threat_intelligence.mitre_knowledge_base import (
+    MitreKnowledgeBase,
 )
 
 mitre_attack_router = APIRouter(prefix="/v1/mitre-attack", tags=["MITRE ATT&CK"])
 
 
+def _knowledge_base(request: Request) -> MitreKnowledgeBase:
+    return request.state.injector.get(MitreKnowledgeBase)
+
+
+def _validate_domain(domain: str) -> AttackDomain:
+    try:
+        attack_domain = AttackDomain(domain)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid domain: {domain}")
+    # Never answer a request for another matrix with the indexed one
+    if attack_domain != MitreKnowledgeBase.DOMAIN:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Domain {domain} is not available; only "
+            f"{MitreKnowledgeBase.DOMAIN.value} is served",
+        )
+    return attack_domain
+
+
+def _technique_to_dict(tech) -> dict[str, Any]:
+    return {
+        "technique_id": tech.technique_id,
+        "name": tech.name,
+        "description": tech.description,
+        "tactic": tech.tactic,
+        "platforms": tech.platforms,
+        "data_sources": tech.data_sources,
+        "detection": tech.detection,
+        "mitigation": tech.mitigation,
+        "url": tech.url,
+    }
+
+
+def _tactic_to_dict(tactic) -> dict[str, Any]:
+    return {
+        "tactic_id": tactic.tactic_id,
+        "name": tactic.name,
+        "description": tactic.description,
+        "techniques": tactic.techniques,
+        "url": tactic.url,
+    }
+
+
+def _group_to_dict(group) -> dict[str, Any]:
+    return {
+        "group_id": group.group_id,
+        "name": group.name,
+        "description": group.description,
+        "aliases": group.aliases,
+        "techniques": group.techniques,
+        "targets": group.targets,
+        "url": group.url,
+    }
+
+
+def _truncate(text: str) -> str:
+    return text[:200] + "..." if len(text) > 200 else text
+
+
 @mitre_attack_router.get("/techniques")
 async def get_techniques(
+    request: Request,
     domain: str = Query("enterprise-attack", description="ATT&CK domain"),
     search: str | None = Query(None, description="Search query"),
     banking_only: bool = Query(
@@ -21,351 +83,159 @@ async def get_techniques(
     ),
 ) -> list[dict[str, Any]]:
     """Get MITRE ATT&CK techniques."""
+    _validate_domain(domain)
     try:
-        async with MitreAttackService() as mitre_service:
-            # Validate domain
-            try:
-                attack_domain = AttackDomain(domain)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid domain: {domain}")
-
-            # Fetch techniques
-            techniques = await mitre_service.fetch_techniques(attack_domain)
-
-            # Apply filters
-            if search:
-                techniques = mitre_service.search_techniques(search)
-
-            if banking_only:
-                techniques = mitre_service.get_banking_relevant_techniques()
-
-            # Convert to dict format
-            return [
-                {
-                    "technique_id": tech.technique_id,
-                    "name": tech.name,
-                    "description": tech.description,
-                    "tactic": tech.tactic,
-                    "platforms": tech.platforms,
-                    "data_sources": tech.data_sources,
-                    "detection": tech.detection,
-                    "mitigation": tech.mitigation,
-                    "url": tech.url,
-                }
-                for tech in techniques
-            ]
+        knowledge_base = _knowledge_base(request)
+        techniques = knowledge_base.get_techniques()
+
+        # Apply filters
+        if search:
+            techniques = knowledge_base.search_techniques(search)
+
+        if banking_only:
+            banking_ids = {
+                tech.technique_id
+                for tech in knowledge_base.get_sector_relevant_techniques("Financial")
+            }
+            techniques = [t for t in techniques if t.technique_id in banking_ids]
+
+        return [_technique_to_dict(tech) for tech in techniques]
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching techniques: {e!s}")
 
 
 @mitre_attack_router.get("/techniques/{technique_id}")
-async def get_technique_by_id(technique_id: str) -> dict[str, Any]:
+async def get_technique_by_id(request: Request, technique_id: str) -> dict[str, Any]:
     """Get specific MITRE ATT&CK technique by ID."""
-    try:
-        async with MitreAttackService() as mitre_service:
-            await mitre_service.fetch_techniques()
-            technique = mitre_service.get_technique_by_id(technique_id)
-
-            if not technique:
-                raise HTTPException(
-                    status_code=404, detail=f"Technique {technique_id} not found"
-                )
-
-            return {
-                "technique_id": technique.technique_id,
-                "name": technique.name,
-                "description": technique.description,
-                "tactic": technique.tactic,
-                "subtechniques": technique.subtechniques,
-                "platforms": technique.platforms,
-                "data_sources": technique.data_sources,
-                "detection": technique.detection,
-                "mitigation": technique.mitigation,
-                "url": technique.url,
-            }
+    technique = _knowledge_base(request).get_technique_by_id(technique_id)
+    if not technique:
+        raise HTTPException(
+            status_code=404, detail=f"Technique {technique_id} not found"
+        )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching technique: {e!s}")
+    return {
+        **_technique_to_dict(technique),
+        "subtechniques": technique.subtechniques,
+    }
 
 
 @mitre_attack_router.get("/tactics")
 async def get_tactics(
-    domain: str = Query("enterprise-attack", description="ATT&CK domain")
+    request: Request,
+    domain: str = Query("enterprise-attack", description="ATT&CK domain"),
 ) -> list[dict[str, Any]]:
     """Get MITRE ATT&CK tactics."""
-    try:
-        async with MitreAttackService() as mitre_service:
-            # Validate domain
-            try:
-                attack_domain = AttackDomain(domain)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid domain: {domain}")
-
-            # Fetch tactics
-            tactics = await mitre_service.fetch_tactics(attack_domain)
-
-            # Convert to dict format
-            return [
-                {
-                    "tactic_id": tactic.tactic_id,
-                    "name": tactic.name,
-                    "description": tactic.description,
-                    "techniques": tactic.techniques,
-                    "url": tactic.url,
-                }
-                for tactic in tactics
-            ]
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching tactics: {e!s}")
+    _validate_domain(domain)
+    return [
+        _tactic_to_dict(tactic) for tactic in _knowledge_base(request).get_tactics()
+    ]
 
 
 @mitre_attack_router.get("/tactics/{tactic_id}")
-async def get_tactic_by_id(tactic_id: str) -> dict[str, Any]:
+async def get_tactic_by_id(request: Request, tactic_id: str) -> dict[str, Any]:
     """Get specific MITRE ATT&CK tactic by ID."""
-    try:
-        async with MitreAttackService() as mitre_service:
-            await mitre_service.fetch_tactics()
-            tactic = mitre_service.get_tactic_by_id(tactic_id)
-
-            if not tactic:
-                raise HTTPException(
-                    status_code=404, detail=f"Tactic {tactic_id} not found"
-                )
-
-            return {
-                "tactic_id": tactic.tactic_id,
-                "name": tactic.name,
-                "description": tactic.description,
-                "techniques": tactic.techniques,
-                "url": tactic.url,
-            }
+    tactic = _knowledge_base(request).get_tactic_by_id(tactic_id)
+    if not tactic:
+        raise HTTPException(status_code=404, detail=f"Tactic {tactic_id} not found")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching tactic: {e!s}")
+    return _tactic_to_dict(tactic)
 
 
 @mitre_attack_router.get("/groups")
 async def get_threat_groups(
+    request: Request,
     domain: str = Query("enterprise-attack", description="ATT&CK domain"),
     banking_only: bool = Query(False, description="Show only banking-targeting groups"),
 ) -> list[dict[str, Any]]:
     """Get MITRE ATT&CK threat groups."""
-    try:
-        async with MitreAttackService() as mitre_service:
-            # Validate domain
-            try:
-                attack_domain = AttackDomain(domain)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid domain: {domain}")
-
-            # Fetch groups
-            groups = await mitre_service.fetch_threat_groups(attack_domain)
-
-            # Apply filters
-            if banking_only:
-                groups = mitre_service.get_banking_threat_groups()
-
-            # Convert to dict format
-            return [
-                {
-                    "group_id": group.group_id,
-                    "name": group.name,
-                    "description": group.description,
-                    "aliases": group.aliases,
-                    "techniques": group.techniques,
-                    "targets": group.targets,
-                    "url": group.url,
-                }
-                for group in groups
-            ]
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching groups: {e!s}")
+    _validate_domain(domain)
+    knowledge_base = _knowledge_base(request)
+    groups = (
+        knowledge_base.get_sector_threat_groups("Financial")
+        if banking_only
+        else knowledge_base.get_groups()
+    )
+    return [_group_to_dict(group) for group in groups]
 
 
 @mitre_attack_router.get("/groups/{group_id}")
-async def get_group_by_id(group_id: str) -> dict[str, Any]:
+async def get_group_by_id(request: Request, group_id: str) -> dict[str, Any]:
     """Get specific MITRE ATT&CK threat group by ID."""
-    try:
-        async with MitreAttackService() as mitre_service:
-            await mitre_service.fetch_threat_groups()
-            group = mitre_service.get_group_by_id(group_id)
-
-            if not group:
-                raise HTTPException(
-                    status_code=404, detail=f"Group {group_id} not found"
-                )
-
-            return {
-                "group_id": group.group_id,
-                "name": group.name,
-                "description": group.description,
-                "aliases": group.aliases,
-                "techniques": group.techniques,
-                "targets": group.targets,
-                "url": group.url,
-            }
+    group = _knowledge_base(request).get_group_by_id(group_id)
+    if not group:
+        raise HTTPException(status_code=404, detail=f"Group {group_id} not found")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching group: {e!s}")
+    return _group_to_dict(group)
 
 
 @mitre_attack_router.get("/banking/techniques")
-async def get_banking_techniques() -> list[dict[str, Any]]:
+async def get_banking_techniques(request: Request) -> list[dict[str, Any]]:
     """Get banking-relevant MITRE ATT&CK techniques."""
-    try:
-        async with MitreAttackService() as mitre_service:
-            await mitre_service.fetch_techniques()
-            techniques = mitre_service.get_banking_relevant_techniques()
-
-            return [
-                {
-                    "technique_id": tech.technique_id,
-                    "name": tech.name,
-                    "description": tech.description,
-                    "tactic": tech.tactic,
-                    "platforms": tech.platforms,
-                    "data_sources": tech.data_sources,
-                    "detection": tech.detection,
-                    "mitigation": tech.mitigation,
-                    "url": tech.url,
-                }
-                for tech in techniques
-            ]
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error fetching banking techniques: {e!s}"
-        )
+    techniques = _knowledge_base(request).get_sector_relevant_techniques("Financial")
+    return [_technique_to_dict(tech) for tech in techniques]
 
 
 @mitre_attack_router.get("/banking/groups")
-async def get_banking_groups() -> list[dict[str, Any]]:
+async def get_banking_groups(request: Request) -> list[dict[str, Any]]:
     """Get banking-targeting MITRE ATT&CK threat groups."""
-    try:
-        async with MitreAttackService() as mitre_service:
-            await mitre_service.fetch_threat_groups()
-            groups = mitre_service.get_banking_threat_groups()
-
-            return [
-                {
-                    "group_id": group.group_id,
-                    "name": group.name,
-                    "description": group.description,
-                    "aliases": group.aliases,
-                    "techniques": group.techniques,
-                    "targets": group.targets,
-                    "url": group.url,
-                }
-                for group in groups
-            ]
-
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Error fetching banking groups: {e!s}"
-        )
+    groups = _knowledge_base(request).get_sector_threat_groups("Financial")
+    return [_group_to_dict(group) for group in groups]
 
 
 @mitre_attack_router.get("/search")
 async def search_mitre_data(
+    request: Request,
     query: str = Query(..., description="Search query"),
     domain: str = Query("enterprise-attack", description="ATT&CK domain"),
 ) -> dict[str, Any]:
     """Search MITRE ATT&CK data."""
+    _validate_domain(domain)
     try:
-        async with MitreAttackService() as mitre_service:
-            # Validate domain
-            try:
-                attack_domain = AttackDomain(domain)
-            except ValueError:
-                raise HTTPException(status_code=400, detail=f"Invalid domain: {domain}")
-
-            # Fetch data
-            await mitre_service.fetch_techniques(attack_domain)
-            await mitre_service.fetch_tactics(attack_domain)
-            await mitre_service.fetch_threat_groups(attack_domain)
-
-            # Search techniques
-            techniques = mitre_service.search_techniques(query)
-
-            # Search tactics (simple text search)
-            tactics = []
-            for tactic in mitre_service._tactics_cache.values():
-                if (
-                    query.lower() in tactic.name.lower()
-                    or query.lower() in tactic.description.lower()
-                ):
-                    tactics.append(tactic)
-
-            # Search groups (simple text search)
-            groups = []
-            for group in mitre_service._groups_cache.values():
-                if (
-                    query.lower() in group.name.lower()
-                    or query.lower() in group.description.lower()
-                    or any(query.lower() in alias.lower() for alias in group.aliases)
-                ):
-                    groups.append(group)
-
-            return {
-                "query": query,
-                "results": {
-                    "techniques": [
-                        {
-                            "technique_id": tech.technique_id,
-                            "name": tech.name,
-                            "description": (
-                                tech.description[:200] + "..."
-                                if len(tech.description) > 200
-                                else tech.description
-                            ),
-                            "tactic": tech.tactic,
-                            "url": tech.url,
-                        }
-                        for tech in techniques
-                    ],
-                    "tactics": [
-                        {
-                            "tactic_id": tactic.tactic_id,
-                            "name": tactic.name,
-                            "description": (
-                                tactic.description[:200] + "..."
-                                if len(tactic.description) > 200
-                                else tactic.description
-                            ),
-                            "url": tactic.url,
-                        }
-                        for tactic in tactics
-                    ],
-                    "groups": [
-                        {
-                            "group_id": group.group_id,
-                            "name": group.name,
-                            "description": (
-                                group.description[:200] + "..."
-                                if len(group.description) > 200
-                                else group.description
-                            ),
-                            "aliases": group.aliases,
-                            "url": group.url,
-                        }
-                        for group in groups
-                    ],
-                },
-                "summary": {
-                    "total_techniques": len(techniques),
-                    "total_tactics": len(tactics),
-                    "total_groups": len(groups),
-                },
-            }
+        knowledge_base = _knowledge_base(request)
+        techniques = knowledge_base.search_techniques(query)
+        tactics = knowledge_base.search_tactics(query)
+        groups = knowledge_base.search_groups(query)
+
+        return {
+            "query": query,
+            "results": {
+                "techniques": [
+                    {
+                        "technique_id": tech.technique_id,
+                        "name": tech.name,
+                        "description": _truncate(tech.description),
+                        "tactic": tech.tactic,
+                        "url": tech.url,
+                    }
+                    for tech in techniques
+                ],
+                "tactics": [
+                    {
+                        "tactic_id": tactic.tactic_id,
+                        "name": tactic.name,
+                        "description": _truncate(tactic.description),
+                        "url": tactic.url,
+                    }
+                    for tactic in tactics
+                ],
+                "groups": [
+                    {
+                        "group_id": group.group_id,
+                        "name": group.name,
+                        "description": _truncate(group.description),
+                        "aliases": group.aliases,
+                        "url": group.url,
+                    }
+                    for group in groups
+                ],
+            },
+            "summary": {
+                "total_techniques": len(techniques),
+                "total_tactics": len(tactics),
+                "total_groups": len(groups),
+            },
+        }
 
     except Exception as e:
         raise HTTPException(
@@ -374,31 +244,27 @@ async def search_mitre_data(
 
 
 @mitre_attack_router.get("/cache/info")
-async def get_cache_info() -> dict[str, Any]:
+async def get_cache_info(request: Request) -> dict[str, Any]:
     """Get MITRE ATT&CK cache information."""
     try:
-        async with MitreAttackService() as mitre_service:
-            return mitre_service.get_cache_info()
+        return _knowledge_base(request).get_cache_info()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting cache info: {e!s}")
 
 
 @mitre_attack_router.post("/refresh")
-async def refresh_mitre_data() -> dict[str, Any]:
+async def refresh_mitre_data(request: Request) -> dict[str, Any]:
     """Refresh MITRE ATT&CK data cache."""
     try:
-        async with MitreAttackService() as mitre_service:
-            success = await mitre_service.refresh_data()
-            if success:
-                return {
-                    "status": "success",
-                    "message": "MITRE ATT&CK data refreshed successfully",
-                }
-            else:
-                raise HTTPException(
-                    status_code=500, detail="Failed to refresh MITRE ATT&CK data"
-                )
-    except HTTPException:
-        raise
+        success = await _knowledge_base(request).refresh()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error refreshing data: {e!s}")
+
+    if not success:
+        raise HTTPException(
+            status_code=500, detail="Failed to refresh MITRE ATT&CK data"
+        )
+    return {
+        "status": "success",
+        "message": "MITRE ATT&CK data refreshed successfully",
+    }
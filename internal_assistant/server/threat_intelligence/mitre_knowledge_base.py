@@ -0,0 +1,350 @@
+"""Process-wide MITRE ATT&CK knowledge base.
+
+The ATT&CK data is loaded from the on-disk cache once, indexed, and served
+from memory. A background task refreshes it from the MITRE API when it is
+older than the refresh TTL, then swaps in a freshly built index, so request
+handlers never wait on the network.
+"""
+
+import asyncio
+import logging
+import re
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from injector import inject, singleton
+
+from internal_assistant.server.threat_intelligence.mitre_attack_service import (
+    AttackDomain,
+    AttackTactic,
+    AttackTechnique,
+    MitreAttackService,
+    ThreatGroup,
+)
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def _tokens(*texts: str) -> set[str]:
+    return {token for text in texts for token in _TOKEN_PATTERN.findall(text.lower())}
+
+
+@dataclass
+class _TokenIndex:
+    """Inverted index from word tokens to item positions.
+
+    Searches are plain substring matches, as in the old linear scan. A token
+    at the very start of the query may begin mid-word in the text ("ware" in
+    "malware"), but every later query token starts a word there, so only
+    those are looked up: each must be a prefix of an indexed word of the
+    item. Queries without such tokens ("ware", "&") fall back to the scan.
+    """
+
+    postings: dict[str, set[int]] = field(default_factory=dict)
+    vocabulary: list[str] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, documents: list[set[str]]) -> "_TokenIndex":
+        postings: dict[str, set[int]] = {}
+        for position, tokens in enumerate(documents):
+            for token in tokens:
+                postings.setdefault(token, set()).add(position)
+        return cls(postings=postings, vocabulary=sorted(postings))
+
+    def candidates(self, query: str) -> set[int] | None:
+        """Positions of the items that may contain ``query``, None for all."""
+        matches = list(_TOKEN_PATTERN.finditer(query.lower()))
+        if matches and matches[0].start() == 0:
+            matches = matches[1:]
+        if not matches:
+            return None
+
+        result: set[int] | None = None
+        for token in {match.group() for match in matches}:
+            found: set[int] = set()
+            start = bisect_left(self.vocabulary, token)
+            for word in self.vocabulary[start:]:
+                if not word.startswith(token):
+                    break
+                found |= self.postings[word]
+            result = found if result is None else result & found
+            if not result:
+                return set()
+        return result
+
+
+@dataclass
+class _AttackIndexes:
+    """Immutable lookup tables built from one snapshot of ATT&CK data."""
+
+    techniques: list[AttackTechnique]
+    tactics: list[AttackTactic]
+    groups: list[ThreatGroup]
+    techniques_by_id: dict[str, AttackTechnique]
+    tactics_by_id: dict[str, AttackTactic]
+    groups_by_id: dict[str, ThreatGroup]
+    techniques_by_tactic: dict[str, list[AttackTechnique]]
+    techniques_by_platform: dict[str, list[AttackTechnique]]
+    groups_by_alias: dict[str, ThreatGroup]
+    techniques_by_sector: dict[str, list[AttackTechnique]]
+    groups_by_sector: dict[str, list[ThreatGroup]]
+    technique_tokens: _TokenIndex
+    tactic_tokens: _TokenIndex
+    group_tokens: _TokenIndex
+
+    @classmethod
+    def build(
+        cls,
+        techniques: list[AttackTechnique],
+        tactics: list[AttackTactic],
+        groups: list[ThreatGroup],
+    ) -> "_AttackIndexes":
+        techniques_by_id = {t.technique_id: t for t in techniques}
+
+        techniques_by_tactic: dict[str, list[AttackTechnique]] = {}
+        techniques_by_platform: dict[str, list[AttackTechnique]] = {}
+        for technique in techniques:
+            for tactic in technique.tactic.split(","):
+                if tactic.strip():
+                    techniques_by_tactic.setdefault(tactic.strip().lower(), []).append(
+                        technique
+                    )
+            for platform in technique.platforms:
+                techniques_by_platform.setdefault(platform.lower(), []).append(
+                    technique
+                )
+
+        groups_by_alias: dict[str, ThreatGroup] = {}
+        for group in groups:
+            for alias in [group.name, *group.aliases]:
+                groups_by_alias.setdefault(alias.lower(), group)
+
+        techniques_by_sector = {
+            sector: [
+                techniques_by_id[technique_id]
+                for technique_id in technique_ids
+                if technique_id in techniques_by_id
+            ]
+            for sector, technique_ids in MitreAttackService.SECTOR_TECHNIQUES.items()
+        }
+        # Same rule as MitreAttackService.get_sector_threat_groups: a group
+        # belongs to a sector when one of its aliases is on the sector list
+        groups_by_sector = {
+            sector: [
+                group
+                for group in groups
+                if any(alias in sector_groups for alias in group.aliases)
+            ]
+            for sector, sector_groups in MitreAttackService.SECTOR_THREAT_GROUPS.items()
+        }
+
+        return cls(
+            techniques=techniques,
+            tactics=tactics,
+            groups=groups,
+            techniques_by_id=techniques_by_id,
+            tactics_by_id={t.tactic_id: t for t in tactics},
+            groups_by_id={g.group_id: g for g in groups},
+            techniques_by_tactic=techniques_by_tactic,
+            techniques_by_platform=techniques_by_platform,
+            groups_by_alias=groups_by_alias,
+            techniques_by_sector=techniques_by_sector,
+            groups_by_sector=groups_by_sector,
+            technique_tokens=_TokenIndex.build(
+                [_tokens(t.name, t.description) for t in techniques]
+            ),
+            tactic_tokens=_TokenIndex.build(
+                [_tokens(t.name, t.description) for t in tactics]
+            ),
+            group_tokens=_TokenIndex.build(
+                [_tokens(g.name, g.description, *g.aliases) for g in groups]
+            ),
+        )
+
+
+def _search(
+    items: list, index: _TokenIndex, query: str, fields: Callable[[Any], Sequence[str]]
+) -> list:
+    query_lower = query.lower()
+    candidates = index.candidates(query)
+    positions = range(len(items)) if candidates is None else sorted(candidates)
+    return [
+        items[position]
+        for position in positions
+        if any(query_lower in text.lower() for text in fields(items[position]))
+    ]
+
+
+@singleton
+class MitreKnowledgeBase:
+    """Long-lived, indexed view of the MITRE ATT&CK data."""
+
+    # MitreAttackService.refresh_data only loads the enterprise matrix
+    DOMAIN = AttackDomain.ENTERPRISE
+    REFRESH_TTL = timedelta(hours=24)
+    RETRY_DELAY = timedelta(minutes=15)
+
+    @inject
+    def __init__(self, service: MitreAttackService) -> None:
+        self._service = service
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        self._rebuild()
+
+    # Lifecycle
+
+    async def start(self) -> None:
+        """Start the background refresh loop."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh loop."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+
+    async def refresh(self) -> bool:
+        """Fetch ATT&CK data from the API and swap in a new index."""
+        async with self._refresh_lock:
+            async with self._service:
+                success = await self._service.refresh_data()
+            self._rebuild()
+            return success
+
+    def is_stale(self) -> bool:
+        last_refresh = self._service._last_refresh
+        return (
+            last_refresh is None
+            or datetime.now(UTC) - last_refresh > self.REFRESH_TTL
+            or not self._indexes.techniques
+        )
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = self.REFRESH_TTL
+            if self.is_stale():
+                logger.info("🎯 Refreshing MITRE ATT&CK knowledge base...")
+                try:
+                    if await self.refresh():
+                        logger.info(
+                            f"✅ MITRE ATT&CK knowledge base refreshed: "
+                            f"{len(self._indexes.techniques)} techniques"
+                        )
+                    else:
+                        delay = self.RETRY_DELAY
+                except Exception as e:
+                    logger.warning(f"⚠️ MITRE ATT&CK refresh failed: {e}")
+                    delay = self.RETRY_DELAY
+            else:
+                last_refresh = self._service._last_refresh
+                delay = self.REFRESH_TTL - (datetime.now(UTC) - last_refresh)
+            await asyncio.sleep(max(delay.total_seconds(), 1))
+
+    def _rebuild(self) -> None:
+        # Built off to the side, then published with one assignment, so
+        # readers always see a complete index
+        self._indexes = _AttackIndexes.build(
+            list(self._service._techniques_cache.values()),
+            list(self._service._tactics_cache.values()),
+            list(self._service._groups_cache.values()),
+        )
+
+    # Lookups
+
+    def get_techniques(self) -> list[AttackTechnique]:
+        return self._indexes.techniques
+
+    def get_tactics(self) -> list[AttackTactic]:
+        return self._indexes.tactics
+
+    def get_groups(self) -> list[ThreatGroup]:
+        return self._indexes.groups
+
+    def get_technique_by_id(self, technique_id: str) -> AttackTechnique | None:
+        return self._indexes.techniques_by_id.get(technique_id)
+
+    def get_tactic_by_id(self, tactic_id: str) -> AttackTactic | None:
+        return self._indexes.tactics_by_id.get(tactic_id)
+
+    def get_group_by_id(self, group_id: str) -> ThreatGroup | None:
+        return self._indexes.groups_by_id.get(group_id)
+
+    def get_group_by_alias(self, alias: str) -> ThreatGroup | None:
+        return self._indexes.groups_by_alias.get(alias.lower())
+
+    def get_techniques_by_tactic(self, tactic: str) -> list[AttackTechnique]:
+        return self._indexes.techniques_by_tactic.get(tactic.lower(), [])
+
+    def get_techniques_by_platform(self, platform: str) -> list[AttackTechnique]:
+        return self._indexes.techniques_by_platform.get(platform.lower(), [])
+
+    def get_sector_relevant_techniques(
+        self, sector: str = "Financial"
+    ) -> list[AttackTechnique]:
+        indexes = self._indexes
+        return indexes.techniques_by_sector.get(
+            sector, indexes.techniques_by_sector["Financial"]
+        )
+
+    def get_sector_threat_groups(self, sector: str = "Financial") -> list[ThreatGroup]:
+        indexes = self._indexes
+        return indexes.groups_by_sector.get(
+            sector, indexes.groups_by_sector["Financial"]
+        )
+
+    def get_available_sectors(self) -> list[str]:
+        return list(MitreAttackService.SECTOR_THREAT_GROUPS)
+
+    def search_techniques(self, query: str) -> list[AttackTechnique]:
+        indexes = self._indexes
+        return _search(
+            indexes.techniques,
+            indexes.technique_tokens,
+            query,
+            lambda t: (t.name, t.description),
+        )
+
+    def search_tactics(self, query: str) -> list[AttackTactic]:
+        indexes = self._indexes
+        return _search(
+            indexes.tactics,
+            indexes.tactic_tokens,
+            query,
+            lambda t: (t.name, t.description),
+        )
+
+    def search_groups(self, query: str) -> list[ThreatGroup]:
+        indexes = self._indexes
+        return _search(
+            indexes.groups,
+            indexes.group_tokens,
+            query,
+            lambda g: (g.name, g.description, *g.aliases),
+        )
+
+    def get_cache_info(self) -> dict[str, Any]:
+        indexes = self._indexes
+        cache_info = self._service.get_cache_info()
+        cache_info.update(
+            {
+                "techniques_count": len(indexes.techniques),
+                "tactics_count": len(indexes.tactics),
+                "groups_count": len(indexes.groups),
+                "sector_techniques": len(self.get_sector_relevant_techniques()),
+                "sector_groups": len(self.get_sector_threat_groups()),
+                "stale": self.is_stale(),
+                "background_refresh": self._refresh_task is not None
+                and not self._refresh_task.done(),
+            }
+        )
+        return cache_info
@@ -7,6 +7,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from internal_assistant.server.threat_intelligence.ioc_extractor import IOCExtractor
+from internal_assistant.utils.pattern_matcher import (
+    MatchResult,
+    MultiPatternMatcher,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,6 +155,20 @@ class ThreatIntelligenceAnalyzer:
             "T1136": r"create.?account|account.?creation|user.?creation",
         }
 
+        # Threat-type and technique patterns compiled once into one matcher
+        self.matcher = MultiPatternMatcher(
+            {**self.threat_patterns, **self.mitre_technique_patterns}
+        )
+        self.ioc_extractor = IOCExtractor()
+
+    def match_patterns(self, content: str) -> MatchResult:
+        """Match every threat-type and MITRE technique pattern in a single pass.
+
+        Threat types are labelled by ``ThreatType`` and techniques by their
+        technique ID. Works on text of any length, not just feed summaries.
+        """
+        return self.matcher.scan(content)
+
     def extract_mitre_techniques_from_feed_item(
         self, feed_item: dict[str, str]
     ) -> list[dict[str, Any]]:
@@ -174,15 +194,19 @@ class ThreatIntelligenceAnalyzer:
         """
         content = f"{feed_item.get('title', '')} {feed_item.get('summary', '')}".lower()
         matched_techniques = []
+        matches = self.match_patterns(content)
 
         # Scan content for MITRE technique patterns
         for technique_id, pattern in self.mitre_technique_patterns.items():
-            match = re.search(pattern, content, re.IGNORECASE)
+            match = matches.first(technique_id)
             if match:
                 # Calculate confidence based on match quality
-                matched_text = match.group(0)
+                matched_text = match.text
                 confidence = self._calculate_technique_confidence(
-                    content, pattern, matched_text
+                    content,
+                    pattern,
+                    matched_text,
+                    match_count=matches.count(technique_id),
                 )
 
                 matched_techniques.append(
@@ -200,13 +224,18 @@ class ThreatIntelligenceAnalyzer:
         return matched_techniques
 
     def _calculate_technique_confidence(
-        self, content: str, pattern: str, matched_text: str
+        self,
+        content: str,
+        pattern: str,
+        matched_text: str,
+        match_count: int | None = None,
     ) -> float:
         """Calculate confidence score for MITRE technique detection."""
         confidence = 0.6  # Base confidence for pattern match
 
         # Multiple occurrences increase confidence
-        match_count = len(re.findall(pattern, content, re.IGNORECASE))
+        if match_count is None:
+            match_count = len(re.findall(pattern, content, re.IGNORECASE))
         if match_count > 1:
             confidence += min(match_count * 0.1, 0.2)
 
@@ -427,33 +456,45 @@ class ThreatIntelligenceAnalyzer:
     def analyze_feed_content(self, feed_items: list[dict]) -> list[ThreatIndicator]:
         """Analyze RSS feed content for cyber threats."""
         threats = []
-
         for item in feed_items:
-            content = f"{item.get('title', '')} {item.get('summary', '')}".lower()
-
-            # Check for threat patterns
-            for threat_type, patterns in self.threat_patterns.items():
-                for pattern in patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        threat_level = self._assess_threat_level(content, threat_type)
-
-                        # Extract indicators
-                        indicators = self._extract_indicators(content)
-
-                        for indicator in indicators:
-                            threat = ThreatIndicator(
-                                indicator=indicator,
-                                threat_type=threat_type,
-                                threat_level=threat_level,
-                                description=item.get("summary", "")[:200],
-                                source=item.get("source", "Unknown"),
-                                timestamp=item.get("published", datetime.now()),
-                                ioc_type=self._classify_ioc(indicator),
-                                confidence=self._calculate_confidence(
-                                    content, threat_type
-                                ),
-                            )
-                            threats.append(threat)
+            threats.extend(self.analyze_feed_item(item))
+        return threats
+
+    def analyze_feed_item(self, item: dict) -> list[ThreatIndicator]:
+        """Analyze a single feed item; results depend only on the item."""
+        threats = []
+        content = f"{item.get('title', '')} {item.get('summary', '')}".lower()
+        matches = self.match_patterns(content)
+        indicators: dict[str, str] | None = None
+
+        # Check for threat patterns
+        for threat_type in self.threat_patterns:
+            matched_patterns = matches.matched_patterns(threat_type)
+            if not matched_patterns:
+                continue
+
+            threat_level = self._assess_threat_level(content, threat_type)
+            confidence = self._calculate_confidence(
+                content, threat_type, matched_patterns=len(matched_patterns)
+            )
+            # Extract indicators
+            if indicators is None:
+                indicators = self._extract_typed_indicators(content)
+
+            # One set of indicators per matching pattern, as before
+            for _ in matched_patterns:
+                for indicator, ioc_type in indicators.items():
+                    threat = ThreatIndicator(
+                        indicator=indicator,
+                        threat_type=threat_type,
+                        threat_level=threat_level,
+                        description=item.get("summary", "")[:200],
+                        source=item.get("source", "Unknown"),
+                        timestamp=item.get("published", datetime.now()),
+                        ioc_type=ioc_type,
+                        confidence=confidence,
+                    )
+                    threats.append(threat)
 
         return threats
 
@@ -477,55 +518,35 @@ class ThreatIntelligenceAnalyzer:
         else:
             return ThreatLevel.LOW
 
-    def _extract_indicators(self, content: str) -> list[str]:
-        """Extract threat indicators from content."""
-        indicators = []
-
-        # IP addresses
-        ip_pattern = r"\b(?:\d{1,3}\.){3}\d{1,3}\b"
-        indicators.extend(re.findall(ip_pattern, content))
-
-        # Domains
-        domain_pattern = (
-            r"\b(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}\b"
-        )
-        indicators.extend(re.findall(domain_pattern, content))
-
-        # Hashes (MD5, SHA1, SHA256)
-        hash_patterns = [
-            r"\b[a-fA-F0-9]{32}\b",  # MD5
-            r"\b[a-fA-F0-9]{40}\b",  # SHA1
-            r"\b[a-fA-F0-9]{64}\b",  # SHA256
-        ]
-        for pattern in hash_patterns:
-            indicators.extend(re.findall(pattern, content))
+    def _extract_typed_indicators(self, content: str) -> dict[str, str]:
+        """Unique indicators in ``content`` mapped to their IOC type."""
+        return {
+            match.value: match.ioc_type for match in self.ioc_extractor.extract(content)
+        }
 
-        return list(set(indicators))  # Remove duplicates
+    def _extract_indicators(self, content: str) -> list[str]:
+        """Extract threat indicators (IPs, domains, hashes) from content."""
+        return list(self._extract_typed_indicators(content))
 
     def _classify_ioc(self, indicator: str) -> str:
         """Classify the type of indicator of compromise."""
-        if re.match(r"\b(?:\d{1,3}\.){3}\d{1,3}\b", indicator):
-            return "IP"
-        elif re.match(
-            r"\b(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}\b",
-            indicator,
-        ):
-            return "Domain"
-        elif re.match(r"\b[a-fA-F0-9]{32,64}\b", indicator):
-            return "Hash"
-        else:
-            return "Unknown"
+        return self.ioc_extractor.classify(indicator)
 
-    def _calculate_confidence(self, content: str, threat_type: ThreatType) -> float:
+    def _calculate_confidence(
+        self,
+        content: str,
+        threat_type: ThreatType,
+        matched_patterns: int | None = None,
+    ) -> float:
         """Calculate confidence score for threat detection."""
         confidence = 0.5  # Base confidence
 
         # Multiple threat keywords increase confidence
-        threat_keywords = sum(
-            1
-            for pattern in self.threat_patterns[threat_type]
-            if re.search(pattern, content, re.IGNORECASE)
-        )
+        if matched_patterns is None:
+            matched_patterns = len(
+                self.match_patterns(content).matched_patterns(threat_type)
+            )
+        threat_keywords = matched_patterns
         confidence += min(threat_keywords * 0.2, 0.3)
 
         # Financial sector relevance increases confidence
@@ -921,7 +942,11 @@ class ThreatIntelligenceAnalyzer:
                 continue
 
             # Find highest threat level
-            max_level = max(threat.threat_level for threat in type_threats)
+            # Enum members do not order themselves; rank by declaration order
+            max_level = max(
+                (threat.threat_level for threat in type_threats),
+                key=list(ThreatLevel).index,
+            )
 
             recommendation = self._create_recommendation(
                 threat_type, type_threats, max_level
@@ -99,6 +99,12 @@ class ServerSettings(BaseModel):
         description="Authentication configuration",
         default_factory=lambda: AuthSettings(enabled=False, secret="secret-key"),
     )
+    lazy_startup: bool = Field(
+        False,
+        description="Import API routers and build the UI on the first request "
+        "to their paths instead of at startup, and start the background feed "
+        "and MITRE services after the server is up. Shortens cold starts.",
+    )
 
 
 class DataSettings(BaseModel):
@@ -110,6 +116,12 @@ class DataSettings(BaseModel):
         description="Path to local storage."
         "It will be treated as an absolute path if it starts with /"
     )
+    background_consistency_check: bool = Field(
+        True,
+        description="Run the startup storage consistency check on a background "
+        "thread. It scans the whole vector collection, which can take a while "
+        "on large stores.",
+    )
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
@@ -168,6 +180,22 @@ class VectorstoreSettings(BaseModel):
 
 class NodeStoreSettings(BaseModel):
     database: Literal["simple", "postgres"]
+    journal_enabled: bool = Field(
+        True,
+        description=(
+            "Only for the `simple` database. If set to True, docstore mutations are "
+            "appended to `docstore.journal` instead of rewriting `docstore.json` on "
+            "every save. The journal is replayed at startup and compacted into "
+            "`docstore.json` periodically."
+        ),
+    )
+    journal_compaction_ratio: float = Field(
+        0.5,
+        description=(
+            "Compact the docstore journal into a new `docstore.json` snapshot once "
+            "the journal is larger than this fraction of the snapshot size."
+        ),
+    )
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
@@ -208,6 +236,22 @@ class HuggingFaceSettings(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class EmbeddingCacheSettings(BaseModel):
+    enabled: bool = Field(
+        True,
+        description="If set to True, embeddings are cached by model and normalized text, so repeated queries and unchanged chunks skip the model.",
+    )
+    max_entries: int = Field(
+        20000,
+        description="Maximum number of embeddings kept in memory. The least recently used embedding is evicted first.",
+    )
+    persist: bool = Field(
+        False,
+        description="If set to True, embeddings are also stored in a SQLite file under local_data and reused across restarts.",
+    )
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 class EmbeddingSettings(BaseModel):
     mode: Literal[
         "huggingface",
@@ -246,6 +290,33 @@ class EmbeddingSettings(BaseModel):
         384,
         description="The dimension of the embeddings stored in the Postgres database",
     )
+    batch_size: int = Field(
+        32,
+        description="Maximum number of texts sent to the embedding model in one call.",
+    )
+    max_length: int | None = Field(
+        None,
+        description="Maximum number of tokens per text for local (HuggingFace) embedding models. Longer texts are truncated.",
+    )
+    adaptive_batching: bool = Field(
+        False,
+        description=(
+            "If set to True, texts are sorted by length before batching to cut padding, "
+            "and the batch size is tuned from the measured tokens/sec and memory use, "
+            "starting at `batch_size`."
+        ),
+    )
+    coalesce_window_ms: int = Field(
+        5,
+        description=(
+            "How long the /v1/embeddings endpoint waits to merge concurrent requests "
+            "into a shared model batch. Set to 0 to embed every request on its own."
+        ),
+    )
+    cache: EmbeddingCacheSettings = Field(
+        default_factory=EmbeddingCacheSettings,
+        description="Embedding cache configuration.",
+    )
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
@@ -404,6 +475,10 @@ class RerankSettings(BaseModel):
         False,
         description="If set to True, the RAG pipeline will use reranking to improve the quality of the retrieved documents.",
     )
+    model: str = Field(
+        "cross-encoder/ms-marco-MiniLM-L-2-v2",
+        description="Cross-encoder model used for reranking. It is loaded once and shared by all requests.",
+    )
     top_n: int = Field(
         2,
         description="This value controls the number of documents returned by the RAG pipeline or considered for reranking if enabled.",
@@ -411,6 +486,26 @@ class RerankSettings(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class ResponseCacheSettings(BaseModel):
+    enabled: bool = Field(
+        False,
+        description="If set to True, answers to single-turn chat questions are cached and reused for semantically similar questions.",
+    )
+    similarity_threshold: float = Field(
+        0.97,
+        description="Minimum cosine similarity between query embeddings for a cached answer to be reused.",
+    )
+    max_entries: int = Field(
+        256,
+        description="Maximum number of cached answers. The least recently used answer is evicted first.",
+    )
+    ttl_seconds: int = Field(
+        3600,
+        description="Number of seconds a cached answer stays valid.",
+    )
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 class RagSettings(BaseModel):
     similarity_top_k: int = Field(
         2,
@@ -421,6 +516,10 @@ class RagSettings(BaseModel):
         description="If set, any documents retrieved from the RAG must meet a certain match score. Acceptable values are between 0 and 1.",
     )
     rerank: RerankSettings
+    response_cache: ResponseCacheSettings = Field(
+        default_factory=ResponseCacheSettings,
+        description="Semantic cache of chat answers.",
+    )
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
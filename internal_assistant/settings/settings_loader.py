@@ -10,6 +10,7 @@ from pydantic.v1.utils import deep_update, unique_list
 
 from internal_assistant.constants import PROJECT_ROOT_PATH
 from internal_assistant.settings.yaml import load_yaml_with_envvars
+from internal_assistant.utils.startup_timer import startup_timer
 from internal_assistant.utils.version_check import validate_dependency_versions
 
 logger = logging.getLogger(__name__)
@@ -70,10 +71,12 @@ def load_active_settings() -> dict[str, Any]:
     logger.info("Starting application with profiles=%s", active_profiles)
 
     # Validate dependency versions before loading settings
-    validate_dependency_versions()
-
-    loaded_profiles = [
-        load_settings_from_profile(profile) for profile in active_profiles
-    ]
-    merged: dict[str, Any] = merge_settings(loaded_profiles)
+    with startup_timer.phase("version check"):
+        validate_dependency_versions()
+
+    with startup_timer.phase("settings"):
+        loaded_profiles = [
+            load_settings_from_profile(profile) for profile in active_profiles
+        ]
+        merged: dict[str, Any] = merge_settings(loaded_profiles)
     return merged
@@ -7,11 +7,10 @@ from UI construction.
 
 import logging
 import re
-import time
 from collections.abc import Iterable
 from typing import Any
 
-from llama_index.core.llms import ChatMessage, ChatResponse, MessageRole
+from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.types import TokenGen
 
 from internal_assistant.server.chat.chat_service import ChatService, CompletionGen
@@ -24,6 +23,7 @@ from internal_assistant.ui.core.error_boundaries import (
     create_error_boundary,
 )
 from internal_assistant.ui.models.source import Source
+from internal_assistant.ui.utils.streaming import StreamFramer
 
 logger = logging.getLogger(__name__)
 
@@ -367,15 +367,9 @@ class ChatEventHandler:
             return
 
         def yield_deltas(completion_gen: CompletionGen) -> Iterable[str]:
-            full_response: str = ""
-            stream = completion_gen.response
-            for delta in stream:
-                if isinstance(delta, str):
-                    full_response += str(delta)
-                elif isinstance(delta, ChatResponse):
-                    full_response += delta.delta or ""
-                yield full_response
-                time.sleep(0.02)
+            framer = StreamFramer()
+            yield from framer.frames(completion_gen.response)
+            full_response = framer.text
 
             # Apply citation style settings for document sources
             if completion_gen.sources and citation_style != "Exclude Sources":
@@ -410,10 +404,7 @@ class ChatEventHandler:
             yield full_response
 
         def yield_tokens(token_gen: TokenGen) -> Iterable[str]:
-            full_response: str = ""
-            for token in token_gen:
-                full_response += str(token)
-                yield full_response
+            yield from StreamFramer().frames(token_gen)
 
         def build_history() -> list[ChatMessage]:
             history_messages: list[ChatMessage] = []
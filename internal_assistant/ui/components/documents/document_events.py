@@ -293,41 +293,41 @@ class DocumentEventHandlerBuilder:
             failed_deletions = []
             successful_deletions = []
 
-            for i, doc in enumerate(ingested_docs):
-                try:
-                    file_name = (
-                        doc.doc_metadata.get("file_name", doc.doc_id)
-                        if doc.doc_metadata
-                        else doc.doc_id
-                    )
-                    logger.info(
-                        f"🗑️ [CLEAR_ALL] [{i+1}/{doc_count}] Deleting document: {file_name}"
+            try:
+                deleted_ids = set(
+                    self._ingest_service.delete_many(
+                        [doc.doc_id for doc in ingested_docs]
                     )
+                )
+            except Exception as e:
+                logger.error(f"🗑️ [CLEAR_ALL] ❌ Bulk deletion failed: {e}")
+                deleted_ids = set()
 
-                    self._ingest_service.delete(doc.doc_id)
+            for doc in ingested_docs:
+                file_name = (
+                    doc.doc_metadata.get("file_name", doc.doc_id)
+                    if doc.doc_metadata
+                    else doc.doc_id
+                )
+                if doc.doc_id in deleted_ids:
                     successful_deletions.append(file_name)
-                    logger.info(
-                        f"🗑️ [CLEAR_ALL] [{i+1}/{doc_count}] ✅ Successfully deleted: {file_name}"
-                    )
-
-                except Exception as e:
-                    file_name = (
-                        doc.doc_metadata.get("file_name", doc.doc_id)
-                        if doc.doc_metadata
-                        else doc.doc_id
-                    )
+                else:
                     failed_deletions.append(file_name)
-                    logger.error(
-                        f"🗑️ [CLEAR_ALL] [{i+1}/{doc_count}] ❌ Failed to delete {file_name}: {e}"
-                    )
 
             logger.info(
                 f"🗑️ [CLEAR_ALL] Deletion complete. Success: {len(successful_deletions)}, Failed: {len(failed_deletions)}"
             )
 
-            # Verify clearance by checking remaining documents
+            # Prepare status message
+            if failed_deletions:
+                success_count = len(successful_deletions)
+                status_msg = f"⚠️ Cleared {success_count}/{doc_count} documents. Failed to delete: {', '.join(failed_deletions)}"
+            else:
+                status_msg = f"✅ Successfully cleared all {doc_count} documents"
+
+            # Deletion updates the catalog before returning, so verify it directly
             try:
-                remaining_docs = self._ingest_service.list_ingested()
+                remaining_docs = self._ingest_service.catalog.entries()
                 logger.info(
                     f"🗑️ [CLEAR_ALL] After clearance: {len(remaining_docs)} documents remain"
                 )
@@ -338,15 +338,11 @@ class DocumentEventHandlerBuilder:
                     )
 
                     # Log which documents are still there
-                    for doc in remaining_docs:
-                        file_name = (
-                            doc.doc_metadata.get("file_name", "Unknown")
-                            if doc.doc_metadata
-                            else "Unknown"
-                        )
+                    for entry in remaining_docs:
                         logger.error(
-                            f"❌ [CLEAR_ALL] Still present: {file_name} (ID: {doc.doc_id})"
+                            f"❌ [CLEAR_ALL] Still present: {entry.file_name or 'Unknown'} (ID: {entry.doc_id})"
                         )
+                    status_msg += f" ⚠️ Warning: {len(remaining_docs)} documents were not deleted successfully."
                 else:
                     logger.info(
                         "✅ [CLEAR_ALL] Clearance verification successful: No documents remain"
@@ -355,32 +351,6 @@ class DocumentEventHandlerBuilder:
             except Exception as e:
                 logger.warning(f"🗑️ [CLEAR_ALL] Error verifying clearance: {e}")
 
-            # Prepare status message
-            if failed_deletions:
-                success_count = len(successful_deletions)
-                status_msg = f"⚠️ Cleared {success_count}/{doc_count} documents. Failed to delete: {', '.join(failed_deletions)}"
-            else:
-                status_msg = f"✅ Successfully cleared all {doc_count} documents"
-
-            # Verify deletion was successful (with brief delay for persistence)
-            import time
-
-            time.sleep(0.3)
-
-            try:
-                final_check = self._ingest_service.list_ingested()
-                if final_check:
-                    logger.error(
-                        f"❌ [CLEAR_ALL] Deletion verification failed: {len(final_check)} documents still remain"
-                    )
-                    status_msg += f" ⚠️ Warning: {len(final_check)} documents were not deleted successfully."
-                else:
-                    logger.info(
-                        "✅ [CLEAR_ALL] Deletion verified: All documents successfully removed"
-                    )
-            except Exception as e:
-                logger.warning(f"⚠️ [CLEAR_ALL] Could not verify deletion: {e}")
-
             # Update UI components
             logger.info("🗑️ [CLEAR_ALL] Updating UI components...")
             updated_model_status = self._get_model_status()
@@ -607,13 +577,10 @@ class DocumentEventHandlerBuilder:
                     self._get_model_status(),
                 )
 
-            # Get all ingested documents
-            ingested_docs = self._ingest_service.list_ingested()
-            logger.info(
-                f"🗑️ [BACKEND] Found {len(ingested_docs)} total ingested documents"
-            )
+            catalog = self._ingest_service.catalog
+            logger.info(f"🗑️ [BACKEND] Found {len(catalog)} total ingested documents")
 
-            if not ingested_docs:
+            if not len(catalog):
                 logger.warning("🗑️ [BACKEND] No documents available to remove")
                 return (
                     self._utility_builder.format_file_list(),
@@ -628,17 +595,11 @@ class DocumentEventHandlerBuilder:
                 "🗑️ [BACKEND] Searching for documents matching selected files..."
             )
 
-            for doc in ingested_docs:
-                if doc.doc_metadata and doc.doc_metadata.get("file_name"):
-                    file_name = doc.doc_metadata.get("file_name")
-                    if file_name in selected_files:
-                        docs_to_delete.append(doc)
-                        logger.info(
-                            f"🗑️ [BACKEND] Found document to delete: {file_name} (ID: {doc.doc_id})"
-                        )
-                else:
-                    logger.debug(
-                        f"🗑️ [BACKEND] Skipping document {doc.doc_id} - no metadata or file_name"
+            for file_name in dict.fromkeys(selected_files):
+                for entry in catalog.entries_for_file(file_name):
+                    docs_to_delete.append(entry)
+                    logger.info(
+                        f"🗑️ [BACKEND] Found document to delete: {file_name} (ID: {entry.doc_id})"
                     )
 
             logger.info(f"🗑️ [BACKEND] Found {len(docs_to_delete)} documents to delete")
@@ -677,17 +638,12 @@ class DocumentEventHandlerBuilder:
                         )
                         self._ingest_service.delete(doc.doc_id)
 
-                    file_name = doc.doc_metadata.get("file_name", doc.doc_id)
-                    successful_deletions.append(file_name)
+                    successful_deletions.append(doc.file_name)
                     logger.info(
-                        f"✅ [BACKEND] Successfully deleted document: {file_name}"
+                        f"✅ [BACKEND] Successfully deleted document: {doc.file_name}"
                     )
                 except Exception as e:
-                    file_name = (
-                        doc.doc_metadata.get("file_name", doc.doc_id)
-                        if doc.doc_metadata
-                        else doc.doc_id
-                    )
+                    file_name = doc.file_name
                     failed_deletions.append(file_name)
                     logger.error(
                         f"❌ [BACKEND] Failed to delete document {file_name}: {e}"
@@ -697,22 +653,17 @@ class DocumentEventHandlerBuilder:
                 f"🗑️ [BACKEND] Deletion complete. Success: {len(successful_deletions)}, Failed: {len(failed_deletions)}"
             )
 
-            # Verify deletion by checking remaining documents
-            remaining_docs = self._ingest_service.list_ingested()
-            logger.info(
-                f"🗑️ [BACKEND] After deletion: {len(remaining_docs)} documents remain"
-            )
+            # Verify deletion by checking the selected files in the catalog
+            logger.info(f"🗑️ [BACKEND] After deletion: {len(catalog)} documents remain")
 
             # Check if any of the supposedly deleted files are still present
             remaining_files = []
-            for doc in remaining_docs:
-                if doc.doc_metadata and doc.doc_metadata.get("file_name"):
-                    file_name = doc.doc_metadata.get("file_name")
-                    if file_name in selected_files:
-                        remaining_files.append(file_name)
-                        logger.warning(
-                            f"⚠️ [BACKEND] File still present after deletion: {file_name}"
-                        )
+            for doc in docs_to_delete:
+                if doc.doc_id in catalog:
+                    remaining_files.append(doc.file_name)
+                    logger.warning(
+                        f"⚠️ [BACKEND] File still present after deletion: {doc.file_name}"
+                    )
 
             if remaining_files:
                 logger.error(
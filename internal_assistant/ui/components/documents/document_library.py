@@ -17,7 +17,14 @@ Phase: 1B.2 - Document Library Management Extraction
 
 import datetime
 import logging
+from dataclasses import dataclass
 
+from internal_assistant.components.ingest.document_catalog import DocumentCatalog
+from internal_assistant.components.ingest.document_categories import (
+    FILE_TYPE,
+    FOLDER,
+    TAXONOMIES,
+)
 from internal_assistant.server.chat.chat_service import ChatService
 from internal_assistant.server.ingest.ingest_service import IngestService
 from internal_assistant.ui.components.documents.document_utility import (
@@ -26,6 +33,23 @@ from internal_assistant.ui.components.documents.document_utility import (
 
 logger = logging.getLogger(__name__)
 
+# Files shown per library folder page
+LIBRARY_PAGE_SIZE = 15
+
+
+@dataclass
+class LibraryPage:
+    """One page of a library folder.
+
+    ``next_offset`` is the cursor of the following page, or None on the last.
+    """
+
+    folder: str
+    html: str
+    offset: int
+    total: int
+    next_offset: int | None
+
 
 class DocumentLibraryBuilder:
     """Builder class for document library management.
@@ -48,6 +72,10 @@ class DocumentLibraryBuilder:
         self._ingest_service = ingest_service
         self._chat_service = chat_service
         self._utility_builder = utility_builder
+        # Rendering caches, each entry tagged with the folder's catalog version
+        self._folder_files: dict[str, tuple[int, list[str]]] = {}
+        self._folder_sections: dict[str, tuple[int, str]] = {}
+        self._page_cache: dict[tuple[str, int, int], tuple[int, LibraryPage]] = {}
 
     def _get_quality_badge(self, meta: dict) -> str:
         """Generate HTML for document quality badge based on processing status.
@@ -107,6 +135,33 @@ class DocumentLibraryBuilder:
         </span>
         """
 
+    def _file_meta(self, catalog: DocumentCatalog, file_name: str) -> dict:
+        """Display metadata of a file from one of its catalog entries.
+
+        Args:
+            catalog: Document catalog to read the entries from
+            file_name: Name of the file
+
+        Returns:
+            Metadata dict, empty if the file is not in the catalog
+        """
+        entries = catalog.entries_for_file(file_name)
+        if not entries:
+            return {}
+        entry = entries[-1]
+        metadata = entry.metadata or {}
+        return {
+            "size": metadata.get("file_size", 0),
+            "created": metadata.get("creation_date", ""),
+            "hash": metadata.get("content_hash", ""),
+            "doc_id": entry.doc_id,
+            "processing_status": entry.processing_status,
+            "quality_score": entry.quality_score,
+            "chunk_count": entry.chunk_count,
+            "error_message": entry.error_message,
+            "type": self._utility_builder.get_file_type(file_name),
+        }
+
     def get_document_library_html(
         self, search_query: str = "", filter_tags: list = None
     ) -> str:
@@ -120,8 +175,8 @@ class DocumentLibraryBuilder:
             HTML string for document library display
         """
         try:
-            files = self._utility_builder.list_ingested_files()
-            if not files:
+            catalog = self._ingest_service.catalog
+            if not catalog.facet_counts(FOLDER):
                 return """
                 <div style='margin-bottom: 16px;'>
                     <input type='text' id='doc-search' placeholder='🔍 Search documents...' 
@@ -132,199 +187,132 @@ class DocumentLibraryBuilder:
                 <div style='text-align: center; color: #666; padding: 20px;'>📁 No documents yet</div>
                 """
 
-            # Enhanced categorization system with cybersecurity focus
-            folders = {
-                "🔒 Security & Compliance": [],
-                "📋 Policy & Governance": [],
-                "🕵️ Threat Intelligence": [],
-                "🚨 Incident Response": [],
-                "🔧 Technical & Infrastructure": [],
-                "📊 Research & Analysis": [],
-            }
+            # Folders come from the catalog's precomputed category index, and
+            # only folders whose files changed since the last call re-render
+            html_content = "".join(
+                self._get_folder_section(catalog, folder_name)
+                for folder_name in TAXONOMIES[FOLDER].categories
+            )
+            return html_content
+        except KeyError as e:
+            logger.error(
+                f"KeyError in document library generation - missing folder key: {e}"
+            )
+            return "<div style='color: #ff6b6b; padding: 20px;'>Error: Document categorization failed</div>"
+        except AttributeError as e:
+            logger.error(
+                f"AttributeError in document library generation - invalid object access: {e}"
+            )
+            return "<div style='color: #ff6b6b; padding: 20px;'>Error: Document metadata issue</div>"
+        except Exception as e:
+            logger.error(
+                f"Unexpected error generating document library: {type(e).__name__}: {e}"
+            )
+            return "<div style='color: #ff6b6b; padding: 20px;'>Error loading document library</div>"
 
-            # Get document metadata for enhanced categorization
-            doc_metadata = {}
-            for ingested_document in self._ingest_service.list_ingested():
-                if (
-                    ingested_document.doc_metadata
-                    and ingested_document.doc_metadata.get("file_name")
-                ):
-                    file_name = ingested_document.doc_metadata["file_name"]
-                    doc_metadata[file_name] = {
-                        "size": ingested_document.doc_metadata.get("file_size", 0),
-                        "created": ingested_document.doc_metadata.get(
-                            "creation_date", ""
-                        ),
-                        "hash": ingested_document.doc_metadata.get("content_hash", ""),
-                        "doc_id": ingested_document.doc_id,
-                        "processing_status": ingested_document.processing_status,
-                        "quality_score": ingested_document.quality_score,
-                        "chunk_count": ingested_document.chunk_count,
-                        "error_message": ingested_document.error_message,
-                        "type": self._utility_builder.get_file_type(file_name),
-                    }
-
-            # Enhanced file categorization logic
-            for file_row in files:
-                if file_row and len(file_row) > 0:
-                    file_name = file_row[0]
-                    file_name_lower = file_name.lower()
-
-                    # Security & Compliance
-                    if any(
-                        term in file_name_lower
-                        for term in [
-                            "security assessment",
-                            "security audit",
-                            "compliance audit",
-                            "vulnerability assessment",
-                            "penetration test",
-                            "security scan",
-                            "risk assessment",
-                            "security review",
-                            "compliance",
-                            "regulatory",
-                            "certification",
-                            "iso",
-                            "soc",
-                            "pci",
-                            "dss",
-                            "gdpr",
-                            "sox",
-                        ]
-                    ):
-                        folders["🔒 Security & Compliance"].append(file_name)
-
-                    # Policy & Governance
-                    elif any(
-                        term in file_name_lower
-                        for term in [
-                            "policy",
-                            "procedure",
-                            "guideline",
-                            "manual",
-                            "handbook",
-                            "protocol",
-                            "standard",
-                            "regulation",
-                            "code of conduct",
-                            "governance",
-                            "framework",
-                            "baseline",
-                            "control",
-                            "requirement",
-                            "specification",
-                        ]
-                    ):
-                        folders["📋 Policy & Governance"].append(file_name)
-
-                    # Threat Intelligence
-                    elif any(
-                        term in file_name_lower
-                        for term in [
-                            "threat intelligence",
-                            "ioc",
-                            "malware",
-                            "apt",
-                            "campaign",
-                            "cve",
-                            "exploit",
-                            "mitre",
-                            "att&ck",
-                            "ttp",
-                            "indicator",
-                            "signature",
-                            "yara",
-                            "stix",
-                            "taxii",
-                            "threat",
-                            "attack",
-                            "vulnerability",
-                            "ransomware",
-                            "phishing",
-                        ]
-                    ):
-                        folders["🕵️ Threat Intelligence"].append(file_name)
-
-                    # Incident Response
-                    elif any(
-                        term in file_name_lower
-                        for term in [
-                            "incident response",
-                            "forensics",
-                            "investigation",
-                            "breach",
-                            "attack",
-                            "incident",
-                            "compromise",
-                            "intrusion",
-                            "data breach",
-                            "containment",
-                            "eradication",
-                        ]
-                    ):
-                        folders["🚨 Incident Response"].append(file_name)
-
-                    # Technical & Infrastructure
-                    elif any(
-                        term in file_name_lower
-                        for term in [
-                            "technical",
-                            "architecture",
-                            "design",
-                            "api",
-                            "database",
-                            "system",
-                            "infrastructure",
-                            "code",
-                            "development",
-                            "software",
-                            "hardware",
-                            "network",
-                            "blueprint",
-                            "diagram",
-                            "topology",
-                            "schema",
-                            "protocol",
-                            "interface",
-                        ]
-                    ):
-                        folders["🔧 Technical & Infrastructure"].append(file_name)
-
-                    # Research & Analysis (default category)
-                    else:
-                        folders["📊 Research & Analysis"].append(file_name)
-
-            # Document content will be managed by Gradio components
-            html_content = ""
-
-            # Generate folder structure with enhanced file information
-            for folder_name, folder_files in folders.items():
-                if folder_files:
-                    html_content += f"""
+    def get_library_page(
+        self, folder_name: str, offset: int = 0, limit: int = LIBRARY_PAGE_SIZE
+    ) -> LibraryPage:
+        """Get one page of a library folder, most recent files first.
+
+        Pages are cached until the folder's files change, so paging through a
+        large folder only renders each page once.
+
+        Args:
+            folder_name: Library folder to page through
+            offset: Cursor returned as ``next_offset`` by the previous page
+            limit: Maximum number of files on the page
+
+        Returns:
+            LibraryPage with the HTML fragment of the page's files
+        """
+        catalog = self._ingest_service.catalog
+        version, folder_files = self._get_folder_files(catalog, folder_name)
+        key = (folder_name, offset, limit)
+        cached = self._page_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        page_files = folder_files[offset : offset + limit]
+        end = offset + len(page_files)
+        page = LibraryPage(
+            folder=folder_name,
+            html=self._render_file_items(catalog, page_files),
+            offset=offset,
+            total=len(folder_files),
+            next_offset=end if end < len(folder_files) else None,
+        )
+        self._page_cache[key] = (version, page)
+        return page
+
+    def _get_folder_files(
+        self, catalog: DocumentCatalog, folder_name: str
+    ) -> tuple[int, list[str]]:
+        """Files of a folder in display order, with the folder's catalog version."""
+        version = catalog.facet_version(FOLDER, folder_name)
+        cached = self._folder_files.get(folder_name)
+        if cached is not None and cached[0] == version:
+            return cached
+
+        # Sort files by most recent first
+        folder_files = catalog.files_with_facet(FOLDER, folder_name)[::-1]
+        self._folder_files[folder_name] = (version, folder_files)
+        # Pages of the previous snapshot are stale
+        for key in [k for k in self._page_cache if k[0] == folder_name]:
+            del self._page_cache[key]
+        return version, folder_files
+
+    def _get_folder_section(self, catalog: DocumentCatalog, folder_name: str) -> str:
+        """HTML of a library folder with its first page, cached per folder version."""
+        version = catalog.facet_version(FOLDER, folder_name)
+        cached = self._folder_sections.get(folder_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        page = self.get_library_page(folder_name)
+        html_content = ""
+        if page.total:
+            html_content += f"""
                     <div class='document-item folder-item' onclick='toggleFolder(this)' data-folder='{folder_name}'>
                         <span class='document-icon'>📁</span>
-                        <span>{folder_name} ({len(folder_files)})</span>
+                        <span>{folder_name} ({page.total})</span>
                         <span class='collapsible-icon'>▼</span>
                     </div>
                     <div class='folder-content' style='margin-left: 20px; display: none;'>
                     """
+            html_content += page.html
+            if page.next_offset is not None:
+                # Further pages are fetched from the UI's library page route
+                html_content += f"<div class='library-load-more' data-folder='{folder_name}' data-offset='{page.next_offset}' onclick='loadMoreDocuments(this)' style='color: #4CAF50; cursor: pointer; font-size: 12px; padding: 4px 0; text-align: center;'>⬇ Load more ({page.total - page.next_offset} more documents)</div>"
+            html_content += "</div>"
+
+        logger.debug(f"📚 [LIBRARY] Rendered folder {folder_name} ({page.total} files)")
+        self._folder_sections[folder_name] = (version, html_content)
+        return html_content
 
-                    # Sort files by most recent first
-                    sorted_files = sorted(folder_files, reverse=True)
+    def _render_file_items(self, catalog: DocumentCatalog, file_names: list) -> str:
+        """Render library items for the given files.
 
-                    for file_name in sorted_files[:15]:  # Show max 15 files per folder
-                        file_type = self._utility_builder.get_file_type(file_name)
-                        file_meta = doc_metadata.get(file_name, {})
-                        doc_id = file_meta.get('doc_id', '')
+        Args:
+            catalog: Document catalog to read the files' metadata from
+            file_names: Names of the files to render, in display order
 
-                        # File type icon
-                        type_icon = self._utility_builder.get_file_type_icon(file_type)
+        Returns:
+            HTML string with one item per file
+        """
+        html_content = ""
+        for file_name in file_names:
+            file_type = self._utility_builder.get_file_type(file_name)
+            file_meta = self._file_meta(catalog, file_name)
+            doc_id = file_meta.get("doc_id", "")
 
-                        # Quality badge
-                        quality_badge = self._get_quality_badge(file_meta)
+            # File type icon
+            type_icon = self._utility_builder.get_file_type_icon(file_type)
 
-                        html_content += f"""
+            # Quality badge
+            quality_badge = self._get_quality_badge(file_meta)
+
+            html_content += f"""
                         <div class='document-item' data-filename='{file_name}' data-type='{file_type}' data-docid='{doc_id}'
                              onclick='selectDocumentForTools(this, "{file_name}", "{doc_id}")'>
                             <span class='document-icon'>{type_icon}</span>
@@ -339,27 +327,7 @@ class DocumentLibraryBuilder:
                             </div>
                         </div>
                         """
-
-                    if len(folder_files) > 15:
-                        html_content += f"<div style='color: #666; font-size: 12px; padding: 4px 0; text-align: center;'>... and {len(folder_files) - 15} more documents</div>"
-                    html_content += "</div>"
-
-            return html_content
-        except KeyError as e:
-            logger.error(
-                f"KeyError in document library generation - missing folder key: {e}"
-            )
-            return "<div style='color: #ff6b6b; padding: 20px;'>Error: Document categorization failed</div>"
-        except AttributeError as e:
-            logger.error(
-                f"AttributeError in document library generation - invalid object access: {e}"
-            )
-            return "<div style='color: #ff6b6b; padding: 20px;'>Error: Document metadata issue</div>"
-        except Exception as e:
-            logger.error(
-                f"Unexpected error generating document library: {type(e).__name__}: {e}"
-            )
-            return "<div style='color: #ff6b6b; padding: 20px;'>Error loading document library</div>"
+        return html_content
 
     def get_chat_mentioned_documents(self) -> set:
         """Get set of documents that have been mentioned/referenced in chat conversations.
@@ -423,20 +391,12 @@ class DocumentLibraryBuilder:
                 )
 
             # Get document metadata for filtering
-            doc_metadata = {}
-            for ingested_document in self._ingest_service.list_ingested():
-                if (
-                    ingested_document.doc_metadata
-                    and ingested_document.doc_metadata.get("file_name")
-                ):
-                    file_name = ingested_document.doc_metadata["file_name"]
-                    doc_metadata[file_name] = {
-                        "size": ingested_document.doc_metadata.get("file_size", 0),
-                        "created": ingested_document.doc_metadata.get(
-                            "creation_date", ""
-                        ),
-                        "type": self._utility_builder.get_file_type(file_name),
-                    }
+            catalog = self._ingest_service.catalog
+            doc_metadata = {
+                file_row[0]: self._file_meta(catalog, file_row[0])
+                for file_row in files
+                if file_row
+            }
 
             # Get chat-mentioned documents (truly analyzed documents)
             analyzed_files = self.get_chat_mentioned_documents()
@@ -450,30 +410,30 @@ class DocumentLibraryBuilder:
                 status_message = f"<div style='color: #0077BE; font-weight: 500; padding: 8px;'>Showing all documents ({len(files)} total)</div>"
 
             elif filter_type == "pdf":
-                for file_row in files:
-                    if file_row and len(file_row) > 0:
-                        file_name = file_row[0]
-                        file_meta = doc_metadata.get(file_name, {})
-                        if file_meta.get("type", "other") == "pdf":
-                            filtered_files.append(file_row)
+                typed_files = set(catalog.files_with_facet(FILE_TYPE, "pdf"))
+                filtered_files = [
+                    file_row
+                    for file_row in files
+                    if file_row and file_row[0] in typed_files
+                ]
                 status_message = f"<div style='color: #0077BE; font-weight: 500; padding: 8px;'>Showing PDF files uploaded ({len(filtered_files)} found)</div>"
 
             elif filter_type == "excel":
-                for file_row in files:
-                    if file_row and len(file_row) > 0:
-                        file_name = file_row[0]
-                        file_meta = doc_metadata.get(file_name, {})
-                        if file_meta.get("type", "other") == "excel":
-                            filtered_files.append(file_row)
+                typed_files = set(catalog.files_with_facet(FILE_TYPE, "excel"))
+                filtered_files = [
+                    file_row
+                    for file_row in files
+                    if file_row and file_row[0] in typed_files
+                ]
                 status_message = f"<div style='color: #0077BE; font-weight: 500; padding: 8px;'>Showing Excel files uploaded ({len(filtered_files)} found)</div>"
 
             elif filter_type == "word":
-                for file_row in files:
-                    if file_row and len(file_row) > 0:
-                        file_name = file_row[0]
-                        file_meta = doc_metadata.get(file_name, {})
-                        if file_meta.get("type", "other") == "word":
-                            filtered_files.append(file_row)
+                typed_files = set(catalog.files_with_facet(FILE_TYPE, "word"))
+                filtered_files = [
+                    file_row
+                    for file_row in files
+                    if file_row and file_row[0] in typed_files
+                ]
                 status_message = f"<div style='color: #0077BE; font-weight: 500; padding: 8px;'>Showing Word files uploaded ({len(filtered_files)} found)</div>"
 
             elif filter_type == "recent":
@@ -624,21 +584,10 @@ class DocumentLibraryBuilder:
                     "analyzed": 0,
                 }
 
-            # Get document metadata for filtering
-            doc_metadata = {}
-            for ingested_document in self._ingest_service.list_ingested():
-                if (
-                    ingested_document.doc_metadata
-                    and ingested_document.doc_metadata.get("file_name")
-                ):
-                    file_name = ingested_document.doc_metadata["file_name"]
-                    doc_metadata[file_name] = {
-                        "size": ingested_document.doc_metadata.get("file_size", 0),
-                        "created": ingested_document.doc_metadata.get(
-                            "creation_date", ""
-                        ),
-                        "type": self._utility_builder.get_file_type(file_name),
-                    }
+            # Per-type counts come from the catalog's file type index
+            catalog = self._ingest_service.catalog
+            type_counts = catalog.facet_counts(FILE_TYPE)
+            typed = sum(type_counts.get(t, 0) for t in ("pdf", "excel", "word"))
 
             # Get analyzed documents
             analyzed_files = self.get_chat_mentioned_documents()
@@ -646,36 +595,23 @@ class DocumentLibraryBuilder:
             # Count each type
             counts = {
                 "all": len(files),
-                "pdf": 0,
-                "excel": 0,
-                "word": 0,
-                "other": 0,
+                "pdf": type_counts.get("pdf", 0),
+                "excel": type_counts.get("excel", 0),
+                "word": type_counts.get("word", 0),
+                "other": len(files) - typed,
                 "recent": min(10, len(files)),  # Show last 10
                 "updated": 0,
                 "analyzed": len(analyzed_files),
             }
 
-            # Count by file type
+            # Count updated (within 7 days)
             seven_days_ago = datetime.datetime.now() - datetime.timedelta(days=7)
 
             for file_row in files:
                 if file_row and len(file_row) > 0:
-                    file_name = file_row[0]
-                    file_meta = doc_metadata.get(file_name, {})
-                    file_type = file_meta.get("type", "other")
-
-                    # Count by type
-                    if file_type == "pdf":
-                        counts["pdf"] += 1
-                    elif file_type == "excel":
-                        counts["excel"] += 1
-                    elif file_type == "word":
-                        counts["word"] += 1
-                    else:
-                        counts["other"] += 1
-
-                    # Count updated (within 7 days)
-                    created_str = file_meta.get("created", "")
+                    created_str = self._file_meta(catalog, file_row[0]).get(
+                        "created", ""
+                    )
                     if created_str:
                         try:
                             created_date = datetime.datetime.fromisoformat(
@@ -47,6 +47,8 @@ class DocumentUtilityBuilder:
         """
         self._ingest_service = ingest_service
         self._chat_service = chat_service
+        # (catalog_version, file_list) of the last listing, reused while unchanged
+        self._file_list_cache: tuple[int, list[list[str]]] | None = None
 
     def list_ingested_files(self) -> list[list[str]]:
         """List all ingested files with improved error handling and logging.
@@ -56,6 +58,13 @@ class DocumentUtilityBuilder:
         Returns:
             List of file names in format expected by Gradio List component
         """
+        catalog_version = self._ingest_service.catalog_version
+        if (
+            self._file_list_cache is not None
+            and self._file_list_cache[0] == catalog_version
+        ):
+            return [list(row) for row in self._file_list_cache[1]]
+
         logger.info(
             "🔄 [UI_REFRESH] Starting file list refresh from persistent storage"
         )
@@ -110,7 +119,8 @@ class DocumentUtilityBuilder:
                 f"Returning file list with {len(file_list)} items for UI display"
             )
 
-            return file_list
+            self._file_list_cache = (catalog_version, file_list)
+            return [list(row) for row in file_list]
 
         except Exception as e:
             logger.error(f"Error listing ingested files: {e}", exc_info=True)
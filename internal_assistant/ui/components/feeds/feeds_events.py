@@ -704,48 +704,48 @@ class FeedsEventHandler:
         try:
             logger.info("Starting MITRE ATT&CK data refresh...")
 
-            # Import the dedicated MITRE ATT&CK service
-            from internal_assistant.server.threat_intelligence.mitre_attack_service import (
-                MitreAttackService,
+            from internal_assistant.di import global_injector
+            from internal_assistant.server.threat_intelligence.mitre_knowledge_base import (
+                MitreKnowledgeBase,
             )
 
-            # Use the actual MITRE ATT&CK API
-            async with MitreAttackService() as mitre_service:
-                success = await mitre_service.refresh_data()
+            # Refresh the shared knowledge base so the API serves the same data
+            knowledge_base = global_injector.get(MitreKnowledgeBase)
+            success = await knowledge_base.refresh()
 
-                if not success:
-                    # Try to use cached data
-                    cache_info = mitre_service.get_cache_info()
-                    if cache_info.get("techniques_count", 0) > 0:
-                        logger.info("Using cached MITRE data after refresh failure")
-                        mitre_html = self._format_mitre_attack_data(mitre_service)
-                        return (
-                            "⚠️ Using cached MITRE data (refresh failed)",
-                            mitre_html,
-                        )
+            if not success:
+                # Try to use cached data
+                cache_info = knowledge_base.get_cache_info()
+                if cache_info.get("techniques_count", 0) > 0:
+                    logger.info("Using cached MITRE data after refresh failure")
+                    mitre_html = self._format_mitre_attack_data(knowledge_base)
+                    return (
+                        "⚠️ Using cached MITRE data (refresh failed)",
+                        mitre_html,
+                    )
 
-                    error_html = """
-                    <div class="no-feeds-message">
-                        <h3>🎯 MITRE ATT&CK API Unavailable</h3>
-                        <p>Unable to fetch MITRE ATT&CK framework data from API</p>
-                        <p><strong>Possible reasons:</strong></p>
-                        <ul>
-                            <li>MITRE ATT&CK API is temporarily down</li>
-                            <li>Network connectivity issues</li>
-                            <li>API rate limiting</li>
-                        </ul>
-                        <p><em>Try refreshing again in a few minutes.</em></p>
-                    </div>
-                    """
-                    return "Failed to fetch MITRE data", error_html
+                error_html = """
+                <div class="no-feeds-message">
+                    <h3>🎯 MITRE ATT&CK API Unavailable</h3>
+                    <p>Unable to fetch MITRE ATT&CK framework data from API</p>
+                    <p><strong>Possible reasons:</strong></p>
+                    <ul>
+                        <li>MITRE ATT&CK API is temporarily down</li>
+                        <li>Network connectivity issues</li>
+                        <li>API rate limiting</li>
+                    </ul>
+                    <p><em>Try refreshing again in a few minutes.</em></p>
+                </div>
+                """
+                return "Failed to fetch MITRE data", error_html
 
-                # Format MITRE data using dedicated formatter
-                mitre_html = self._format_mitre_attack_data(mitre_service)
+            # Format MITRE data using dedicated formatter
+            mitre_html = self._format_mitre_attack_data(knowledge_base)
 
-                cache_info = mitre_service.get_cache_info()
-                status_msg = f"✅ MITRE ATT&CK: {cache_info['techniques_count']} techniques, {cache_info['tactics_count']} tactics, {cache_info['groups_count']} threat groups"
-                logger.info(f"MITRE refresh completed: {cache_info}")
-                return status_msg, mitre_html
+            cache_info = knowledge_base.get_cache_info()
+            status_msg = f"✅ MITRE ATT&CK: {cache_info['techniques_count']} techniques, {cache_info['tactics_count']} tactics, {cache_info['groups_count']} threat groups"
+            logger.info(f"MITRE refresh completed: {cache_info}")
+            return status_msg, mitre_html
 
         except Exception as e:
             error_msg = f"Failed to refresh MITRE data: {e!s}"
@@ -771,7 +771,7 @@ class FeedsEventHandler:
         """Format MITRE ATT&CK data into HTML.
 
         Args:
-            mitre_service: MitreAttackService instance with loaded data
+            mitre_service: MitreKnowledgeBase (or MitreAttackService) with loaded data
             sector: Sector name for filtering (Financial, Government, Healthcare, Energy, Technology, Retail, Manufacturing)
 
         Returns:
@@ -13,7 +13,16 @@ from llama_index.core.llms import ChatMessage
 
 from internal_assistant.open_ai.extensions.context_filter import ContextFilter
 from internal_assistant.server.chat.chat_service import ChatService, CompletionGen
-
+from internal_assistant.settings.settings import settings
+
+from .llm_probes import (
+    GenerationProbe,
+    LivenessProbe,
+    ProbeCache,
+    ProbeResult,
+    create_llm_probe,
+    get_probe_cache,
+)
 from .service_facade import ServiceFacade
 
 logger = logging.getLogger(__name__)
@@ -24,10 +33,29 @@ class ChatServiceFacade(ServiceFacade[ChatService]):
     error recovery, and performance optimization.
     """
 
-    def __init__(self, chat_service: ChatService):
+    def __init__(
+        self,
+        chat_service: ChatService,
+        probe: LivenessProbe | None = None,
+        probe_cache: ProbeCache | None = None,
+    ):
         super().__init__(chat_service, "chat_service")
         self._active_streams = {}
         self._stream_counter = 0
+        self._probe = probe or self._create_probe(chat_service)
+        self._probe_cache = probe_cache or get_probe_cache()
+        self._last_probe: ProbeResult | None = None
+
+    @staticmethod
+    def _create_probe(chat_service: ChatService) -> LivenessProbe:
+        """Cheapest liveness probe for the configured LLM backend."""
+        try:
+            llm_component = getattr(chat_service, "llm_component", None)
+            probe = create_llm_probe(settings(), getattr(llm_component, "llm", None))
+        except Exception as e:
+            logger.warning(f"Could not create LLM liveness probe: {e}")
+            probe = None
+        return probe or GenerationProbe(chat_service)
 
     @ServiceFacade.with_retry(max_retries=3, base_delay=1.0)
     def stream_chat(
@@ -210,9 +238,11 @@ class ChatServiceFacade(ServiceFacade[ChatService]):
             # They'll be cleaned up by the service orchestrator
 
     def _basic_health_check(self) -> bool:
-        """Basic health check for chat service with timeout and circuit breaker."""
-        from concurrent.futures import ThreadPoolExecutor, TimeoutError
+        """Liveness check for the LLM backend with circuit breaker.
 
+        Uses a backend-specific probe (e.g. Ollama's model list) rather than a
+        generation, and shares its cached result with every other caller.
+        """
         # Check circuit breaker first
         if self._is_circuit_breaker_open():
             logger.debug(
@@ -220,42 +250,12 @@ class ChatServiceFacade(ServiceFacade[ChatService]):
             )
             return False
 
-        try:
-            # Lightweight health check - just test LLM connectivity
-            test_messages = [ChatMessage(role="user", content="ping")]
-
-            # Use executor with timeout for cross-platform compatibility
-            # No need for signal.SIGALRM which doesn't work on Windows
-            with ThreadPoolExecutor(
-                max_workers=1, thread_name_prefix="health-check"
-            ) as executor:
-                future = executor.submit(self._perform_llm_ping, test_messages)
-                try:
-                    result = future.result(timeout=5)  # 5-second timeout
-                    return result
-                except TimeoutError:
-                    logger.warning("Chat service health check timed out")
-                    # Cancel the future if it's still running
-                    future.cancel()
-                    self._trigger_circuit_breaker()
-                    return False
-
-        except Exception as e:
-            logger.warning(f"Chat service health check failed: {e}")
+        result = self._probe_cache.get(self._probe)
+        self._last_probe = result
+        if not result.healthy:
+            logger.warning(f"Chat service health check failed: {result.detail}")
             self._trigger_circuit_breaker()
-            return False
-
-    def _perform_llm_ping(self, test_messages) -> bool:
-        """Perform minimal LLM connectivity test."""
-        try:
-            completion_gen = self.service.stream_chat(
-                messages=test_messages, use_context=False, context_filter=None
-            )
-            # Just check if we can get the first token quickly
-            first_token = next(iter(completion_gen.response), None)
-            return first_token is not None
-        except Exception:
-            return False
+        return result.healthy
 
     def get_service_info(self) -> dict[str, Any]:
         """Get comprehensive service information."""
@@ -267,6 +267,10 @@ class ChatServiceFacade(ServiceFacade[ChatService]):
             "active_streams": len(self._active_streams),
             "stream_details": self.get_active_streams(),
             "health": self._health.value,
+            "liveness_probe": {
+                "key": self._probe.key,
+                "last_result": self._last_probe.to_dict() if self._last_probe else None,
+            },
             "capabilities": {
                 "streaming": True,
                 "context_aware": True,
@@ -0,0 +1,268 @@
+"""LLM Liveness Probes
+
+Cheap, backend-specific checks that the LLM backend is up, used by the chat
+facade's health check instead of running a generation.
+
+- Ollama: ``/api/tags`` (server up, model installed) and ``/api/ps`` (model
+  loaded, reported only)
+- OpenAI-like servers: ``/models`` endpoint reachability
+- llama.cpp: the model is loaded in process
+- other backends: a one-token generation, as a last resort
+
+Results are cached with a TTL in a process-wide ``ProbeCache`` keyed by the
+probed endpoint, so all facades and callers share one probe per interval.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from llama_index.core.llms import ChatMessage
+
+if TYPE_CHECKING:
+    from internal_assistant.settings.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROBE_TTL = 30.0
+DEFAULT_PROBE_TIMEOUT = 2.0
+GENERATION_PROBE_TIMEOUT = 5.0
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one liveness probe."""
+
+    healthy: bool
+    detail: str
+    latency: float = 0.0
+    checked_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "detail": self.detail,
+            "latency": round(self.latency, 4),
+            "checked_at": self.checked_at,
+        }
+
+
+class LivenessProbe(ABC):
+    """A cheap check that an LLM backend can serve requests."""
+
+    @property
+    @abstractmethod
+    def key(self) -> str:
+        """Identifies the probed backend; probes with equal keys share results."""
+
+    @abstractmethod
+    def _check(self) -> tuple[bool, str]:
+        """Return whether the backend is alive and a short description."""
+
+    def check(self) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            healthy, detail = self._check()
+        except Exception as e:
+            healthy, detail = False, f"{type(e).__name__}: {e}"
+        return ProbeResult(healthy, detail, time.perf_counter() - start)
+
+
+class OllamaProbe(LivenessProbe):
+    """Lists installed and running models; never triggers a generation."""
+
+    def __init__(
+        self,
+        api_base: str,
+        model: str | None,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self.api_base = api_base.rstrip("/")
+        self.model = model
+        self.timeout = timeout
+        self.transport = transport
+
+    @property
+    def key(self) -> str:
+        return f"ollama:{self.api_base}:{self.model}"
+
+    def _check(self) -> tuple[bool, str]:
+        with httpx.Client(
+            base_url=self.api_base, timeout=self.timeout, transport=self.transport
+        ) as client:
+            tags = client.get("/api/tags")
+            tags.raise_for_status()
+            if not self.model:
+                return True, "server up"
+            if not self._has_model(tags.json()):
+                return False, f"model {self.model} not installed"
+
+            running = client.get("/api/ps")
+            loaded = running.is_success and self._has_model(running.json())
+        return True, f"model {self.model} {'loaded' if loaded else 'not loaded'}"
+
+    def _has_model(self, payload: dict[str, Any]) -> bool:
+        names = {self.model, f"{self.model}:latest"}
+        return any(
+            model.get("name") in names or model.get("model") in names
+            for model in payload.get("models", [])
+        )
+
+
+class OpenAILikeProbe(LivenessProbe):
+    """Checks that an OpenAI-compatible server answers on its models endpoint."""
+
+    def __init__(
+        self,
+        api_base: str,
+        api_key: str | None = None,
+        timeout: float = DEFAULT_PROBE_TIMEOUT,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self.api_base = api_base.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.transport = transport
+
+    @property
+    def key(self) -> str:
+        return f"openai:{self.api_base}"
+
+    def _check(self) -> tuple[bool, str]:
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        with httpx.Client(timeout=self.timeout, transport=self.transport) as client:
+            response = client.get(f"{self.api_base}/models", headers=headers)
+        # An auth or routing error still proves the server is up
+        if response.status_code >= 500:
+            return False, f"server error {response.status_code}"
+        return True, f"server up ({response.status_code})"
+
+
+class LlamaCppProbe(LivenessProbe):
+    """Checks that the in-process llama.cpp model is loaded."""
+
+    def __init__(self, llm: Any) -> None:
+        self.llm = llm
+
+    @property
+    def key(self) -> str:
+        return f"llamacpp:{id(self.llm)}"
+
+    def _check(self) -> tuple[bool, str]:
+        if getattr(self.llm, "_model", None) is None:
+            return False, "model not loaded"
+        return True, "model loaded"
+
+
+class GenerationProbe(LivenessProbe):
+    """Waits for the first token of a "ping" chat; used when no cheap check exists."""
+
+    def __init__(
+        self, chat_service: Any, timeout: float = GENERATION_PROBE_TIMEOUT
+    ) -> None:
+        self.chat_service = chat_service
+        self.timeout = timeout
+
+    @property
+    def key(self) -> str:
+        return f"generation:{id(self.chat_service)}"
+
+    def _check(self) -> tuple[bool, str]:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="health-check")
+        future = executor.submit(self._first_token)
+        try:
+            first_token = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            return False, f"no token within {self.timeout:.0f}s"
+        finally:
+            executor.shutdown(wait=False)
+        if first_token is None:
+            return False, "empty response"
+        return True, "generated a token"
+
+    def _first_token(self) -> Any:
+        completion_gen = self.chat_service.stream_chat(
+            messages=[ChatMessage(role="user", content="ping")],
+            use_context=False,
+            context_filter=None,
+        )
+        return next(iter(completion_gen.response), None)
+
+
+class ProbeCache:
+    """Caches probe results for ``ttl`` seconds, running one probe per key at once.
+
+    Callers arriving while a probe is in flight wait for it and reuse its
+    result instead of starting another.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_PROBE_TTL) -> None:
+        self.ttl = ttl
+        self._results: dict[str, ProbeResult] = {}
+        self._probe_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, probe: LivenessProbe) -> ProbeResult:
+        with self._lock:
+            result = self._fresh(probe.key)
+            if result is not None:
+                return result
+            probe_lock = self._probe_locks.setdefault(probe.key, threading.Lock())
+
+        with probe_lock:
+            with self._lock:
+                result = self._fresh(probe.key)
+            if result is not None:
+                return result
+
+            result = probe.check()
+            log = logger.debug if result.healthy else logger.warning
+            log(f"🩺 [PROBE] {probe.key}: {result.detail} ({result.latency:.3f}s)")
+            with self._lock:
+                self._results[probe.key] = result
+            return result
+
+    def invalidate(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._results.clear()
+            else:
+                self._results.pop(key, None)
+
+    def _fresh(self, key: str) -> ProbeResult | None:
+        result = self._results.get(key)
+        if result is not None and time.time() - result.checked_at < self.ttl:
+            return result
+        return None
+
+
+_probe_cache = ProbeCache()
+
+
+def get_probe_cache() -> ProbeCache:
+    """Process-wide probe cache shared by all facades."""
+    return _probe_cache
+
+
+def create_llm_probe(settings: "Settings", llm: Any = None) -> LivenessProbe | None:
+    """Liveness probe for the configured LLM mode, or None if there is none."""
+    match settings.llm.mode:
+        case "ollama":
+            return OllamaProbe(settings.ollama.api_base, settings.ollama.llm_model)
+        case "openai" | "openailike":
+            openai_settings = settings.openai
+            return OpenAILikeProbe(
+                openai_settings.api_base or "https://api.openai.com/v1",
+                openai_settings.api_key,
+            )
+        case "llamacpp":
+            return LlamaCppProbe(llm)
+        case _:
+            return None
@@ -1,6 +1,7 @@
 """This file should be imported if and only if you want to run the UI locally."""
 
 import asyncio
+import dataclasses
 import logging
 import time
 from collections.abc import Callable, Iterable
@@ -12,7 +13,7 @@ from typing import Any
 import gradio as gr  # type: ignore
 from fastapi import FastAPI
 from injector import inject, singleton
-from llama_index.core.llms import ChatMessage, ChatResponse, MessageRole
+from llama_index.core.llms import ChatMessage, MessageRole
 from llama_index.core.types import TokenGen
 from pydantic import BaseModel, ConfigDict
 
@@ -85,6 +86,7 @@ from internal_assistant.ui.styles.css_manager import CSSManager
 from internal_assistant.ui.ui_strings import (
     UI_TAB_TITLE,
 )
+from internal_assistant.ui.utils.streaming import StreamFramer
 from tools.Javascript.js_manager import JSManager
 
 logger = logging.getLogger(__name__)
@@ -769,15 +771,9 @@ class InternalAssistantUI:
             return
 
         def yield_deltas(completion_gen: CompletionGen) -> Iterable[str]:
-            full_response: str = ""
-            stream = completion_gen.response
-            for delta in stream:
-                if isinstance(delta, str):
-                    full_response += str(delta)
-                elif isinstance(delta, ChatResponse):
-                    full_response += delta.delta or ""
-                yield full_response
-                time.sleep(0.02)
+            framer = StreamFramer()
+            yield from framer.frames(completion_gen.response)
+            full_response = framer.text
 
             # Apply citation style settings for document sources with enhanced correlation
             if completion_gen.sources and citation_style != "Exclude Sources":
@@ -804,10 +800,7 @@ class InternalAssistantUI:
             yield full_response
 
         def yield_tokens(token_gen: TokenGen) -> Iterable[str]:
-            full_response: str = ""
-            for token in token_gen:
-                full_response += str(token)
-                yield full_response
+            yield from StreamFramer().frames(token_gen)
 
         def build_history() -> list[ChatMessage]:
             history_messages: list[ChatMessage] = []
@@ -966,6 +959,12 @@ class InternalAssistantUI:
             search_query, filter_tags
         )
 
+    def _get_library_page(self, folder: str, offset: int = 0) -> dict:
+        """Serve the next page of a library folder to the "load more" handler."""
+        return dataclasses.asdict(
+            self._doc_library_builder.get_library_page(folder, offset)
+        )
+
     def _analyze_document_types(self) -> dict:
         """Analyze document types using DocumentStateManager."""
         return self._doc_state_manager.analyze_document_types()
@@ -3338,6 +3337,13 @@ class InternalAssistantUI:
     def mount_in_app(self, app: FastAPI, path: str) -> None:
         blocks = self.get_ui_blocks()
 
+        # Registered before the mount, which would otherwise shadow it
+        app.add_api_route(
+            f"{path.rstrip('/')}/library/page",
+            self._get_library_page,
+            methods=["GET"],
+            include_in_schema=False,
+        )
         logger.info("Mounting the modern gradio UI, at path=%s", path)
         gr.mount_gradio_app(app, blocks, path=path)
 
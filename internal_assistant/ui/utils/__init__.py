@@ -17,6 +17,7 @@ from .formatters import (
     get_file_type,
     get_file_type_icon,
 )
+from .streaming import StreamFramer, StreamStats
 
 __all__ = [
     # Formatters
@@ -31,4 +32,7 @@ __all__ = [
     "get_document_counts",
     "filter_documents_by_query",
     "get_chat_mentioned_documents",
+    # Streaming
+    "StreamFramer",
+    "StreamStats",
 ]
@@ -6,21 +6,14 @@ Extracted from the monolithic ui.py file for better maintainability.
 
 import logging
 
+from internal_assistant.components.ingest.document_categories import file_type_for
+
 logger = logging.getLogger(__name__)
 
 
 def get_file_type(filename: str) -> str:
     """Get file type from filename."""
-    extension = filename.lower().split(".")[-1] if "." in filename else ""
-    type_mapping = {
-        "pdf": "pdf",
-        "doc": "word",
-        "docx": "word",
-        "xls": "excel",
-        "xlsx": "excel",
-        "csv": "excel",
-    }
-    return type_mapping.get(extension, "other")
+    return file_type_for(filename)
 
 
 def get_file_type_icon(file_type: str) -> str:
@@ -0,0 +1,107 @@
+"""UI Streaming Utilities
+
+Coalesces LLM token streams into frames for the Gradio chat.
+
+Gradio re-renders the whole message on every yield and diffs consecutive
+outputs, sending only the appended text. Yielding once per token still makes
+the server diff the full message each time, so tokens are merged into frames
+that are flushed by time or token budget instead.
+"""
+
+import logging
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from llama_index.core.llms import ChatResponse
+
+logger = logging.getLogger(__name__)
+
+# Flush a frame when this much time has passed since the last one...
+STREAM_FRAME_INTERVAL = 0.05
+# ...or when this many tokens are waiting, whichever comes first
+STREAM_FRAME_MAX_TOKENS = 64
+
+
+@dataclass
+class StreamStats:
+    """Timing of one streamed response."""
+
+    tokens: int = 0
+    frames: int = 0
+    first_token_seconds: float | None = None
+    total_seconds: float = 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Generation rate after the first token."""
+        if self.first_token_seconds is None or self.tokens < 2:
+            return 0.0
+        generating = self.total_seconds - self.first_token_seconds
+        return (self.tokens - 1) / generating if generating > 0 else 0.0
+
+
+def delta_text(delta: str | ChatResponse) -> str:
+    """Text added by one item of a completion stream."""
+    if isinstance(delta, ChatResponse):
+        return delta.delta or ""
+    return str(delta)
+
+
+class StreamFramer:
+    """Merges streamed tokens into cumulative frames without sleeping.
+
+    The first token is flushed immediately so time-to-first-token is not
+    delayed by the frame budget. ``text`` holds the full response so far and
+    ``stats`` its timing once the stream is exhausted.
+    """
+
+    def __init__(
+        self,
+        interval: float = STREAM_FRAME_INTERVAL,
+        max_tokens: int = STREAM_FRAME_MAX_TOKENS,
+    ) -> None:
+        self.interval = interval
+        self.max_tokens = max_tokens
+        self.text = ""
+        self.stats = StreamStats()
+
+    def frames(self, deltas: Iterable[str | ChatResponse]) -> Iterator[str]:
+        start = time.perf_counter()
+        last_flush = start
+        pending: list[str] = []
+
+        for delta in deltas:
+            text = delta_text(delta)
+            if not text:
+                continue
+            now = time.perf_counter()
+            self.stats.tokens += 1
+            if self.stats.first_token_seconds is None:
+                self.stats.first_token_seconds = now - start
+            pending.append(text)
+
+            if (
+                self.stats.tokens == 1
+                or len(pending) >= self.max_tokens
+                or now - last_flush >= self.interval
+            ):
+                yield self._flush(pending)
+                last_flush = now
+
+        if pending:
+            yield self._flush(pending)
+
+        self.stats.total_seconds = time.perf_counter() - start
+        ttft = self.stats.first_token_seconds
+        logger.info(
+            f"⚡ [STREAM] {self.stats.tokens} tokens in {self.stats.frames} frames, "
+            f"first token {f'{ttft:.2f}s' if ttft is not None else 'n/a'}, "
+            f"{self.stats.tokens_per_second:.1f} tokens/s"
+        )
+
+    def _flush(self, pending: list[str]) -> str:
+        self.text += "".join(pending)
+        pending.clear()
+        self.stats.frames += 1
+        return self.text
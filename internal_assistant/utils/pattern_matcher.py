@@ -0,0 +1,230 @@
+"""Single-pass multi-pattern matching over text.
+
+``MultiPatternMatcher`` compiles a set of labelled regex patterns once into
+one combined expression. Every pattern is split into its top-level
+alternatives ("atoms"); the atoms are grouped by first character behind a
+zero-width lookahead, so ``finditer`` visits every position where any atom
+starts, including overlapping ones, in a single scan of the text. Atoms that
+share the first character with the winning alternative are checked at that
+position only, so each pattern sees the same matches it would have found
+with its own ``re.search``/``re.findall``.
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Hashable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+
+# Bucket for atoms that do not start with a plain literal
+_ANY_FIRST_CHAR = ""
+
+
+@dataclass(frozen=True)
+class PatternMatch:
+    """One occurrence of a pattern in the scanned text."""
+
+    label: Hashable
+    pattern: str
+    start: int
+    end: int
+    text: str
+
+
+@dataclass
+class _CompiledAtom:
+    regex: re.Pattern
+    # (label, pattern index, atom index within that pattern)
+    owners: list[tuple[Hashable, int, int]] = field(default_factory=list)
+
+
+def split_alternatives(pattern: str) -> list[str]:
+    """Split a regex on its top-level ``|`` (ignoring groups, classes, escapes)."""
+    atoms: list[str] = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            atoms.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    atoms.append(pattern[start:])
+    return atoms
+
+
+def _first_char(atom: str, flags: int) -> str:
+    if atom and atom[0].isalnum() and (len(atom) == 1 or atom[1] not in "?*{"):
+        return atom[0].lower() if flags & re.IGNORECASE else atom[0]
+    return _ANY_FIRST_CHAR
+
+
+class MatchResult:
+    """All matches of one scan, grouped per label and per pattern."""
+
+    def __init__(
+        self,
+        text: str,
+        patterns: Mapping[Hashable, list[str]],
+        hits: dict[tuple[Hashable, int], list[tuple[int, int, int]]],
+    ) -> None:
+        self.text = text
+        self._patterns = patterns
+        # (label, pattern index) -> [(start, atom index, end)], sorted
+        self._hits = hits
+
+    @property
+    def labels(self) -> list[Hashable]:
+        """Labels with at least one match, in declaration order."""
+        return [
+            label
+            for label, patterns in self._patterns.items()
+            if any((label, i) in self._hits for i in range(len(patterns)))
+        ]
+
+    def matched_patterns(self, label: Hashable) -> list[str]:
+        """Patterns of ``label`` that matched, in declaration order."""
+        return [
+            pattern
+            for i, pattern in enumerate(self._patterns.get(label, []))
+            if (label, i) in self._hits
+        ]
+
+    def first(self, label: Hashable, pattern_index: int = 0) -> PatternMatch | None:
+        """The match ``re.search`` would return for one pattern of ``label``."""
+        hits = self._hits.get((label, pattern_index))
+        if not hits:
+            return None
+        start, _, end = hits[0]
+        return self._match(label, pattern_index, start, end)
+
+    def count(self, label: Hashable, pattern_index: int = 0) -> int:
+        """Number of matches ``re.findall`` would return for one pattern."""
+        return sum(1 for _ in self._non_overlapping(label, pattern_index))
+
+    def matches(self, label: Hashable) -> list[PatternMatch]:
+        """Non-overlapping matches of every pattern of ``label``, by offset."""
+        found = [
+            self._match(label, i, start, end)
+            for i in range(len(self._patterns.get(label, [])))
+            for start, end in self._non_overlapping(label, i)
+        ]
+        return sorted(found, key=lambda match: match.start)
+
+    def counts(self) -> dict[Hashable, int]:
+        return {
+            label: sum(self.count(label, i) for i in range(len(patterns)))
+            for label, patterns in self._patterns.items()
+            if any((label, i) in self._hits for i in range(len(patterns)))
+        }
+
+    def _non_overlapping(
+        self, label: Hashable, pattern_index: int
+    ) -> Iterator[tuple[int, int]]:
+        # Leftmost match wins, the scan resumes at its end, like re.findall
+        position = 0
+        for start, _, end in self._hits.get((label, pattern_index), []):
+            if start >= position:
+                yield start, end
+                position = max(end, start + 1)
+
+    def _match(
+        self, label: Hashable, pattern_index: int, start: int, end: int
+    ) -> PatternMatch:
+        return PatternMatch(
+            label=label,
+            pattern=self._patterns[label][pattern_index],
+            start=start,
+            end=end,
+            text=self.text[start:end],
+        )
+
+
+class MultiPatternMatcher:
+    """Matches many labelled patterns against a text in a single pass.
+
+    ``patterns`` maps a label to one pattern or a list of patterns. Results
+    keep the per-pattern view so callers can ask for the first match or the
+    match count of each pattern, as they would with separate regexes.
+    """
+
+    def __init__(
+        self,
+        patterns: Mapping[Hashable, str | Sequence[str]],
+        flags: int = re.IGNORECASE,
+    ) -> None:
+        self.patterns: dict[Hashable, list[str]] = {
+            label: [value] if isinstance(value, str) else list(value)
+            for label, value in patterns.items()
+        }
+
+        atoms: dict[str, _CompiledAtom] = {}
+        for label, label_patterns in self.patterns.items():
+            for pattern_index, pattern in enumerate(label_patterns):
+                for atom_index, atom in enumerate(split_alternatives(pattern)):
+                    compiled = atoms.setdefault(
+                        atom, _CompiledAtom(re.compile(atom, flags))
+                    )
+                    compiled.owners.append((label, pattern_index, atom_index))
+        self._atoms = list(atoms.values())
+
+        buckets: dict[str, list[int]] = defaultdict(list)
+        for index, atom in enumerate(atoms):
+            buckets[_first_char(atom, flags)].append(index)
+        # Atoms without a literal first character can match anywhere
+        wildcard = buckets.pop(_ANY_FIRST_CHAR, [])
+        self._siblings: list[list[int]] = [[] for _ in self._atoms]
+        for first_char, indexes in buckets.items():
+            for index in indexes:
+                self._siblings[index] = indexes + wildcard
+        for index in wildcard:
+            self._siblings[index] = list(range(len(self._atoms)))
+
+        atom_list = list(atoms)
+        branches = [
+            f"(?={re.escape(first_char)})(?:"
+            + "|".join(f"(?P<a{i}>{atom_list[i]})" for i in indexes)
+            + ")"
+            for first_char, indexes in buckets.items()
+        ]
+        branches.extend(f"(?P<a{i}>{atom_list[i]})" for i in wildcard)
+        self._combined = re.compile(f"(?=(?:{'|'.join(branches)}))", flags)
+
+    def scan(self, text: str) -> MatchResult:
+        hits: dict[tuple[Hashable, int], list[tuple[int, int, int]]] = defaultdict(list)
+        for match in self._combined.finditer(text):
+            winner = int(match.lastgroup[1:])  # type: ignore[index]
+            start = match.start(match.lastgroup)
+            self._record(hits, winner, start, match.end(match.lastgroup))
+            for sibling in self._siblings[winner]:
+                if sibling == winner:
+                    continue
+                sibling_match = self._atoms[sibling].regex.match(text, start)
+                if sibling_match:
+                    self._record(hits, sibling, start, sibling_match.end())
+
+        for occurrences in hits.values():
+            occurrences.sort()
+        return MatchResult(text, self.patterns, dict(hits))
+
+    def _record(
+        self,
+        hits: dict[tuple[Hashable, int], list[tuple[int, int, int]]],
+        atom: int,
+        start: int,
+        end: int,
+    ) -> None:
+        for label, pattern_index, atom_index in self._atoms[atom].owners:
+            hits[(label, pattern_index)].append((start, atom_index, end))
@@ -0,0 +1,45 @@
+"""Startup phase timing.
+
+Settings loading, the dependency check and app creation each record their
+duration in the process-wide ``startup_timer``; the launcher logs the
+breakdown once the app is created.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Durations of named startup phases, in the order they finished."""
+
+    def __init__(self) -> None:
+        self.phases: list[tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.phases.append((name, seconds))
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(seconds for _, seconds in self.phases)
+
+    def log_breakdown(self) -> None:
+        breakdown = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.phases)
+        logger.info(
+            f"⏱️ [STARTUP] Ready in {self.total_seconds:.2f}s ({breakdown or 'no phases'})"
+        )
+        self.phases.clear()
+
+
+startup_timer = StartupTimer()
@@ -2,12 +2,17 @@
 Validates that all dependencies meet the required version constraints.
 """
 
+import hashlib
+import json
 import logging
 import platform
 import sys
+from pathlib import Path
 
 import psutil
 
+from internal_assistant.constants import PROJECT_ROOT_PATH
+
 logger = logging.getLogger(__name__)
 
 # Required version constraints for compatibility
@@ -57,6 +62,10 @@ APP_VERSION = "0.6.2"
 # Critical packages that must be compatible for the application to function
 CRITICAL_PACKAGES = ["fastapi", "pydantic", "llama-index-core", "transformers"]
 
+# A passing dependency check is skipped while the lockfile is unchanged
+LOCKFILE_PATH = PROJECT_ROOT_PATH / "poetry.lock"
+VERSION_CHECK_CACHE_PATH = PROJECT_ROOT_PATH / "local_data" / "version_check.json"
+
 
 def check_python_version() -> bool:
     """Check if the current Python version matches requirements."""
@@ -193,13 +202,55 @@ def check_system_requirements() -> bool:
     return True
 
 
-def validate_dependency_versions() -> None:
-    """Validate that all dependencies meet version requirements."""
+def dependency_fingerprint(lockfile: Path = LOCKFILE_PATH) -> str | None:
+    """Hash of the lockfile, interpreter and constraints, None without lockfile."""
+    try:
+        digest = hashlib.sha256(lockfile.read_bytes())
+    except OSError:
+        return None
+    digest.update(sys.version.encode())
+    digest.update(json.dumps(REQUIRED_VERSIONS, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def _read_cached_fingerprint(cache_path: Path) -> str | None:
+    try:
+        return json.loads(cache_path.read_text()).get("fingerprint")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _write_cached_fingerprint(cache_path: Path, fingerprint: str) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"fingerprint": fingerprint}))
+    except OSError as e:
+        logger.debug("Could not cache dependency check result: %s", e)
+
+
+def validate_dependency_versions(
+    cache_path: Path | None = VERSION_CHECK_CACHE_PATH,
+    lockfile: Path = LOCKFILE_PATH,
+) -> None:
+    """Validate that all dependencies meet version requirements.
+
+    A passing result is cached under the hash of the lockfile, so later starts
+    with the same lockfile and interpreter skip the package scan. Pass
+    ``cache_path=None`` to always run the full check.
+    """
     # Check system requirements first
     if not check_system_requirements():
         logger.error("❌ System requirements check failed!")
         return
 
+    fingerprint = dependency_fingerprint(lockfile) if cache_path else None
+    if fingerprint and _read_cached_fingerprint(cache_path) == fingerprint:
+        logger.info(
+            "👾✅ Dependency versions unchanged since last check (lockfile %s)",
+            fingerprint[:12],
+        )
+        return
+
     # Check dependency versions
     all_good = True
     critical_failures = []
@@ -235,6 +286,8 @@ def validate_dependency_versions() -> None:
         logger.error("Run: poetry lock && poetry install to fix")
     else:
         logger.info("👾✅ All dependency versions are compatible")
+        if fingerprint:
+            _write_cached_fingerprint(cache_path, fingerprint)
 
 
 def log_version_info() -> None:
@@ -0,0 +1,61 @@
+"""Tests for length-sorted adaptive embedding batches."""
+
+from unittest.mock import patch
+
+from llama_index.core.embeddings import MockEmbedding
+
+from internal_assistant.components.embedding.adaptive_batching import (
+    AdaptiveBatchEmbedding,
+)
+
+
+class RecordingEmbedding(MockEmbedding):
+    batches: list[list[str]] = []
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text))] * self.embed_dim for text in texts]
+
+
+def test_batches_are_length_sorted_and_results_keep_input_order() -> None:
+    inner = RecordingEmbedding(embed_dim=2, batches=[])
+    model = AdaptiveBatchEmbedding(inner, batch_size=2)
+    texts = ["a", "aaaa", "aa", "aaa"]
+
+    with patch(
+        "internal_assistant.components.embedding.adaptive_batching._memory_pressure",
+        return_value=False,
+    ):
+        embeddings = model.get_text_embedding_batch(texts)
+
+    assert [e[0] for e in embeddings] == [1.0, 4.0, 2.0, 3.0]
+    assert inner.batches[0] == ["aaaa", "aaa"]
+    assert model.throughput.texts == 4
+
+
+def test_batch_size_halves_under_memory_pressure() -> None:
+    model = AdaptiveBatchEmbedding(
+        RecordingEmbedding(embed_dim=2, batches=[]), batch_size=8
+    )
+    with patch(
+        "internal_assistant.components.embedding.adaptive_batching._memory_pressure",
+        return_value=True,
+    ):
+        model.get_text_embedding_batch(["text"] * 8)
+
+    assert model.batch_size == 4
+
+
+def test_inner_model_batches_at_the_tuned_size() -> None:
+    inner = RecordingEmbedding(embed_dim=2, batches=[], embed_batch_size=2)
+    model = AdaptiveBatchEmbedding(inner, batch_size=2)
+    model._batch_size = 6
+
+    with patch(
+        "internal_assistant.components.embedding.adaptive_batching._memory_pressure",
+        return_value=False,
+    ):
+        model.get_text_embedding_batch(["text"] * 6)
+
+    assert inner.batches[0] == ["text"] * 6
+    assert inner.embed_batch_size == 6
@@ -0,0 +1,85 @@
+"""Tests for saving and bulk deleting documents in the ingest component."""
+
+from unittest.mock import patch
+
+import pytest
+from llama_index.core import MockEmbedding
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import Document
+from llama_index.core.storage import StorageContext
+
+from internal_assistant.components.ingest import ingest_component
+from internal_assistant.components.ingest.ingest_component import (
+    SimpleIngestComponent,
+)
+
+
+@pytest.fixture
+def component(tmp_path, monkeypatch) -> SimpleIngestComponent:
+    monkeypatch.setattr(ingest_component, "local_data_path", tmp_path)
+    embed_model = MockEmbedding(embed_dim=8)
+    component = SimpleIngestComponent(
+        StorageContext.from_defaults(),
+        embed_model=embed_model,
+        transformations=[
+            SentenceSplitter(chunk_size=64, chunk_overlap=0, tokenizer=str.split),
+            embed_model,
+        ],
+    )
+    component.show_progress = False
+    component._save_docs(
+        [
+            Document(
+                doc_id=f"doc-{i}",
+                text=" ".join(f"sentence {i} {j}." for j in range(40)),
+                metadata={"file_name": f"file-{i % 2}.txt"},
+            )
+            for i in range(4)
+        ]
+    )
+    return component
+
+
+def test_delete_many_removes_docs_nodes_and_vectors(component):
+    docstore = component._index.docstore
+    doomed = ["doc-0", "doc-2"]
+    node_ids = [
+        node_id
+        for doc_id in doomed
+        for node_id in docstore.get_ref_doc_info(doc_id).node_ids
+    ]
+
+    with patch.object(component, "_save_index", wraps=component._save_index) as save:
+        deleted = component.delete_many([*doomed, "missing"])
+
+    assert deleted == doomed
+    assert save.call_count == 1
+    assert set(docstore.get_all_ref_doc_info()) == {"doc-1", "doc-3"}
+    assert not any(docstore.document_exists(node_id) for node_id in node_ids)
+    assert not set(node_ids) & set(component._index.index_struct.nodes_dict)
+    assert not set(node_ids) & set(component._index.vector_store.data.embedding_dict)
+    assert component.catalog.doc_ids_for_file("file-0.txt") == set()
+
+
+def test_delete_many_without_matches_does_not_persist(component):
+    with patch.object(component, "_save_index") as save:
+        assert component.delete_many(["missing"]) == []
+    save.assert_not_called()
+
+
+def test_save_docs_groups_nodes_per_document(component):
+    docstore = component._index.docstore
+    ref_doc_info = docstore.get_all_ref_doc_info()
+
+    assert set(ref_doc_info) == {f"doc-{i}" for i in range(4)}
+    for doc_id, info in ref_doc_info.items():
+        assert info.node_ids
+        assert all(docstore.get_node(n).ref_doc_id == doc_id for n in info.node_ids)
+    assert sum(len(info.node_ids) for info in ref_doc_info.values()) == len(
+        component._index.index_struct.nodes_dict
+    )
+
+    stats = component.lock_stats["save_docs"]
+    assert stats.count == 1
+    assert 0 < stats.last_seconds == stats.max_seconds == stats.average_seconds
+    assert component.lock_stats_summary()["save_docs"]["count"] == 1
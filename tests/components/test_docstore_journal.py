@@ -0,0 +1,95 @@
+"""Tests for the append-only docstore journal."""
+
+import json
+from pathlib import Path
+
+from llama_index.core.schema import TextNode
+from llama_index.core.storage.docstore import SimpleDocumentStore
+
+from internal_assistant.components.node_store.docstore_journal import (
+    DOCSTORE_JOURNAL_FILE,
+    DOCSTORE_SNAPSHOT_FILE,
+    JournaledKVStore,
+    attach_journal,
+)
+
+
+def _journaled_docstore(persist_dir: Path) -> SimpleDocumentStore:
+    snapshot = persist_dir / DOCSTORE_SNAPSHOT_FILE
+    docstore = (
+        SimpleDocumentStore.from_persist_path(str(snapshot))
+        if snapshot.exists()
+        else SimpleDocumentStore()
+    )
+    attach_journal(docstore, persist_dir)
+    return docstore
+
+
+def test_commit_appends_only_new_mutations(tmp_path: Path) -> None:
+    docstore = _journaled_docstore(tmp_path)
+    kvstore = docstore._kvstore
+    assert isinstance(kvstore, JournaledKVStore)
+
+    docstore.add_documents([TextNode(id_="n1", text="first")])
+    first = kvstore.commit()
+    docstore.add_documents([TextNode(id_="n2", text="second")])
+    second = kvstore.commit()
+
+    journal = tmp_path / DOCSTORE_JOURNAL_FILE
+    assert journal.stat().st_size == first + second
+    assert not (tmp_path / DOCSTORE_SNAPSHOT_FILE).exists()
+    assert kvstore.commit() == 0
+
+
+def test_replay_restores_state_and_ignores_torn_tail(tmp_path: Path) -> None:
+    docstore = _journaled_docstore(tmp_path)
+    docstore.add_documents([TextNode(id_="n1", text="kept")])
+    docstore.add_documents([TextNode(id_="n2", text="deleted")])
+    docstore.delete_document("n2")
+    docstore._kvstore.commit()
+
+    # Simulate a crash in the middle of an append
+    with open(tmp_path / DOCSTORE_JOURNAL_FILE, "a") as f:
+        f.write('{"op": "put", "c": "docstore/da')
+
+    restored = _journaled_docstore(tmp_path)
+    assert restored.get_node("n1").get_content() == "kept"
+    assert restored.get_document("n2", raise_error=False) is None
+
+
+def test_persist_compacts_journal_and_replay_is_idempotent(tmp_path: Path) -> None:
+    docstore = _journaled_docstore(tmp_path)
+    docstore.add_documents([TextNode(id_="n1", text="one")])
+    docstore._kvstore.commit()
+    journal_copy = (tmp_path / DOCSTORE_JOURNAL_FILE).read_text()
+
+    docstore.persist(persist_path=str(tmp_path / DOCSTORE_SNAPSHOT_FILE))
+    assert not (tmp_path / DOCSTORE_JOURNAL_FILE).exists()
+    snapshot = json.loads((tmp_path / DOCSTORE_SNAPSHOT_FILE).read_text())
+    assert "n1" in snapshot["docstore/data"]
+
+    # A crash before truncation leaves an already-compacted journal behind
+    (tmp_path / DOCSTORE_JOURNAL_FILE).write_text(journal_copy)
+    restored = _journaled_docstore(tmp_path)
+    assert list(restored.docs) == ["n1"]
+
+
+def test_needs_compaction_relative_to_snapshot(tmp_path: Path) -> None:
+    kvstore = JournaledKVStore(
+        journal_path=tmp_path / DOCSTORE_JOURNAL_FILE,
+        snapshot_path=tmp_path / DOCSTORE_SNAPSHOT_FILE,
+        compaction_ratio=0.5,
+    )
+    kvstore.put("k", {"v": "x" * 1024})
+    kvstore.commit()
+    assert not kvstore.needs_compaction()
+
+
+def test_put_all_journals_every_pair(tmp_path: Path) -> None:
+    docstore = _journaled_docstore(tmp_path)
+    kvstore = docstore._kvstore
+    kvstore.put_all([(f"k{i}", {"i": i}) for i in range(3)], collection="refs")
+    kvstore.commit()
+
+    restored = _journaled_docstore(tmp_path)._kvstore
+    assert restored.get_all(collection="refs") == {f"k{i}": {"i": i} for i in range(3)}
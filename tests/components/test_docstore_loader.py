@@ -0,0 +1,66 @@
+"""Tests for the single-pass docstore loader."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from llama_index.core.schema import TextNode
+from llama_index.core.storage.docstore import SimpleDocumentStore
+
+from internal_assistant.components.node_store.docstore_journal import (
+    DOCSTORE_SNAPSHOT_FILE,
+    attach_journal,
+)
+from internal_assistant.components.node_store.docstore_loader import (
+    METADATA_COLLECTION,
+    NODE_COLLECTION,
+    iter_node_metadata,
+    load_simple_docstore,
+)
+
+
+def _write_docstore(persist_dir: Path, *nodes: TextNode) -> None:
+    docstore = SimpleDocumentStore()
+    docstore.add_documents(list(nodes))
+    docstore.persist(persist_path=str(persist_dir / DOCSTORE_SNAPSHOT_FILE))
+
+
+def test_load_reports_stats_including_journal(tmp_path: Path) -> None:
+    _write_docstore(tmp_path, TextNode(id_="n1", text="a"))
+    docstore = SimpleDocumentStore.from_persist_path(
+        str(tmp_path / DOCSTORE_SNAPSHOT_FILE)
+    )
+    attach_journal(docstore, tmp_path)
+    docstore.add_documents([TextNode(id_="n2", text="b")])
+    docstore._kvstore.commit()
+
+    loaded, stats = load_simple_docstore(tmp_path)
+
+    assert stats.file_size > 0
+    assert stats.journal_entries > 0
+    assert stats.collection_sizes[NODE_COLLECTION] == 2
+    assert stats.collection_sizes[METADATA_COLLECTION] == 2
+    assert not stats.is_empty
+    assert loaded.get_document("n2").get_content() == "b"
+
+
+def test_load_without_any_files_raises(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        load_simple_docstore(tmp_path)
+
+
+def test_iter_node_metadata_does_not_decode_nodes(tmp_path: Path) -> None:
+    _write_docstore(
+        tmp_path,
+        TextNode(id_="n1", text="a", metadata={"file_name": "a.pdf"}),
+        TextNode(id_="n2", text="b", metadata={"file_name": "b.pdf"}),
+    )
+    docstore, _ = load_simple_docstore(tmp_path, journal_enabled=False)
+
+    with patch(
+        "llama_index.core.storage.docstore.keyval_docstore.json_to_doc"
+    ) as json_to_doc:
+        file_names = sorted(m["file_name"] for m in iter_node_metadata(docstore))
+
+    assert file_names == ["a.pdf", "b.pdf"]
+    json_to_doc.assert_not_called()
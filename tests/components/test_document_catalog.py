@@ -0,0 +1,127 @@
+"""Tests for the in-memory document catalog and duplicate detection inputs."""
+
+import hashlib
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from llama_index.core.storage.docstore import SimpleDocumentStore
+from llama_index.core.storage.docstore.types import RefDocInfo
+
+from internal_assistant.components.ingest.document_catalog import (
+    DocumentCatalog,
+    assess_chunk_quality,
+)
+from internal_assistant.components.ingest.ingest_helper import (
+    HASH_BUFFER_SIZE,
+    IngestionHelper,
+)
+
+
+def _docstore_with(ref_docs: dict[str, RefDocInfo]) -> SimpleDocumentStore:
+    docstore = SimpleDocumentStore()
+    for doc_id, ref_info in ref_docs.items():
+        docstore._kvstore.put(
+            doc_id, ref_info.to_dict(), collection=docstore._ref_doc_collection
+        )
+    return docstore
+
+
+def test_rebuild_indexes_documents_and_precomputes_quality() -> None:
+    docstore = _docstore_with(
+        {
+            "doc-1": RefDocInfo(
+                node_ids=["n1", "n2", "n3"],
+                metadata={"file_name": "a.pdf", "content_hash": "h1"},
+            ),
+            "doc-2": RefDocInfo(
+                node_ids=["n4"], metadata={"file_name": "a.pdf", "content_hash": "h1"}
+            ),
+        }
+    )
+    catalog = DocumentCatalog()
+    catalog.rebuild(docstore)
+
+    assert len(catalog) == 2
+    assert catalog.doc_ids_for_file("a.pdf") == {"doc-1", "doc-2"}
+    assert catalog.doc_ids_for_hash("h1") == {"doc-1", "doc-2"}
+    entry = catalog.get("doc-1")
+    assert entry is not None
+    assert entry.chunk_count == 3
+    assert entry.quality_score == 70
+    assert catalog.get("doc-2").processing_status == "low_quality"
+
+
+def test_add_and_remove_keep_indexes_and_version_in_sync() -> None:
+    catalog = DocumentCatalog()
+    start = catalog.version
+
+    catalog.add("doc-1", {"file_name": "a.txt", "content_hash": "h1"}, 12)
+    assert catalog.version == start + 1
+    assert catalog.file_names() == ["a.txt"]
+
+    # Re-adding a doc with a new file name moves it between index buckets
+    catalog.add("doc-1", {"file_name": "b.txt", "content_hash": "h2"}, 12)
+    assert catalog.doc_ids_for_file("a.txt") == set()
+    assert catalog.doc_ids_for_hash("h2") == {"doc-1"}
+
+    assert catalog.remove("doc-1")
+    assert not catalog.remove("doc-1")
+    assert len(catalog) == 0
+    assert catalog.file_names() == []
+
+
+def test_is_stale_only_after_external_write(tmp_path: Path) -> None:
+    docstore_path = tmp_path / "docstore.json"
+    docstore_path.write_text("{}")
+    catalog = DocumentCatalog(watched_paths=(docstore_path,))
+    catalog.mark_persisted()
+    assert not catalog.is_stale()
+
+    stat = docstore_path.stat()
+    os.utime(docstore_path, (stat.st_atime, stat.st_mtime + 10))
+    assert catalog.is_stale()
+
+    catalog.mark_persisted()
+    assert not catalog.is_stale()
+
+
+def test_assess_chunk_quality_thresholds() -> None:
+    assert assess_chunk_quality(0)["processing_status"] == "failed"
+    assert assess_chunk_quality(2)["quality_score"] == 40
+    assert assess_chunk_quality(10)["quality_score"] == 90
+    assert assess_chunk_quality(11)["quality_score"] == 100
+
+
+def test_entries_for_file_match_recorded_size_and_mtime(tmp_path: Path) -> None:
+    path = tmp_path / "report.pdf"
+    path.write_bytes(b"quarterly report")
+    size, mtime = IngestionHelper.get_file_stat(path)
+
+    catalog = DocumentCatalog()
+    metadata = {"file_name": "report.pdf", "file_size": size, "file_mtime": mtime}
+    catalog.add("doc-1", metadata, 3)
+    catalog.add("doc-2", {"file_name": "report.pdf"}, 3)
+
+    entries = {e.doc_id: e for e in catalog.entries_for_file("report.pdf")}
+    assert set(entries) == {"doc-1", "doc-2"}
+    assert entries["doc-1"].matches_file_stat(size, mtime)
+    assert not entries["doc-2"].matches_file_stat(size, mtime)
+
+    os.utime(path, (mtime, mtime + 10))
+    assert not entries["doc-1"].matches_file_stat(*IngestionHelper.get_file_stat(path))
+
+
+def test_file_hash_is_cached_until_the_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "policy.txt"
+    path.write_bytes(b"a" * (HASH_BUFFER_SIZE + 1))
+    expected = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    assert IngestionHelper._get_file_hash(path) == expected
+    with patch("builtins.open", side_effect=AssertionError("file was read")):
+        assert IngestionHelper._get_file_hash(path) == expected
+
+    path.write_bytes(b"changed")
+    assert (
+        IngestionHelper._get_file_hash(path) == hashlib.sha256(b"changed").hexdigest()
+    )
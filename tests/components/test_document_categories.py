@@ -0,0 +1,97 @@
+"""Tests for file-name categorization and the catalog's facet index."""
+
+from unittest.mock import patch
+
+from internal_assistant.components.ingest.document_catalog import DocumentCatalog
+from internal_assistant.components.ingest.document_categories import (
+    CATEGORY,
+    DOMAIN,
+    FILE_TYPE,
+    FOLDER,
+    DocumentClassifier,
+    file_type_for,
+)
+
+
+def test_classify_uses_first_matching_category_per_taxonomy() -> None:
+    facets = DocumentClassifier().classify("Incident_Response_Policy.DOCX")
+
+    assert facets.file_type == "word"
+    # "policy" is declared before the incident response terms
+    assert facets.category(FOLDER) == "📋 Policy & Governance"
+    assert facets.category(CATEGORY) == "📋 Policy Documents"
+    assert facets.category(DOMAIN) == "Policy & Governance"
+    assert not facets.defaulted
+
+
+def test_unmatched_names_fall_back_to_taxonomy_defaults() -> None:
+    facets = DocumentClassifier().classify("notes.txt")
+
+    assert facets.category(FOLDER) == "📊 Research & Analysis"
+    assert facets.category(CATEGORY) is None
+    assert facets.category(DOMAIN) == "Research & Analysis"
+    assert facets.defaulted == {FOLDER, CATEGORY, DOMAIN}
+    assert (CATEGORY, None) not in facets.keys()
+
+
+def test_file_type_for_extensions() -> None:
+    assert file_type_for("scan.PDF") == "pdf"
+    assert file_type_for("ledger.csv") == "excel"
+    assert file_type_for("README") == "other"
+
+
+def test_catalog_facet_index_follows_adds_and_removes() -> None:
+    catalog = DocumentCatalog()
+    catalog.add("doc-1", {"file_name": "malware_report.pdf"}, 12)
+    catalog.add("doc-2", {"file_name": "malware_report.pdf"}, 12)
+    catalog.add("doc-3", {"file_name": "network_diagram.xlsx"}, 12)
+
+    assert catalog.files_with_facet(FOLDER, "🕵️ Threat Intelligence") == [
+        "malware_report.pdf"
+    ]
+    assert catalog.facet_counts(FILE_TYPE) == {"pdf": 1, "excel": 1}
+
+    # The file stays indexed until its last document is removed
+    catalog.remove("doc-1")
+    assert catalog.facet_counts(FILE_TYPE) == {"pdf": 1, "excel": 1}
+    catalog.remove("doc-2")
+    assert catalog.facet_counts(FILE_TYPE) == {"excel": 1}
+    assert catalog.files_with_facet(FOLDER, "🕵️ Threat Intelligence") == []
+    assert catalog.facet_counts(FOLDER) == {"🔧 Technical & Infrastructure": 1}
+
+
+def test_catalog_moves_renamed_documents_between_facets() -> None:
+    catalog = DocumentCatalog()
+    catalog.add("doc-1", {"file_name": "a.pdf"}, 12)
+    catalog.add("doc-1", {"file_name": "b.docx"}, 12)
+
+    assert catalog.facet_counts(FILE_TYPE) == {"word": 1}
+
+
+def test_facet_version_changes_only_for_touched_facets() -> None:
+    catalog = DocumentCatalog()
+    catalog.add("doc-1", {"file_name": "malware_report.pdf"}, 12)
+    catalog.add("doc-2", {"file_name": "network_diagram.xlsx"}, 12)
+    threats = catalog.facet_version(FOLDER, "🕵️ Threat Intelligence")
+    technical = catalog.facet_version(FOLDER, "🔧 Technical & Infrastructure")
+
+    catalog.add("doc-3", {"file_name": "malware_report.pdf"}, 3)
+    assert catalog.facet_version(FOLDER, "🕵️ Threat Intelligence") > threats
+    assert catalog.facet_version(FOLDER, "🔧 Technical & Infrastructure") == technical
+    assert catalog.facet_version(FOLDER, "📋 Policy & Governance") == 0
+
+
+def test_catalog_classifies_each_file_once() -> None:
+    catalog = DocumentCatalog()
+    with patch(
+        "internal_assistant.components.ingest.document_catalog.classify_file",
+        wraps=DocumentClassifier().classify,
+    ) as classify:
+        catalog.add("doc-1", {"file_name": "malware_report.pdf"}, 12)
+        catalog.add("doc-2", {"file_name": "malware_report.pdf"}, 12)
+        catalog.add("doc-1", {"file_name": "malware_report.pdf"}, 3)
+        catalog.remove("doc-1")
+        catalog.remove("doc-2")
+
+    assert classify.call_count == 1
+    assert catalog.facet_counts(FILE_TYPE) == {}
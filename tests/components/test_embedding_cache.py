@@ -0,0 +1,65 @@
+"""Tests for the embedding cache."""
+
+from pathlib import Path
+
+from llama_index.core.embeddings import MockEmbedding
+
+from internal_assistant.components.embedding.embedding_cache import (
+    CachedEmbedding,
+    EmbeddingCache,
+)
+
+
+class CountingEmbedding(MockEmbedding):
+    calls: int = 0
+    texts_embedded: int = 0
+
+    def _get_query_embedding(self, query: str) -> list[float]:
+        self.calls += 1
+        return super()._get_query_embedding(query)
+
+    def _get_text_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        self.texts_embedded += len(texts)
+        return [self._get_vector() for _ in texts]
+
+
+def test_queries_hit_after_normalization() -> None:
+    inner = CountingEmbedding(embed_dim=4)
+    model = CachedEmbedding(inner, EmbeddingCache(max_entries=10))
+
+    first = model.get_query_embedding("Reg E  timeline")
+    second = model.get_query_embedding(" Reg E timeline\n")
+
+    assert first == second
+    assert inner.calls == 1
+    assert model.cache.stats()["hits"] == 1
+
+
+def test_batches_only_embed_unseen_texts() -> None:
+    inner = CountingEmbedding(embed_dim=4)
+    model = CachedEmbedding(inner, EmbeddingCache(max_entries=10))
+
+    model.get_text_embedding_batch(["a", "b"])
+    embeddings = model.get_text_embedding_batch(["a", "b", "c"])
+
+    assert len(embeddings) == 3
+    assert inner.texts_embedded == 3
+    # Query and text embeddings are cached separately
+    model.get_query_embedding("a")
+    assert inner.calls == 3
+
+
+def test_lru_bound_and_disk_tier(tmp_path: Path) -> None:
+    db_path = tmp_path / "embedding_cache.sqlite3"
+    cache = EmbeddingCache(max_entries=1, db_path=db_path)
+    model = CachedEmbedding(CountingEmbedding(embed_dim=4), cache)
+    model.get_text_embedding_batch(["a", "b"])
+    assert cache.stats()["memory_entries"] == 1
+    cache.close()
+
+    restarted_inner = CountingEmbedding(embed_dim=4)
+    restarted = CachedEmbedding(restarted_inner, EmbeddingCache(db_path=db_path))
+    assert restarted.get_text_embedding("a") == [0.5] * 4
+    assert restarted_inner.calls == 0
+    assert restarted.cache.stats()["disk_hits"] == 1
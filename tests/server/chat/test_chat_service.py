@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+
+from internal_assistant.open_ai.extensions.context_filter import ContextFilter
+from internal_assistant.server.chat.chat_service import ChatService
+
+
+def _bare_chat_service(rerank_enabled: bool = True) -> ChatService:
+    # Skip __init__ so no LLM, embedding or vector store is built
+    service = ChatService.__new__(ChatService)
+    service.settings = MagicMock()
+    service.settings.rag.similarity_value = None
+    service.settings.rag.rerank.enabled = rerank_enabled
+    service.vector_store_component = MagicMock()
+    service.index = MagicMock()
+    service._retriever_cache = OrderedDict()
+    service._node_postprocessors = None
+    service._engine_components_lock = threading.Lock()
+    return service
+
+
+def test_retrievers_are_shared_per_filter_and_top_k() -> None:
+    service = _bare_chat_service()
+    get_retriever = service.vector_store_component.get_retriever
+    get_retriever.side_effect = lambda **_: MagicMock()
+
+    first = service._get_retriever(ContextFilter(docs_ids=["b", "a"]), 4)
+    same = service._get_retriever(ContextFilter(docs_ids=["a", "b"]), 4)
+    other_top_k = service._get_retriever(ContextFilter(docs_ids=["a", "b"]), 8)
+    unfiltered = service._get_retriever(None, 4)
+
+    assert first is same
+    assert other_top_k is not first
+    assert unfiltered is not first
+    assert get_retriever.call_count == 3
+
+
+def test_rerank_model_is_loaded_once() -> None:
+    service = _bare_chat_service(rerank_enabled=True)
+    with patch(
+        "internal_assistant.server.chat.chat_service.SentenceTransformerRerank"
+    ) as rerank_cls:
+        first = service._get_node_postprocessors()
+        second = service._get_node_postprocessors()
+
+    rerank_cls.assert_called_once()
+    assert first == second
+    assert first is not second
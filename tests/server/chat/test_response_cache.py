@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock
+
+from internal_assistant.open_ai.extensions.context_filter import ContextFilter
+from internal_assistant.server.chat.response_cache import (
+    CacheScope,
+    ResponseCache,
+    replay_as_stream,
+)
+from internal_assistant.settings.settings import ResponseCacheSettings
+
+_EMBEDDINGS = {
+    "what is the reg e error resolution timeline": [1.0, 0.0, 0.0],
+    "What is the Reg E error-resolution timeline?": [0.99, 0.05, 0.0],
+    "how do I file a SAR": [0.0, 1.0, 0.0],
+}
+
+
+def _cache(**overrides: object) -> ResponseCache:
+    settings = MagicMock()
+    settings.rag.response_cache = ResponseCacheSettings(enabled=True, **overrides)
+    embedding_component = MagicMock()
+    embedding_component.embedding_model.get_query_embedding.side_effect = (
+        lambda query: _EMBEDDINGS[query]
+    )
+    return ResponseCache(settings, embedding_component)
+
+
+def test_similar_query_in_same_scope_hits() -> None:
+    cache = _cache(similarity_threshold=0.95)
+    scope = CacheScope.build("sys", True, None)
+    cache.store(
+        cache.embed("what is the reg e error resolution timeline"),
+        scope,
+        "60 days",
+        None,
+    )
+
+    paraphrase = cache.embed("What is the Reg E error-resolution timeline?")
+    assert cache.lookup(paraphrase, scope).response == "60 days"
+    assert cache.lookup(paraphrase, CacheScope.build("other", True, None)) is None
+    assert cache.lookup(cache.embed("how do I file a SAR"), scope) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_ttl_and_lru_eviction() -> None:
+    cache = _cache(max_entries=1, ttl_seconds=0)
+    scope = CacheScope.build(None, False, None)
+    first = cache.embed("how do I file a SAR")
+    cache.store(first, scope, "one", None)
+    cache.store(
+        cache.embed("what is the reg e error resolution timeline"), scope, "two", None
+    )
+
+    assert len(cache) == 1
+    # A zero TTL expires entries on the next lookup
+    assert cache.lookup(first, scope) is None
+    assert len(cache) == 0
+
+
+def test_invalidation_respects_document_scope() -> None:
+    cache = _cache()
+    embedding = cache.embed("how do I file a SAR")
+    all_docs = CacheScope.build(None, True, None)
+    only_a = CacheScope.build(None, True, ContextFilter(docs_ids=["a"]))
+    no_context = CacheScope.build(None, False, ContextFilter(docs_ids=["a"]))
+    for scope in (all_docs, only_a, no_context):
+        cache.store(embedding, scope, "answer", None)
+
+    assert cache.invalidate_documents(["b"]) == 1  # the all-documents entry
+    assert cache.invalidate_documents(["a"]) == 1  # the entry scoped to "a"
+    assert cache.lookup(embedding, no_context) is not None
+
+
+def test_replay_reassembles_the_answer() -> None:
+    text = "Reg E  requires\nresolution within 10 business days. "
+    deltas = list(replay_as_stream(text))
+    assert len(deltas) > 1
+    assert "".join(deltas) == text
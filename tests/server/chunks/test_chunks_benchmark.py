@@ -0,0 +1,129 @@
+"""Latency benchmark for /v1/chunks retrieval with sibling expansion.
+
+Runs against in-memory stores and mock models, so it measures the service
+overhead (index reuse, docstore lookups) rather than embedding or vector
+search cost. Run with ``-s`` to see the p50/p95 report.
+"""
+
+import statistics
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from llama_index.core import Settings as LlamaSettings
+from llama_index.core.bridge.pydantic import PrivateAttr
+from llama_index.core.embeddings import MockEmbedding
+from llama_index.core.indices.vector_store.retrievers import VectorIndexRetriever
+from llama_index.core.schema import NodeRelationship, RelatedNodeInfo, TextNode
+from llama_index.core.storage.docstore import SimpleDocumentStore
+from llama_index.core.storage.index_store import SimpleIndexStore
+from llama_index.core.vector_stores import SimpleVectorStore
+from llama_index.core.vector_stores.types import (
+    VectorStoreQuery,
+    VectorStoreQueryResult,
+)
+
+from internal_assistant.server.chunks.chunks_service import ChunksService
+
+_DOCUMENTS = 20
+_CHUNKS_PER_DOCUMENT = 50
+_RUNS = 50
+
+
+class TextVectorStore(SimpleVectorStore):
+    """SimpleVectorStore that returns node text, like Qdrant does."""
+
+    stores_text: bool = True
+    _nodes: dict[str, TextNode] = PrivateAttr(default_factory=dict)
+
+    def add(self, nodes: list[TextNode], **add_kwargs: object) -> list[str]:
+        self._nodes.update((node.node_id, node) for node in nodes)
+        return super().add(nodes, **add_kwargs)
+
+    def query(
+        self, query: VectorStoreQuery, **kwargs: object
+    ) -> VectorStoreQueryResult:
+        result = super().query(query, **kwargs)
+        result.nodes = [self._nodes[node_id] for node_id in result.ids or []]
+        return result
+
+
+def _chained_nodes() -> list[TextNode]:
+    nodes = []
+    for doc in range(_DOCUMENTS):
+        chain = [
+            TextNode(id_=f"d{doc}-n{i}", text=f"document {doc} chunk {i}")
+            for i in range(_CHUNKS_PER_DOCUMENT)
+        ]
+        for i, node in enumerate(chain):
+            node.relationships[NodeRelationship.SOURCE] = RelatedNodeInfo(
+                node_id=f"d{doc}"
+            )
+            if i > 0:
+                node.relationships[NodeRelationship.PREVIOUS] = RelatedNodeInfo(
+                    node_id=chain[i - 1].node_id
+                )
+            if i < len(chain) - 1:
+                node.relationships[NodeRelationship.NEXT] = RelatedNodeInfo(
+                    node_id=chain[i + 1].node_id
+                )
+        nodes.extend(chain)
+    return nodes
+
+
+def _chunks_service() -> ChunksService:
+    embed_model = MockEmbedding(embed_dim=64)
+    nodes = _chained_nodes()
+    for node in nodes:
+        node.embedding = embed_model.get_text_embedding(node.text)
+
+    vector_store = TextVectorStore()
+    vector_store.add(nodes)
+    doc_store = SimpleDocumentStore()
+    doc_store.add_documents(nodes)
+
+    vector_store_component = MagicMock()
+    vector_store_component.vector_store = vector_store
+    vector_store_component.get_retriever.side_effect = (
+        lambda index, context_filter, similarity_top_k: VectorIndexRetriever(
+            index=index, similarity_top_k=similarity_top_k
+        )
+    )
+    node_store_component = MagicMock()
+    node_store_component.doc_store = doc_store
+    node_store_component.index_store = SimpleIndexStore()
+    llm_component = MagicMock()
+    llm_component.llm = None
+    embedding_component = MagicMock()
+    embedding_component.embedding_model = embed_model
+
+    return ChunksService(
+        llm_component=llm_component,
+        vector_store_component=vector_store_component,
+        embedding_component=embedding_component,
+        node_store_component=node_store_component,
+    )
+
+
+def test_retrieve_relevant_latency_limit_10_prev_next_2(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # The default node parser downloads a tokenizer; nothing is parsed here
+    monkeypatch.setattr(LlamaSettings, "_transformations", [])
+    service = _chunks_service()
+
+    latencies = []
+    for run in range(_RUNS):
+        start = time.perf_counter()
+        chunks = service.retrieve_relevant(f"chunk {run}", limit=10, prev_next_chunks=2)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    assert len(chunks) == 10
+    for chunk in chunks:
+        chunk_index = int(chunk.text.rsplit(" ", 1)[1])
+        assert len(chunk.previous_texts) == min(2, chunk_index)
+        assert len(chunk.next_texts) == min(2, _CHUNKS_PER_DOCUMENT - 1 - chunk_index)
+
+    p50 = statistics.median(latencies)
+    p95 = statistics.quantiles(latencies, n=20)[-1]
+    print(f"\n/v1/chunks limit=10 prev_next_chunks=2: p50={p50:.2f}ms p95={p95:.2f}ms")
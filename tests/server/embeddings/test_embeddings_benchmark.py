@@ -0,0 +1,67 @@
+"""Model-cost benchmark for /v1/embeddings batching.
+
+The fake model records the size of every call instead of sleeping. The cost
+of a run is then modelled as a fixed overhead per call plus a small cost per
+text, which is the shape of a local transformer forward pass, so the
+comparison does not depend on how busy the machine running the tests is.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from internal_assistant.server.embeddings.embeddings_service import EmbeddingBatcher
+
+_CALL_OVERHEAD_SECONDS = 0.002
+_PER_TEXT_SECONDS = 0.00005
+_REQUESTS = 64
+
+
+class _RecordingModel:
+    def __init__(self) -> None:
+        self.call_sizes: list[int] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, texts: list[str]) -> list[list[float]]:
+        with self._lock:
+            self.call_sizes.append(len(texts))
+        return [[float(len(text))] * 4 for text in texts]
+
+    @property
+    def modelled_seconds(self) -> float:
+        return sum(
+            _CALL_OVERHEAD_SECONDS + _PER_TEXT_SECONDS * size
+            for size in self.call_sizes
+        )
+
+
+def _run(batcher: EmbeddingBatcher) -> None:
+    alerts = [
+        [f"SIEM alert {r}-{t}: failed login" for t in range(r % 3 + 1)]
+        for r in range(_REQUESTS)
+    ]
+    # One worker per request, so every request is in flight at once
+    with ThreadPoolExecutor(max_workers=_REQUESTS) as pool:
+        results = list(pool.map(batcher.embed, alerts))
+    for texts, rows in zip(alerts, results, strict=True):
+        assert [row[0] for row in rows] == [float(len(text)) for text in texts]
+
+
+def test_coalescing_cuts_model_calls_and_cost() -> None:
+    uncoalesced_model = _RecordingModel()
+    uncoalesced = EmbeddingBatcher(uncoalesced_model, batch_size=256, window_seconds=0)
+    _run(uncoalesced)
+
+    coalesced_model = _RecordingModel()
+    total_texts = sum(r % 3 + 1 for r in range(_REQUESTS))
+    # The batch only fills once every request is queued, and the window is
+    # long enough that it is never what triggers the flush
+    coalesced = EmbeddingBatcher(
+        coalesced_model, batch_size=total_texts, window_seconds=30
+    )
+    _run(coalesced)
+
+    # Counted by the model under its lock; the uncoalesced calls run in parallel
+    assert len(uncoalesced_model.call_sizes) == _REQUESTS
+    assert coalesced.model_calls == 1
+    assert coalesced_model.call_sizes == [total_texts]
+    assert coalesced_model.modelled_seconds < uncoalesced_model.modelled_seconds
@@ -0,0 +1,44 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+from internal_assistant.server.embeddings.embeddings_service import (
+    EmbeddingBatcher,
+    EmbeddingsService,
+)
+
+
+def _fake_embed(texts: list[str]) -> list[list[float]]:
+    return [[float(len(text)), 1.0] for text in texts]
+
+
+def test_duplicate_inputs_keep_their_own_index() -> None:
+    embedding_component = MagicMock()
+    embedding_component.embedding_model.get_text_embedding_batch = _fake_embed
+    settings = MagicMock()
+    settings.embedding.batch_size = 8
+    settings.embedding.coalesce_window_ms = 0
+    service = EmbeddingsService(embedding_component, settings)
+
+    embeddings = service.texts_embeddings(["same", "same", "other"])
+
+    assert [e.index for e in embeddings] == [0, 1, 2]
+    assert embeddings[2].embedding == [5.0, 1.0]
+
+
+def test_concurrent_requests_share_model_batches() -> None:
+    batcher = EmbeddingBatcher(_fake_embed, batch_size=64, window_seconds=0.05)
+    requests = [[f"text-{i}" * (i + 1)] * 2 for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(batcher.embed, requests))
+
+    for texts, rows in zip(requests, results, strict=True):
+        assert rows.tolist() == _fake_embed(texts)
+    assert batcher.model_calls < len(requests)
+
+
+def test_batches_are_capped_at_batch_size() -> None:
+    batcher = EmbeddingBatcher(_fake_embed, batch_size=4, window_seconds=0)
+    rows = batcher.embed([str(i) for i in range(10)])
+    assert rows.shape == (10, 2)
+    assert batcher.model_calls == 3
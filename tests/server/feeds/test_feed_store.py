@@ -0,0 +1,101 @@
+"""Tests for the persistent feed item store."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from internal_assistant.server.feeds.feed_store import FeedStore
+from internal_assistant.server.feeds.feeds_service import FeedItem, RSSFeedService
+
+
+def _item(source: str, n: int, days_ago: int = 0) -> FeedItem:
+    return FeedItem(
+        title=f"{source} {n}",
+        link=f"https://example.com/{source}/{n}",
+        summary=f"Summary {n}",
+        published=datetime.now(UTC) - timedelta(days=days_ago, minutes=n),
+        source=source,
+        guid=f"{source}-{n}",
+    )
+
+
+async def _refresh(service: RSSFeedService, items: list[FeedItem]) -> None:
+    async def fetch(url: str, source: str) -> list[FeedItem]:
+        state = service.scheduler.state(source)
+        state.etag = f'"{source}"'
+        state.record_success(datetime.now(UTC), [])
+        return [item for item in items if item.source == source]
+
+    with patch.object(service, "fetch_feed", AsyncMock(side_effect=fetch)):
+        assert await service.refresh_feeds()
+
+
+class TestFeedStore:
+    @pytest.mark.asyncio
+    async def test_warm_restart_restores_items_and_state(self, tmp_path):
+        db_path = tmp_path / "feeds.sqlite3"
+        service = RSSFeedService(store=FeedStore(db_path))
+        await _refresh(service, [_item("US-CERT", 1), _item("SANS ISC", 2)])
+        service.store.close()
+
+        restarted = RSSFeedService(store=FeedStore(db_path))
+
+        assert {item.guid for item in restarted.feeds_cache} == {
+            "US-CERT-1",
+            "SANS ISC-2",
+        }
+        state = restarted.scheduler.state("US-CERT")
+        assert state.etag == '"US-CERT"'
+        assert state.has_seen("US-CERT-1")
+        assert state.next_due is not None
+
+    @pytest.mark.asyncio
+    async def test_store_keeps_history_beyond_memory_window(self):
+        service = RSSFeedService(max_items=2, store=FeedStore())
+        await _refresh(service, [_item("US-CERT", n) for n in range(5)])
+
+        assert len(service.feeds_cache) == 2
+        assert service.count_feeds() == 5
+        assert service.get_cache_info()["stored_items"] == 5
+
+    @pytest.mark.asyncio
+    async def test_filtered_pages(self):
+        service = RSSFeedService(store=FeedStore())
+        items = [_item("US-CERT", n) for n in range(4)] + [
+            _item("SANS ISC", 1, days_ago=10),
+            _item("Federal Reserve", 1),
+        ]
+        await _refresh(service, items)
+
+        page = service.get_feeds(source_filter="US-CERT", limit=2, offset=1)
+        assert [feed["guid"] for feed in page] == ["US-CERT-1", "US-CERT-2"]
+        assert service.count_feeds(days_filter=7) == 5
+        assert service.count_feeds(category="Federal Regulators") == 1
+        # SQL ordering matches the in-memory ordering
+        in_memory = RSSFeedService()
+        in_memory.feeds_cache = items
+        assert [feed["guid"] for feed in service.get_feeds(days_filter=7)] == [
+            feed["guid"] for feed in in_memory.get_feeds(days_filter=7)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_source_stats_and_delete(self):
+        service = RSSFeedService(store=FeedStore())
+        await _refresh(service, [_item("US-CERT", 1), _item("US-CERT", 2)])
+
+        health = service.get_feed_health_status()
+        assert health["sources"]["US-CERT"]["feed_count"] == 2
+        assert health["sources"]["US-CERT"]["status"] == "active"
+
+        service.store.delete_source("US-CERT")
+        assert service.count_feeds(source_filter="US-CERT") == 0
+        assert service.store.load_source_states().get("US-CERT") is None
+
+    def test_memory_path_paginates_without_store(self):
+        service = RSSFeedService()
+        service.feeds_cache = [_item("US-CERT", n) for n in range(3)]
+
+        page = service.get_feeds(limit=1, offset=1)
+        assert [feed["guid"] for feed in page] == ["US-CERT-1"]
+        assert service.count_feeds() == 3
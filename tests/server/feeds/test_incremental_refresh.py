@@ -0,0 +1,119 @@
+"""Tests for incremental feed refresh (conditional GETs, dedup, scheduling)."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from aiohttp import ClientResponse
+
+from internal_assistant.server.feeds.feed_scheduler import (
+    MIN_INTERVAL,
+    FeedScheduler,
+    SourceState,
+)
+from internal_assistant.server.feeds.feeds_service import RSSFeedService
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Test Feed</title>{items}</channel></rss>"""
+ITEM = """<item><title>Article {n}</title><link>https://example.com/{n}</link>
+<description>Summary {n}</description><pubDate>{date}</pubDate><guid>a{n}</guid></item>"""
+
+
+def _rss(*numbers: int) -> str:
+    return RSS.format(
+        items="".join(
+            ITEM.format(n=n, date=f"Mon, 0{n} Jan 2024 10:00:00 GMT") for n in numbers
+        )
+    )
+
+
+def _session(status: int, body: str = "", etag: str | None = None) -> Mock:
+    response = Mock(spec=ClientResponse)
+    response.status = status
+    response.text = AsyncMock(return_value=body)
+    response.headers = {"ETag": etag} if etag else {}
+    session = Mock()
+    session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+    session.get.return_value.__aexit__ = AsyncMock(return_value=None)
+    return session
+
+
+class TestIncrementalRefresh:
+    @pytest.mark.asyncio
+    async def test_only_new_entries_are_returned(self):
+        service = RSSFeedService()
+        service._session = _session(200, _rss(1, 2), etag='"v1"')
+        first = await service.fetch_feed("https://example.com/feed", "Test")
+
+        service._session = _session(200, _rss(1, 2, 3), etag='"v2"')
+        second = await service.fetch_feed("https://example.com/feed", "Test")
+
+        assert [item.guid for item in first] == ["a1", "a2"]
+        assert [item.guid for item in second] == ["a3"]
+        _, kwargs = service._session.get.call_args
+        assert kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    @pytest.mark.asyncio
+    async def test_not_modified_backs_off_without_parsing(self):
+        service = RSSFeedService()
+        state = service.scheduler.state("Test")
+        state.interval = timedelta(hours=1)
+        service._session = _session(304)
+
+        items = await service.fetch_feed("https://example.com/feed", "Test")
+
+        assert items == []
+        assert state.interval == timedelta(hours=1.5)
+        assert state.not_modified_count == 1
+        service._session.get.return_value.__aenter__.return_value.text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unforced_refresh_skips_sources_not_due(self):
+        service = RSSFeedService()
+        later = datetime.now(UTC) + timedelta(hours=1)
+        for source in service.FEED_SOURCES:
+            service.scheduler.state(source).next_due = later
+        service._session = _session(200, _rss(1))
+
+        assert await service.refresh_feeds(force=False) is True
+        service._session.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_fetches_exactly_the_given_sources(self):
+        service = RSSFeedService()
+        source = next(iter(service.FEED_SOURCES))
+        service._session = _session(200, _rss(1))
+
+        assert await service.refresh_feeds(sources=[source]) is True
+        service._session.get.assert_called_once()
+        assert service._session.get.call_args.args[0] == service.FEED_SOURCES[source]
+
+
+def test_interval_follows_publish_rate_and_failures_back_off():
+    now = datetime.now(UTC)
+    state = SourceState(interval=timedelta(hours=1))
+    state.record_success(now, [now - timedelta(hours=h) for h in range(4)])
+    assert state.interval == timedelta(minutes=30)
+
+    state.record_success(now, [now - timedelta(minutes=m) for m in range(3)])
+    assert state.interval == MIN_INTERVAL
+
+    state.record_failure(now)
+    state.record_failure(now)
+    assert state.next_due == now + MIN_INTERVAL * 4
+
+
+def test_default_interval_change_applies_to_sources_on_the_old_default():
+    now = datetime.now(UTC)
+    scheduler = FeedScheduler(default_interval=timedelta(hours=1))
+    scheduler.state("fresh").last_checked = now
+    scheduler.state("adapted").interval = timedelta(minutes=20)
+    scheduler.state("unchecked")
+
+    scheduler.default_interval = timedelta(minutes=30)
+
+    assert scheduler.state("fresh").interval == timedelta(minutes=30)
+    assert scheduler.state("fresh").next_due == now + timedelta(minutes=30)
+    assert scheduler.state("unchecked").interval == timedelta(minutes=30)
+    assert scheduler.state("adapted").interval == timedelta(minutes=20)
+    assert scheduler.state("new").interval == timedelta(minutes=30)
@@ -0,0 +1,94 @@
+"""Tests for snapshot-keyed threat analysis caching."""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from internal_assistant.server.feeds.feeds_service import FeedItem, RSSFeedService
+
+
+def _item(n: int, summary: str) -> FeedItem:
+    return FeedItem(
+        title=f"Alert {n}",
+        link=f"https://example.com/{n}",
+        summary=summary,
+        published=datetime(2024, 1, n + 1, tzinfo=UTC),
+        source="US-CERT",
+        guid=f"alert-{n}",
+    )
+
+
+ITEMS = [
+    _item(0, "Active malware campaign against banks uses 203.0.113.7"),
+    _item(1, "Phishing kit hosted on evil-payments.example targets payment apps"),
+    _item(2, "Quarterly report with no threats"),
+]
+
+
+class TestThreatAnalysisCache:
+    def test_analysis_reused_until_snapshot_changes(self):
+        service = RSSFeedService()
+        service.feeds_cache = list(ITEMS)
+
+        with patch.object(
+            service.threat_analyzer,
+            "analyze_feed_item",
+            wraps=service.threat_analyzer.analyze_feed_item,
+        ) as analyze:
+            first = service.analyze_threats()
+            service.get_threat_summary()
+            service.get_security_recommendations()
+            service.get_threats_by_ioc_type("IP")
+            assert analyze.call_count == len(ITEMS)
+
+            # A refresh adding one item analyzes only that item
+            service.feeds_cache = [
+                *ITEMS,
+                _item(3, "New worm spreads via 198.51.100.2"),
+            ]
+            second = service.analyze_threats()
+            assert analyze.call_count == len(ITEMS) + 1
+
+        assert len(second) > len(first)
+
+    def test_results_match_full_analysis(self):
+        service = RSSFeedService()
+        service.feeds_cache = list(ITEMS)
+        expected = service.threat_analyzer.analyze_feed_content(
+            [
+                {
+                    "title": item.title,
+                    "summary": item.summary,
+                    "source": item.source,
+                    "published": item.published,
+                }
+                for item in ITEMS
+            ]
+        )
+
+        assert service.analyze_threats() == expected
+        summary = service.get_threat_summary()
+        assert summary["total_threats"] == len(expected)
+        assert summary["recommendations_count"] == len(
+            service.threat_analyzer.generate_security_recommendations(expected)
+        )
+        assert service.get_threats_by_ioc_type("ip") == [
+            t for t in expected if t.ioc_type == "IP"
+        ]
+        assert service.get_threats_by_level("critical") == [
+            t for t in expected if t.threat_level.value == "critical"
+        ]
+        assert service.get_banking_threats()
+        record = service.get_indicator("203.0.113.7")
+        assert record is not None and record.count == 1
+        assert [r.value for r in service.get_indicators("domain")] == [
+            "evil-payments.example"
+        ]
+
+    def test_changed_content_is_reanalyzed(self):
+        service = RSSFeedService()
+        service.feeds_cache = [ITEMS[2]]
+        assert service.analyze_threats() == []
+
+        edited = _item(2, "Update: ransomware found at 192.0.2.10")
+        service.feeds_cache = [edited]
+        assert service.analyze_threats()
@@ -0,0 +1,111 @@
+"""Tests for the vector-store scan in StorageConsistencyService."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from llama_index.core.storage.docstore.types import RefDocInfo
+from qdrant_client import QdrantClient, models
+
+from internal_assistant.server.ingest.storage_consistency_service import (
+    StorageConsistencyService,
+)
+
+COLLECTION = "consistency_test"
+
+
+class _DocStore:
+    def __init__(self, node_counts: dict[str, int]) -> None:
+        self.node_counts = node_counts
+
+    def get_all_ref_doc_info(self) -> dict[str, RefDocInfo]:
+        return {
+            doc_id: RefDocInfo(node_ids=[f"{doc_id}-{i}" for i in range(count)])
+            for doc_id, count in self.node_counts.items()
+        }
+
+
+def _client(points_per_doc: dict[str, int]) -> QdrantClient:
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        COLLECTION,
+        vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE),
+    )
+    points = [
+        models.PointStruct(
+            id=i,
+            vector=[1.0, 0.0],
+            payload={"ref_doc_id": doc_id, "doc_id": doc_id, "_node_content": "x"},
+        )
+        for i, doc_id in enumerate(
+            doc_id for doc_id, count in points_per_doc.items() for _ in range(count)
+        )
+    ]
+    client.upsert(COLLECTION, points)
+    return client
+
+
+def _service(
+    node_counts: dict[str, int], points_per_doc: dict[str, int]
+) -> StorageConsistencyService:
+    storage_context = SimpleNamespace(
+        vector_store=SimpleNamespace(
+            client=_client(points_per_doc), collection_name=COLLECTION
+        ),
+        docstore=_DocStore(node_counts),
+        index_store=SimpleNamespace(),
+    )
+    return StorageConsistencyService(storage_context, page_size=3)
+
+
+class TestVectorStoreScan:
+    def test_scan_counts_points_per_document_in_pages(self):
+        service = _service({}, {"a": 4, "b": 2, "c": 1})
+
+        scan = service.scan_vector_store()
+
+        assert scan.point_counts == {"a": 4, "b": 2, "c": 1}
+        assert scan.total_points == 7
+        assert scan.pages == 3
+
+    def test_finds_orphans_and_count_mismatches(self):
+        service = _service({"a": 4, "b": 3, "missing": 2}, {"a": 4, "b": 2, "orph": 1})
+
+        report = service.check_consistency()
+
+        issues = {(i.type, i.doc_id) for i in report.inconsistencies}
+        assert issues == {
+            ("orphaned_document", "missing"),
+            ("orphaned_vector", "orph"),
+            ("vector_count_mismatch", "b"),
+        }
+        assert report.total_vector_points == 7
+
+    def test_failed_scan_reports_no_vector_issues(self):
+        service = _service({"a": 1, "b": 2}, {"a": 1, "b": 2})
+
+        with patch.object(
+            service, "scan_vector_store", side_effect=RuntimeError("timeout")
+        ):
+            report = service.check_consistency()
+
+        assert report.vector_scan_failed
+        assert report.inconsistencies == []
+
+    def test_revalidate_drops_resolved_issues(self):
+        service = _service({"a": 1}, {"a": 1, "orph": 2})
+        report = service.check_consistency()
+        assert [i.doc_id for i in report.inconsistencies] == ["orph"]
+
+        # The document finished ingesting after the scan
+        service.docstore.node_counts["orph"] = 2
+
+        assert service.revalidate(report.inconsistencies) == []
+
+    def test_background_check_reports_on_completion(self):
+        service = _service({"a": 1}, {"a": 1})
+        reports = []
+
+        service.check_consistency_in_background(reports.append).join(timeout=10)
+
+        assert len(reports) == 1
+        assert reports[0].inconsistencies == []
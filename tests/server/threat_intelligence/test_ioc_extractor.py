@@ -0,0 +1,82 @@
+"""Tests for streaming IOC extraction and the indicator index."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from internal_assistant.server.threat_intelligence.ioc_extractor import (
+    MAX_IOC_LENGTH,
+    IndicatorIndex,
+    IOCExtractor,
+)
+
+MD5 = "d41d8cd98f00b204e9800998ecf8427e"
+SHA256 = "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+TEXT = (
+    f"C2 at 203.0.113.7 and Evil-Payments.Example.com dropped {MD5}; "
+    f"second stage {SHA256} from cdn.bad.net. "
+)
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestIOCExtractor:
+    def test_classifies_at_match_time(self):
+        matches = IOCExtractor().extract(TEXT)
+
+        assert [(m.value, m.ioc_type) for m in matches] == [
+            ("203.0.113.7", "IP"),
+            ("evil-payments.example.com", "Domain"),
+            (MD5, "Hash"),
+            (SHA256, "Hash"),
+            ("cdn.bad.net", "Domain"),
+        ]
+        assert TEXT[matches[0].offset :].startswith("203.0.113.7")
+
+    @pytest.mark.parametrize("size", [1, 5, 17, 64, MAX_IOC_LENGTH + 3])
+    def test_chunk_boundaries_do_not_change_results(self, size):
+        text = TEXT * 20
+        extractor = IOCExtractor()
+
+        assert list(extractor.iter_matches(_chunks(text, size))) == extractor.extract(
+            text
+        )
+
+    def test_scan_file_streams_in_chunks(self, tmp_path):
+        path = tmp_path / "threatfox.csv"
+        path.write_text(TEXT * 100)
+
+        matches = list(IOCExtractor(chunk_size=100).scan_file(path))
+
+        assert len(matches) == 500
+        assert matches[-1].offset == len(TEXT) * 99 + TEXT.index("cdn.bad.net")
+
+    def test_classify_single_value(self):
+        extractor = IOCExtractor()
+        assert extractor.classify("10.0.0.1") == "IP"
+        assert extractor.classify("example.org") == "Domain"
+        assert extractor.classify(MD5) == "Hash"
+        assert extractor.classify("not an ioc") == "Unknown"
+
+
+class TestIndicatorIndex:
+    def test_deduplicates_and_tracks_sightings(self):
+        index = IndicatorIndex()
+        extractor = IOCExtractor()
+        first = datetime(2024, 1, 1, tzinfo=UTC)
+        last = datetime(2024, 2, 1, tzinfo=UTC)
+
+        index.ingest(extractor.iter_matches([TEXT]), "CISA", last)
+        index.ingest(extractor.iter_matches([TEXT.upper()]), "ThreatFox", first)
+
+        record = index.get("EVIL-PAYMENTS.example.com")
+        assert record is not None
+        assert record.count == 2
+        assert record.sources == {"CISA", "ThreatFox"}
+        assert (record.first_seen, record.last_seen) == (first, last)
+        assert len(index) == 5
+        assert {r.value for r in index.by_type("hash")} == {MD5, SHA256}
+        assert index.type_counts() == {"IP": 1, "Domain": 2, "Hash": 2}
+        assert "203.0.113.7" in index
@@ -0,0 +1,10 @@
+from fastapi.testclient import TestClient
+
+
+def test_only_the_indexed_domain_is_served(test_client: TestClient) -> None:
+    for domain in ("mobile-attack", "ics-attack", "unknown"):
+        response = test_client.get(f"/v1/mitre-attack/tactics?domain={domain}")
+        assert response.status_code == 400
+
+    response = test_client.get("/v1/mitre-attack/search?query=x&domain=ics-attack")
+    assert response.status_code == 400
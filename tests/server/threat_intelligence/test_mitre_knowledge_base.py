@@ -0,0 +1,106 @@
+"""Tests for the indexed MITRE ATT&CK knowledge base."""
+
+from internal_assistant.server.threat_intelligence.mitre_attack_service import (
+    AttackTactic,
+    AttackTechnique,
+    MitreAttackService,
+    ThreatGroup,
+)
+from internal_assistant.server.threat_intelligence.mitre_knowledge_base import (
+    MitreKnowledgeBase,
+)
+
+
+def _technique(technique_id: str, name: str, description: str) -> AttackTechnique:
+    return AttackTechnique(
+        technique_id=technique_id,
+        name=name,
+        description=description,
+        tactic="initial-access",
+        subtechniques=[],
+        platforms=["Windows", "Linux"],
+        data_sources=[],
+        detection=None,
+        mitigation=None,
+        url="",
+    )
+
+
+def _knowledge_base() -> MitreKnowledgeBase:
+    # Skip __init__ so the test never touches local_data or the network
+    service = MitreAttackService.__new__(MitreAttackService)
+    service._techniques_cache = {
+        t.technique_id: t
+        for t in [
+            _technique("T1566.001", "Spearphishing Attachment", "Malicious files"),
+            _technique("T1078.004", "Cloud Accounts", "Abuse of valid accounts"),
+            _technique("T1486", "Data Encrypted for Impact", "Ransomware payloads"),
+        ]
+    }
+    service._tactics_cache = {
+        "TA0001": AttackTactic("TA0001", "Initial Access", "Getting in", [], "")
+    }
+    service._groups_cache = {
+        "G0046": ThreatGroup(
+            "G0046",
+            "FIN7",
+            "Financially motivated",
+            ["FIN7", "Carbon Spider"],
+            [],
+            [],
+            "",
+        )
+    }
+    service._last_refresh = None
+    return MitreKnowledgeBase(service)
+
+
+def test_indexed_lookups() -> None:
+    knowledge_base = _knowledge_base()
+
+    assert knowledge_base.get_technique_by_id("T1486").name.startswith("Data")
+    assert len(knowledge_base.get_techniques_by_tactic("Initial-Access")) == 3
+    assert len(knowledge_base.get_techniques_by_platform("linux")) == 3
+    assert knowledge_base.get_group_by_alias("carbon spider").group_id == "G0046"
+    assert [g.group_id for g in knowledge_base.get_sector_threat_groups()] == ["G0046"]
+    assert {
+        t.technique_id for t in knowledge_base.get_sector_relevant_techniques()
+    } == {
+        "T1566.001",
+        "T1078.004",
+    }
+
+
+def test_search_matches_word_prefixes_and_phrases() -> None:
+    knowledge_base = _knowledge_base()
+
+    assert [t.technique_id for t in knowledge_base.search_techniques("spear")] == [
+        "T1566.001"
+    ]
+    assert [t.technique_id for t in knowledge_base.search_techniques("ransom")] == [
+        "T1486"
+    ]
+    assert [
+        t.technique_id for t in knowledge_base.search_techniques("valid accounts")
+    ] == ["T1078.004"]
+    assert knowledge_base.search_techniques("accounts valid") == []
+    assert [g.group_id for g in knowledge_base.search_groups("carbon")] == ["G0046"]
+    assert knowledge_base.is_stale()
+
+
+def test_search_matches_inside_words_like_a_substring_scan() -> None:
+    knowledge_base = _knowledge_base()
+
+    assert [t.technique_id for t in knowledge_base.search_techniques("ware")] == [
+        "T1486"
+    ]
+    assert [
+        t.technique_id for t in knowledge_base.search_techniques("lid accounts")
+    ] == ["T1078.004"]
+    assert [t.technique_id for t in knowledge_base.search_techniques("T")] == [
+        "T1566.001",
+        "T1078.004",
+        "T1486",
+    ]
+    assert knowledge_base.search_techniques("&") == []
+    assert [t.tactic_id for t in knowledge_base.search_tactics("ing in")] == ["TA0001"]
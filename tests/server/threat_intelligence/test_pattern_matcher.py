@@ -0,0 +1,57 @@
+"""Tests for the single-pass multi-pattern matcher."""
+
+import random
+import re
+
+from internal_assistant.utils.pattern_matcher import (
+    MultiPatternMatcher,
+    split_alternatives,
+)
+from internal_assistant.server.threat_intelligence.threat_analyzer import (
+    ThreatIntelligenceAnalyzer,
+    ThreatType,
+)
+
+_WORDS = (
+    "spearphishing phishing c2 channel exfiltration powershell ps remote desktop "
+    "service usb apt patch cve ransomware bank domain-trust update zero-day "
+    "lorem ipsum"
+).split()
+
+
+def test_split_alternatives_respects_groups_and_classes() -> None:
+    assert split_alternatives(r"a|b(c|d)|[|x]|e\|f") == ["a", "b(c|d)", "[|x]", r"e\|f"]
+
+
+def test_matches_agree_with_separate_regexes() -> None:
+    analyzer = ThreatIntelligenceAnalyzer()
+    patterns = {**analyzer.threat_patterns, **analyzer.mitre_technique_patterns}
+    matcher = MultiPatternMatcher(patterns)
+    random.seed(7)
+
+    for _ in range(50):
+        text = " ".join(random.choice(_WORDS) for _ in range(60))
+        result = matcher.scan(text)
+        for label, label_patterns in matcher.patterns.items():
+            for index, pattern in enumerate(label_patterns):
+                expected = re.search(pattern, text, re.IGNORECASE)
+                match = result.first(label, index)
+                assert (match and match.text) == (expected and expected.group(0))
+                if expected:
+                    assert match.start == expected.start()
+                assert result.count(label, index) == len(
+                    re.findall(pattern, text, re.IGNORECASE)
+                )
+
+
+def test_threat_types_are_reported_per_matching_pattern() -> None:
+    analyzer = ThreatIntelligenceAnalyzer()
+    result = analyzer.match_patterns("New spear-phishing and vishing campaign")
+
+    assert result.matched_patterns(ThreatType.PHISHING) == [
+        r"phishing",
+        r"spear.?phishing",
+        r"vishing",
+    ]
+    assert result.first("T1566").text == "spear-phishing"
+    assert result.counts()[ThreatType.PHISHING] == 3
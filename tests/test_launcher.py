@@ -0,0 +1,36 @@
+from fastapi.testclient import TestClient
+from starlette.routing import Mount
+
+from internal_assistant.launcher import LazyUIApp, create_app
+from tests.fixtures.mock_injector import MockInjector
+
+
+def _paths(test_client: TestClient) -> set[str]:
+    return {getattr(route, "path", "") for route in test_client.app.routes}
+
+
+def test_lazy_startup_includes_routers_on_first_request(
+    injector: MockInjector,
+) -> None:
+    injector.bind_settings({"server": {"lazy_startup": True}})
+    test_client = TestClient(create_app(injector.test_injector))
+    assert "/health" not in _paths(test_client)
+
+    assert test_client.get("/health").status_code == 200
+    assert "/health" in _paths(test_client)
+    assert "/v1/chat/completions" not in _paths(test_client)
+
+    # The API description loads every router
+    assert "/v1/chat/completions" in test_client.get("/openapi.json").json()["paths"]
+
+
+def test_lazy_startup_defers_ui_construction(injector: MockInjector) -> None:
+    injector.bind_settings(
+        {"server": {"lazy_startup": True}, "ui": {"enabled": True, "path": "/ui"}}
+    )
+    app = create_app(injector.test_injector)
+
+    mounts = [route for route in app.routes if isinstance(route, Mount)]
+    assert [mount.path for mount in mounts] == ["/ui"]
+    assert isinstance(mounts[0].app, LazyUIApp)
+    assert mounts[0].app._app is None
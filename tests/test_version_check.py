@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from internal_assistant.utils import version_check
+
+
+@pytest.fixture
+def package_lookups(monkeypatch) -> list[str]:
+    lookups: list[str] = []
+
+    def get_package_version(package: str) -> str:
+        lookups.append(package)
+        return "unknown"
+
+    monkeypatch.setattr(version_check, "check_system_requirements", lambda: True)
+    monkeypatch.setattr(version_check, "get_package_version", get_package_version)
+    return lookups
+
+
+def test_passing_check_is_skipped_while_lockfile_is_unchanged(
+    tmp_path: Path, package_lookups: list[str]
+) -> None:
+    lockfile = tmp_path / "poetry.lock"
+    lockfile.write_text("lock v1")
+    cache_path = tmp_path / "cache" / "version_check.json"
+
+    version_check.validate_dependency_versions(cache_path, lockfile)
+    scanned = len(package_lookups)
+    assert scanned == len(version_check.REQUIRED_VERSIONS)
+
+    version_check.validate_dependency_versions(cache_path, lockfile)
+    assert len(package_lookups) == scanned
+
+    lockfile.write_text("lock v2")
+    version_check.validate_dependency_versions(cache_path, lockfile)
+    assert len(package_lookups) == 2 * scanned
+
+
+def test_check_runs_every_time_without_cache(
+    tmp_path: Path, package_lookups: list[str]
+) -> None:
+    lockfile = tmp_path / "poetry.lock"
+    lockfile.write_text("lock")
+
+    version_check.validate_dependency_versions(None, lockfile)
+    version_check.validate_dependency_versions(None, lockfile)
+    assert len(package_lookups) == 2 * len(version_check.REQUIRED_VERSIONS)
@@ -0,0 +1,90 @@
+"""Tests for paging and incremental rendering of the document library."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from internal_assistant.components.ingest.document_catalog import DocumentCatalog
+from internal_assistant.ui.components.documents.document_library import (
+    LIBRARY_PAGE_SIZE,
+    DocumentLibraryBuilder,
+)
+from internal_assistant.ui.components.documents.document_utility import (
+    DocumentUtilityBuilder,
+)
+
+THREATS = "🕵️ Threat Intelligence"
+POLICIES = "📋 Policy & Governance"
+
+
+@pytest.fixture
+def catalog() -> DocumentCatalog:
+    catalog = DocumentCatalog()
+    for i in range(40):
+        catalog.add(f"threat-{i}", {"file_name": f"malware_{i:02d}.pdf"}, 12)
+    catalog.add("policy", {"file_name": "password_policy.docx"}, 12)
+    return catalog
+
+
+@pytest.fixture
+def builder(catalog) -> DocumentLibraryBuilder:
+    ingest_service = SimpleNamespace(catalog=catalog)
+    return DocumentLibraryBuilder(
+        ingest_service, None, DocumentUtilityBuilder(MagicMock())
+    )
+
+
+def test_library_pages_follow_cursor_in_display_order(builder):
+    pages = [builder.get_library_page(THREATS)]
+    while pages[-1].next_offset is not None:
+        pages.append(builder.get_library_page(THREATS, pages[-1].next_offset))
+
+    assert [page.offset for page in pages] == [0, 15, 30]
+    assert pages[0].total == 40
+    assert pages[0].html.count("data-filename=") == LIBRARY_PAGE_SIZE
+    assert pages[-1].html.count("data-filename=") == 10
+    # Most recent (reverse sorted) first
+    assert pages[0].html.index("malware_39.pdf") < pages[0].html.index("malware_38.pdf")
+    assert "malware_00.pdf" in pages[-1].html
+
+
+def test_library_html_shows_first_page_per_folder(builder):
+    html = builder.get_document_library_html()
+
+    assert f"{THREATS} (40)" in html
+    assert f"{POLICIES} (1)" in html
+    assert html.count("data-filename=") == LIBRARY_PAGE_SIZE + 1
+    assert "Load more (25 more documents)" in html
+    assert f"data-folder='{THREATS}' data-offset='{LIBRARY_PAGE_SIZE}'" in html
+
+
+def test_refresh_only_renders_changed_folders(builder, catalog):
+    builder.get_document_library_html()
+
+    with patch.object(
+        builder, "_render_file_items", wraps=builder._render_file_items
+    ) as render:
+        unchanged = builder.get_document_library_html()
+        assert render.call_count == 0
+
+        catalog.add("policy-2", {"file_name": "access_policy.pdf"}, 12)
+        html = builder.get_document_library_html()
+
+    assert render.call_count == 1
+    assert render.call_args.args[1] == ["password_policy.docx", "access_policy.pdf"]
+    assert f"{POLICIES} (2)" in html
+    assert html != unchanged
+
+
+def test_removing_last_file_drops_folder(builder, catalog):
+    builder.get_document_library_html()
+    catalog.remove("policy")
+
+    html = builder.get_document_library_html()
+    assert POLICIES not in html
+    assert builder.get_library_page(POLICIES).total == 0
+
+    for i in range(40):
+        catalog.remove(f"threat-{i}")
+    assert "No documents yet" in builder.get_document_library_html()
@@ -0,0 +1,125 @@
+"""Tests for the LLM liveness probes used by the chat facade."""
+
+import threading
+import time
+
+import httpx
+
+from internal_assistant.ui.services.chat_service_facade import ChatServiceFacade
+from internal_assistant.ui.services.llm_probes import (
+    LivenessProbe,
+    OllamaProbe,
+    OpenAILikeProbe,
+    ProbeCache,
+)
+
+
+def _ollama(routes: dict[str, dict]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path not in routes:
+            return httpx.Response(404)
+        return httpx.Response(200, json=routes[request.url.path])
+
+    return httpx.MockTransport(handler)
+
+
+class _CountingProbe(LivenessProbe):
+    def __init__(self, healthy: bool = True, delay: float = 0.0) -> None:
+        self.healthy = healthy
+        self.delay = delay
+        self.calls = 0
+
+    @property
+    def key(self) -> str:
+        return "counting"
+
+    def _check(self) -> tuple[bool, str]:
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.healthy, "counted"
+
+
+class TestOllamaProbe:
+    def test_installed_model_is_healthy_and_reports_loaded(self):
+        transport = _ollama(
+            {
+                "/api/tags": {"models": [{"name": "llama3.1:70b"}]},
+                "/api/ps": {"models": [{"name": "llama3.1:70b"}]},
+            }
+        )
+        result = OllamaProbe(
+            "http://ollama:11434/", "llama3.1:70b", transport=transport
+        ).check()
+
+        assert result.healthy
+        assert result.detail == "model llama3.1:70b loaded"
+
+    def test_missing_model_is_unhealthy(self):
+        transport = _ollama({"/api/tags": {"models": [{"name": "other:latest"}]}})
+
+        result = OllamaProbe("http://ollama", "llama3.1", transport=transport).check()
+
+        assert not result.healthy
+        assert "not installed" in result.detail
+
+    def test_unreachable_server_is_unhealthy(self):
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        probe = OllamaProbe("http://ollama", "m", transport=httpx.MockTransport(refuse))
+
+        assert not probe.check().healthy
+
+
+def test_openai_like_probe_treats_client_errors_as_alive():
+    probe = OpenAILikeProbe(
+        "http://vllm/v1",
+        transport=httpx.MockTransport(lambda request: httpx.Response(401)),
+    )
+    assert probe.check().healthy
+
+    probe.transport = httpx.MockTransport(lambda request: httpx.Response(503))
+    assert not probe.check().healthy
+
+
+class TestProbeCache:
+    def test_concurrent_callers_share_one_probe(self):
+        probe = _CountingProbe(delay=0.1)
+        cache = ProbeCache(ttl=60)
+
+        threads = [threading.Thread(target=cache.get, args=(probe,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert probe.calls == 1
+        assert cache.get(probe).healthy
+
+    def test_expired_result_is_probed_again(self):
+        probe = _CountingProbe()
+        cache = ProbeCache(ttl=0)
+
+        cache.get(probe)
+        cache.get(probe)
+
+        assert probe.calls == 2
+
+
+def test_facade_health_check_uses_probe_not_generation():
+    class _NoGenerationService:
+        def stream_chat(self, *args, **kwargs):
+            raise AssertionError("health check must not generate")
+
+    probe = _CountingProbe(healthy=False)
+    facade = ChatServiceFacade(
+        _NoGenerationService(), probe=probe, probe_cache=ProbeCache(ttl=60)
+    )
+
+    assert facade._basic_health_check() is False
+    assert facade._basic_health_check() is False
+    assert probe.calls == 1
+    assert (
+        facade.get_service_info()["liveness_probe"]["last_result"]["detail"]
+        == "counted"
+    )
@@ -0,0 +1,50 @@
+"""Tests for coalescing streamed tokens into chat frames."""
+
+from llama_index.core.llms import ChatMessage, ChatResponse
+
+from internal_assistant.ui.utils.streaming import StreamFramer
+
+
+def _responses(tokens: list[str]) -> list[ChatResponse]:
+    return [
+        ChatResponse(message=ChatMessage(content=token), delta=token)
+        for token in tokens
+    ]
+
+
+def test_frames_are_cumulative_and_merged_by_token_budget():
+    tokens = [f"t{i} " for i in range(10)]
+    framer = StreamFramer(interval=60, max_tokens=4)
+
+    frames = list(framer.frames(_responses(tokens)))
+
+    # First token alone, then batches of four, then the remainder
+    assert frames == [
+        "".join(tokens[:1]),
+        "".join(tokens[:5]),
+        "".join(tokens[:9]),
+        "".join(tokens),
+    ]
+    assert framer.text == "".join(tokens)
+    assert framer.stats.tokens == 10
+    assert framer.stats.frames == 4
+
+
+def test_stats_report_first_token_and_rate():
+    framer = StreamFramer(interval=0)
+
+    frames = list(framer.frames(["a", "", "b", "c"]))
+
+    assert frames == ["a", "ab", "abc"]
+    stats = framer.stats
+    assert stats.tokens == 3
+    assert stats.first_token_seconds is not None
+    assert stats.first_token_seconds <= stats.total_seconds
+    assert stats.tokens_per_second >= 0
+
+
+def test_empty_stream_yields_nothing():
+    framer = StreamFramer()
+    assert list(framer.frames([])) == []
+    assert framer.text == ""
+    assert framer.stats.first_token_seconds is None
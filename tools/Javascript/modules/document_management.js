@@ -22,6 +22,32 @@ function toggleFolder(folderItem) {
     }
 }
 
+// Fetch the next page of a library folder and insert it before the button
+function loadMoreDocuments(button) {
+    const params = new URLSearchParams({
+        folder: button.getAttribute('data-folder'),
+        offset: button.getAttribute('data-offset')
+    });
+    button.textContent = '⏳ Loading...';
+
+    fetch(new URL('library/page?' + params, window.location.href))
+        .then(response => response.ok ? response.json() : Promise.reject(response.status))
+        .then(page => {
+            button.insertAdjacentHTML('beforebegin', page.html);
+            if (page.next_offset === null) {
+                button.remove();
+            } else {
+                button.setAttribute('data-offset', page.next_offset);
+                button.textContent = `⬇ Load more (${page.total - page.next_offset} more documents)`;
+            }
+            filterDocuments();
+        })
+        .catch(error => {
+            console.error('Failed to load library page:', error);
+            button.textContent = '⚠️ Failed to load documents - click to retry';
+        });
+}
+
 // Toggle filter buttons
 function toggleFilter(filterBtn) {
     const filterType = filterBtn.getAttribute('data-filter');
@@ -345,5 +371,6 @@ function selectDocumentForTools(element, filename, doc_id) {
 
 // Make selection function globally available
 window.selectDocumentForTools = selectDocumentForTools;
+window.loadMoreDocuments = loadMoreDocuments;
 
 console.log('📂 Document selection functionality registered');
\ No newline at end of file